@@ -0,0 +1,195 @@
+"""End-to-end benchmark: N simulated stations against WeatherDuinoCoordinator.
+
+Starts the simulator (simulator.py) in-process, or uses one that is already
+running (``--simulator host:port``, which keeps its CPU out of the numbers),
+creates one coordinator per station plus its sensor entities, and refreshes
+every station back to back (or every ``--interval`` seconds) for
+``--duration`` seconds. Entities are not written to a state machine; instead
+every woken entity renders its value and attributes, which is the part of a
+state write that sensor.py owns.
+
+Reported: polls/sec, p50/p99 refresh latency, failed polls, CPU time per
+poll and per station, and memory per station (traced allocations of
+creating a station and running its first refresh).
+
+    python benchmarks/bench_coordinator.py --stations 32 --duration 20 --latency 0.02 --jitter 0.05
+    python benchmarks/bench_coordinator.py --max-p99 0.05 --min-polls 500   # exit 1 on regression
+
+Needs Home Assistant installed; runs fully offline.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from simulator import Simulator, add_behaviour_arguments, behaviour_from_args
+
+# the coordinator uses relative imports: import it as a package from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from homeassistant.const import CONF_HOST, CONF_PORT  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.weatherduino import sensor  # noqa: E402
+from custom_components.weatherduino.const import (  # noqa: E402
+    CONF_PATH,
+    CONF_SCAN_INTERVAL,
+    DOMAIN,
+)
+from custom_components.weatherduino.coordinator import WeatherDuinoCoordinator  # noqa: E402
+
+
+def _make_hass(config_dir: str) -> HomeAssistant:
+    try:
+        return HomeAssistant(config_dir)
+    except TypeError:  # Home Assistant before 2024.2
+        hass = HomeAssistant()  # type: ignore[call-arg]
+        hass.config.config_dir = config_dir
+        return hass
+
+
+class Station:
+    """One coordinator with its entities, and the latencies of its polls."""
+
+    def __init__(self, hass: HomeAssistant, index: int, host: str, port: int, path: str, options: dict) -> None:
+        self.entry = SimpleNamespace(
+            entry_id=f"bench{index}",
+            data={CONF_HOST: host, CONF_PORT: port, CONF_PATH: path, CONF_SCAN_INTERVAL: 30},
+            options=options,
+            async_on_unload=lambda remove: None,
+        )
+        self.coordinator = WeatherDuinoCoordinator(hass, self.entry)  # type: ignore[arg-type]
+        self.entities: list[sensor.WeatherDuinoSensor] = []
+        self.latencies: list[float] = []
+        self.failures = 0
+        self.renders = 0
+
+    async def async_setup(self, hass: HomeAssistant) -> None:
+        await self.coordinator.async_refresh()
+        hass.data[DOMAIN][self.entry.entry_id] = self.coordinator
+        await sensor.async_setup_entry(hass, self.entry, self.entities.extend)  # type: ignore[arg-type]
+        for entity in self.entities:
+            self.coordinator.async_add_listener(
+                lambda entity=entity: self._render(entity), entity.coordinator_context
+            )
+
+    def _render(self, entity: sensor.WeatherDuinoSensor) -> None:
+        entity.native_value  # noqa: B018
+        entity.extra_state_attributes  # noqa: B018
+        self.renders += 1
+
+    async def async_run(self, until: float, interval: float) -> None:
+        coordinator = self.coordinator
+        while time.monotonic() < until:
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            self.latencies.append(time.perf_counter() - start)
+            if not coordinator.last_update_success:
+                self.failures += 1
+            if interval:
+                await asyncio.sleep(interval)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+async def _run(args: argparse.Namespace) -> int:
+    simulator: Simulator | None = None
+    if args.simulator:
+        host, _, port = args.simulator.rpartition(":")
+        ports = [int(port)] * args.stations
+    else:
+        # one port per station: each one is a device with its own connection
+        simulator = Simulator.build(args.stations, behaviour_from_args(args), seed=args.seed)
+        await simulator.start(separate_ports=True)
+        host, ports = "127.0.0.1", simulator.ports
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = _make_hass(config_dir)
+        hass.data.setdefault(DOMAIN, {})
+        options = {"history_hours": args.history_hours} if args.history_hours else {}
+
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        stations = [
+            Station(hass, i, host, ports[i], f"/s{i}/json", options) for i in range(args.stations)
+        ]
+        await asyncio.gather(*(station.async_setup(hass) for station in stations))
+        memory = (tracemalloc.get_traced_memory()[0] - baseline) / args.stations
+        tracemalloc.stop()
+
+        cpu = time.process_time()
+        wall = time.monotonic()
+        until = wall + args.duration
+        await asyncio.gather(*(station.async_run(until, args.interval) for station in stations))
+        wall = time.monotonic() - wall
+        cpu = time.process_time() - cpu
+
+        for station in stations:
+            await station.coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    if simulator is not None:
+        await simulator.stop()
+
+    latencies = [lat for station in stations for lat in station.latencies]
+    polls = len(latencies)
+    failures = sum(station.failures for station in stations)
+    p50 = _percentile(latencies, 50)
+    p99 = _percentile(latencies, 99)
+    rate = polls / wall if wall else 0.0
+
+    print(f"stations          {args.stations}")
+    print(f"entities          {sum(len(s.entities) for s in stations)}")
+    print(f"polls             {polls} ({failures} failed)")
+    print(f"polls/sec         {rate:.1f}")
+    print(f"latency p50       {p50 * 1e3:.2f} ms")
+    print(f"latency p99       {p99 * 1e3:.2f} ms")
+    print(f"latency mean      {statistics.fmean(latencies) * 1e3 if latencies else float('nan'):.2f} ms")
+    print(f"entity renders    {sum(s.renders for s in stations)}")
+    print(f"cpu per poll      {cpu / polls * 1e6 if polls else float('nan'):.0f} µs")
+    print(f"cpu per station   {cpu / wall / args.stations * 100 if wall else float('nan'):.3f} % of a core")
+    print(f"memory/station    {memory / 1024:.1f} KiB")
+    if simulator is not None:
+        print("(cpu includes the in-process simulator; use --simulator to exclude it)")
+
+    failed = []
+    if args.max_p99 is not None and p99 > args.max_p99:
+        failed.append(f"p99 {p99:.4f}s > {args.max_p99}s")
+    if args.min_polls is not None and rate < args.min_polls:
+        failed.append(f"polls/sec {rate:.1f} < {args.min_polls}")
+    if args.max_memory is not None and memory / 1024 > args.max_memory:
+        failed.append(f"memory/station {memory / 1024:.1f} KiB > {args.max_memory} KiB")
+    for reason in failed:
+        print(f"REGRESSION: {reason}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--interval", type=float, default=0.0, help="pause between polls of one station (s)")
+    parser.add_argument("--history-hours", type=int, default=0, help="enable the sample history option")
+    parser.add_argument("--simulator", metavar="HOST:PORT", help="use a running simulator.py")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-p99", type=float, help="fail if p99 latency exceeds this (s)")
+    parser.add_argument("--min-polls", type=float, help="fail if polls/sec drops below this")
+    parser.add_argument("--max-memory", type=float, help="fail if memory/station exceeds this (KiB)")
+    add_behaviour_arguments(parser)
+    sys.exit(asyncio.run(_run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
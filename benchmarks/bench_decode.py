@@ -0,0 +1,83 @@
+"""Compare per-entity value lambdas with the compiled DecodePlan.
+
+The legacy path is reproduced here as it was in sensor.py: every entity
+re-parses its raw value from the payload on every ``native_value`` read.
+The plan path decodes the whole payload once and entities do dict lookups.
+
+    python benchmarks/bench_decode.py [--reads N] [--number N]
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import timeit
+
+from payloads import PAYLOADS
+
+from decode import (  # noqa: E402  (path set up by payloads)
+    DecodePlan,
+    _to_number,
+    aq_avgmode_value,
+    div10,
+    epoch,
+    raw_int,
+)
+
+INT_KEYS = {"TID", "Wdir", "SR", "UV", "C02", "AQI", "CO2"}
+
+
+def _value_for(key: str):
+    if key == "ts":
+        return epoch(key)
+    if key == "AVG_M":
+        return aq_avgmode_value()
+    if key in INT_KEYS:
+        return raw_int(key)
+    return div10(key)
+
+
+def _legacy_fn(key: str):
+    if key == "ts":
+        return lambda d: datetime.fromtimestamp(_to_number(d.get(key)), tz=timezone.utc) if _to_number(d.get(key)) is not None else None
+    if key in INT_KEYS or key == "AVG_M":
+        def _fn(d):
+            n = _to_number(d.get(key))
+            if n is None:
+                return d.get(key)
+            return int(round(n))
+        return _fn
+    return lambda d: (_to_number(d.get(key)) / 10) if _to_number(d.get(key)) is not None else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reads", type=int, default=2, help="native_value reads per entity and poll")
+    parser.add_argument("--number", type=int, default=20000, help="simulated polls")
+    args = parser.parse_args()
+
+    print(f"{'device':<16}{'entities':>9}{'legacy µs':>12}{'plan µs':>10}{'speedup':>9}")
+    for dtype, payload in PAYLOADS.items():
+        keys = [k for k in payload if k != "ID"]
+        legacy = [_legacy_fn(k) for k in keys]
+        plan = DecodePlan(_value_for(k) for k in keys)
+        reads = range(args.reads)
+
+        def run_legacy() -> None:
+            for fn in legacy:
+                for _ in reads:
+                    fn(payload)
+
+        def run_plan() -> None:
+            values = plan.decode(payload)
+            get = values.get
+            for key in keys:
+                for _ in reads:
+                    get(key)
+
+        t_legacy = min(timeit.repeat(run_legacy, number=args.number, repeat=3)) / args.number * 1e6
+        t_plan = min(timeit.repeat(run_plan, number=args.number, repeat=3)) / args.number * 1e6
+        print(f"{dtype:<16}{len(keys):>9}{t_legacy:>12.2f}{t_plan:>10.2f}{t_legacy / t_plan:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
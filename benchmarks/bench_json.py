@@ -0,0 +1,74 @@
+"""Compare the old JSON path with payload.parse_payload.
+
+The old path is what ``resp.json(content_type=None)`` did: decode the body
+to text and run ``json.loads``. Every sample payload is also run in a few
+malformed variants seen on older firmware; the old path fails on those.
+Memory is the traced peak over 200 decodes.
+
+    python benchmarks/bench_json.py [--number N]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+import tracemalloc
+
+from payloads import PAYLOADS
+
+from payload import parse_payload  # noqa: E402  (path set up by payloads)
+
+
+def _variants(payload: dict) -> dict[str, bytes]:
+    valid = json.dumps(payload, separators=(",", ":"))
+    first = next(k for k in payload if k != "ID")
+    return {
+        "valid": valid.encode(),
+        "trailing comma": (valid[:-1] + ",}").encode(),
+        "nan": valid.replace(f'"{first}":{json.dumps(payload[first])}', f'"{first}":nan').encode(),
+        "decimal comma": valid.replace(f'"{first}":{json.dumps(payload[first])}', f'"{first}":21,5').encode(),
+    }
+
+
+def _old(body: bytes) -> dict:
+    return json.loads(body.decode("utf-8"))
+
+
+def _new(body: bytes) -> dict:
+    return parse_payload(body)[0]
+
+
+def _peak_memory(fn, body: bytes, rounds: int = 200) -> int:
+    tracemalloc.start()
+    for _ in range(rounds):
+        fn(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _measure(fn, body: bytes, number: int) -> str:
+    try:
+        fn(body)
+    except ValueError:
+        return f"{'fails':>10}{'':>10}"
+    us = min(timeit.repeat(lambda: fn(body), number=number, repeat=3)) / number * 1e6
+    peak = _peak_memory(fn, body)
+    return f"{us:>8.2f}µs{peak:>9}B"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="iterations per measurement")
+    args = parser.parse_args()
+
+    print(f"{'device':<16}{'variant':<16}{'old':>20}{'new':>20}")
+    for dtype, payload in PAYLOADS.items():
+        for variant, body in _variants(payload).items():
+            old = _measure(_old, body, args.number)
+            new = _measure(_new, body, args.number)
+            print(f"{dtype:<16}{variant:<16}{old:>20}{new:>20}")
+
+
+if __name__ == "__main__":
+    main()
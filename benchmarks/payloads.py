@@ -0,0 +1,95 @@
+"""Sample WeatherDuino payloads used by the benchmarks.
+
+The AQM2, AQM3 and WeatherDisplay samples are the ones documented in the
+README; the 4Pro sample carries the full receiver key set.
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+# The benchmarks import the Home Assistant free modules (decode.py, ...)
+# directly from the integration folder so they run without a HA install.
+PACKAGE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "custom_components",
+    "weatherduino",
+)
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+PAYLOAD_4PRO = {
+    "ID": "WD-4Pro-RX",
+    "TID": 160,
+    "ts": 1770066996,
+    "Tin": 215,
+    "Hin": 412,
+    "Tout": -36,
+    "Hout": 872,
+    "P": 10132,
+    "Wsp": 34,
+    "Wgs": 71,
+    "Wdir": 247,
+    "Rtd": 12,
+    "Rfr": 0,
+    "SR": 112,
+    "UV": 1,
+    "C02": 415,
+    "PM25": 81,
+    "PM100": 122,
+    "AQI": 34,
+    "ES1T": 198,
+    "ES1H": 455,
+    "ES2T": 187,
+    "ES2H": 501,
+    "ES3T": "20,4",
+    "ES3H": "48,0",
+    "ES4T": 176,
+    "ES4H": 533,
+    "So1T": 82,
+    "So1M": 315,
+    "So2T": 79,
+    "So2M": 298,
+}
+
+PAYLOAD_WEATHERDISPLAY = {"ID": "WD-WeatherDisplay-4Pro", "TID": 7, "T": 143, "H": 775}
+
+PAYLOAD_AQM2 = {
+    "ID": "AQM2out-pWS_Sun_Dancer",
+    "TID": 10,
+    "T": -36,
+    "H": 510,
+    "PM25": 408,
+    "PM100": 507,
+    "AVG_M": 2,
+    "PM25AQI": 630,
+    "PM100AQI": 380,
+    "CO2": 410,
+}
+
+PAYLOAD_AQM3 = {
+    "ID": "AQM3in-pWS_Sun_Dancer",
+    "TID": 11,
+    "ts": 1770066996,
+    "T": 215,
+    "H": 377,
+    "P": 9942,
+    "PM25_last": 308,
+    "PM100_last": 408,
+    "PM25_1H": 351,
+    "PM100_1H": 455,
+    "PM25_3H": 392,
+    "PM100_3H": 498,
+    "PM25_12H": 402,
+    "PM100_12H": 512,
+    "PM25_24H": 388,
+    "PM100_24H": 497,
+    "CO2": 404,
+}
+
+PAYLOADS = {
+    "4pro": PAYLOAD_4PRO,
+    "weatherdisplay": PAYLOAD_WEATHERDISPLAY,
+    "aqm2": PAYLOAD_AQM2,
+    "aqm3": PAYLOAD_AQM3,
+}
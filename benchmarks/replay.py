@@ -0,0 +1,191 @@
+"""Replay a payload capture through WeatherDuinoCoordinator and the sensor platform.
+
+Captures are written by the "Capture payloads" option to
+``<config>/weatherduino/capture/<host>_<port>.jsonl`` (plus rotated
+``.N.gz`` backups, which are replayed first). The station's connection is
+replaced by one that answers from the capture: new bodies, unchanged
+polls, failed polls and push uploads (served as a poll of the mapped
+payload) come back in the captured order, so
+decoding, detection, new keys and entity updates behave as they did live.
+Entities render their value and attributes like in bench_coordinator.py.
+
+    python benchmarks/replay.py capture/192_168_1_240_80.jsonl              # as fast as possible
+    python benchmarks/replay.py capture/192_168_1_240_80.jsonl --speed 60   # 60x real time
+    python benchmarks/replay.py capture.jsonl --options '{"history_hours": 24}' --show-values
+
+The coordinator keeps using the wall clock, so time windows (10 min wind,
+pressure tendency, rain hour, statistics, NowCast) are compressed by the
+speed-up; payload values and decoding are exactly what the device sent.
+The circuit breaker is disabled so captured failures do not hold the
+replay back.
+
+Needs Home Assistant installed; runs fully offline.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from typing import Mapping
+
+from aiohttp import ClientError
+
+# also puts the repo root on sys.path for the package imports below
+from bench_coordinator import Station, _make_hass, _percentile
+
+from custom_components.weatherduino.capture import CaptureRecord, capture_files, read_capture
+from custom_components.weatherduino.connection import DeviceResponse
+from custom_components.weatherduino.const import DOMAIN
+
+
+class ReplayConnection:
+    """Stands in for a ``DeviceConnection``, answering from a capture."""
+
+    def __init__(self, records: list[CaptureRecord], path: str) -> None:
+        self.host = "replay"
+        self.port = 80
+        self.base_url = "http://replay"
+        self.users = 1
+        self.path = path
+        self._records = records
+        self._next = 0
+        # last body per path, for "same" records and additional paths
+        self._bodies: dict[str | None, bytes] = {}
+        self.served = 0
+
+    def _is_main(self, record: CaptureRecord) -> bool:
+        return record.push or record.error is not None or record.path in (None, self.path)
+
+    def _absorb(self) -> None:
+        """Keep the additional path bodies up to the next main path record."""
+        # the coordinator fetches them next to the main path and they are
+        # captured before its record
+        while self._next < len(self._records) and not self._is_main(self._records[self._next]):
+            record = self._records[self._next]
+            if record.body is not None:
+                self._bodies[record.path] = record.body
+            self._next += 1
+
+    def _advance(self) -> CaptureRecord | None:
+        self._absorb()
+        if self._next == len(self._records):
+            return None
+        self._next += 1
+        return self._records[self._next - 1]
+
+    @property
+    def exhausted(self) -> bool:
+        return all(not self._is_main(r) for r in self._records[self._next :])
+
+    def next_time(self) -> float | None:
+        for record in self._records[self._next :]:
+            if self._is_main(record):
+                return record.time
+        return None
+
+    async def async_get(self, path: str, headers: Mapping[str, str] | None = None) -> DeviceResponse:
+        if path != self.path:
+            # captured before the main record of their cycle: already taken in
+            body = self._bodies.get(path)
+            if body is None:
+                raise ClientError(f"{path} not in the capture yet")
+            return DeviceResponse(200, body)
+        record = self._advance()
+        if record is None:
+            raise ClientError("end of capture")
+        self.served += 1
+        if record.error is not None:
+            raise ClientError(record.error)
+        if record.body is not None:
+            self._bodies[self.path] = record.body
+        body = self._bodies.get(self.path)
+        if body is None:
+            raise ClientError("capture starts with an unchanged poll")
+        return DeviceResponse(200, body)
+
+    async def async_probe(self) -> None:
+        return None
+
+    async def async_close(self) -> None:
+        return None
+
+    def as_dict(self) -> dict[str, object]:
+        return {"replayed": self.served, "records": len(self._records)}
+
+
+async def _run(args: argparse.Namespace) -> int:
+    files = capture_files(args.capture)
+    if not files:
+        print(f"no capture at {args.capture}", file=sys.stderr)
+        return 1
+    records = list(read_capture(files))
+    path = next((r.path for r in records if r.path is not None and not r.push), "/json")
+    replay = ReplayConnection(records, path)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = _make_hass(config_dir)
+        hass.data.setdefault(DOMAIN, {})
+        station = Station(hass, 0, replay.host, replay.port, path, json.loads(args.options))
+        coordinator = station.coordinator
+        device_connection, coordinator.connection = coordinator.connection, replay  # type: ignore[assignment]
+        # captured failures must not open the breaker and stop the replay
+        coordinator.breaker.threshold = float("inf")
+
+        previous = replay.next_time()
+        cpu = time.process_time()
+        wall = time.monotonic()
+        await station.async_setup(hass)
+        while not replay.exhausted:
+            due = replay.next_time()
+            if args.speed and previous is not None and due is not None and due > previous:
+                await asyncio.sleep((due - previous) / args.speed)
+            previous = due
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            station.latencies.append(time.perf_counter() - start)
+            if not coordinator.last_update_success:
+                station.failures += 1
+        wall = time.monotonic() - wall
+        cpu = time.process_time() - cpu
+
+        if args.show_values:
+            for key, value in sorted(coordinator.values.items()):
+                print(f"{key:<28} {value}")
+            print()
+
+        coordinator.connection = device_connection
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+    latencies = station.latencies
+    polls = len(latencies)
+    span = records[-1].time - records[0].time if records else 0.0
+    print(f"capture           {len(files)} files, {len(records)} records, {span / 3600:.1f} h")
+    print(f"device type       {coordinator.device_type} ({len(coordinator.payload_keys)} keys)")
+    print(f"entities          {len(station.entities)}")
+    print(f"polls             {polls} ({station.failures} failed)")
+    print(f"unchanged         {coordinator.payload_unchanged}")
+    print(f"polls/sec         {polls / wall if wall else float('nan'):.1f}")
+    print(f"latency p50       {_percentile(latencies, 50) * 1e3:.3f} ms")
+    print(f"latency p99       {_percentile(latencies, 99) * 1e3:.3f} ms")
+    print(f"latency mean      {statistics.fmean(latencies) * 1e3 if latencies else float('nan'):.3f} ms")
+    print(f"entity renders    {station.renders} ({station.renders / wall if wall else float('nan'):.0f}/s)")
+    print(f"cpu per poll      {cpu / polls * 1e6 if polls else float('nan'):.0f} µs")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", help="capture file (.jsonl); its .N.gz backups are replayed first")
+    parser.add_argument("--speed", type=float, default=0.0, help="times real time; 0 = as fast as possible")
+    parser.add_argument("--options", default="{}", help="entry options as JSON")
+    parser.add_argument("--show-values", action="store_true", help="print the published values at the end")
+    sys.exit(asyncio.run(_run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Local stand-in for WeatherDuino devices.
+
+One aiohttp server serves any number of simulated stations, station ``i``
+at ``/s<i>/json``. Each station starts from the sample payload of its
+device type (see payloads.py) and random-walks its values, with optional
+latency, jitter, failures and malformed bodies. ``--serial`` makes every
+station answer one request at a time, like the ESP web servers do.
+
+    python benchmarks/simulator.py --stations 8 --port 8080
+    # then add a WeatherDuino entry with host 127.0.0.1, port 8080, path /s0/json
+
+Runs fully offline; only aiohttp is needed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+import json
+import random
+import time
+from typing import Any
+
+from aiohttp import web
+
+from payloads import PAYLOADS
+
+# keys that are identifiers, not measurements
+_FIXED_KEYS = {"ID", "TID", "AVG_M"}
+
+
+@dataclass
+class StationBehaviour:
+    latency: float = 0.0
+    jitter: float = 0.0
+    failure_rate: float = 0.0
+    malformed_rate: float = 0.0
+    # seconds between new samples (values change and ts moves on)
+    update_every: float = 10.0
+    serial: bool = False
+
+
+@dataclass
+class SimulatedStation:
+    device_type: str
+    behaviour: StationBehaviour
+    rng: random.Random
+    payload: dict[str, Any] = field(default_factory=dict)
+    last_sample: float = 0.0
+    requests: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def __post_init__(self) -> None:
+        self.payload = dict(PAYLOADS[self.device_type])
+        self.payload["ID"] = f"{self.payload['ID']}-{self.rng.randrange(1 << 16):04x}"
+
+    def _sample(self, now: float) -> None:
+        if now - self.last_sample < self.behaviour.update_every:
+            return
+        self.last_sample = now
+        for key, value in self.payload.items():
+            if key in _FIXED_KEYS or not isinstance(value, int):
+                continue
+            if key == "ts":
+                self.payload[key] = int(now)
+            elif key == "Wdir":
+                self.payload[key] = (value + self.rng.randint(-20, 20)) % 360
+            else:
+                step = self.rng.randint(-3, 3)
+                # counters and humidity stay non-negative
+                self.payload[key] = max(0, value + step) if value >= 0 else value + step
+
+    def body(self) -> bytes:
+        self._sample(time.time())
+        text = json.dumps(self.payload, separators=(",", ":"))
+        if self.rng.random() < self.behaviour.malformed_rate:
+            text = self._malform(text)
+        return text.encode()
+
+    def _malform(self, text: str) -> str:
+        """One of the firmware quirks payload.py has to cope with, or a cut-off body."""
+        key = self.rng.choice([k for k in self.payload if k not in _FIXED_KEYS])
+        value = json.dumps(self.payload[key])
+        pair = f'"{key}":{value}'
+        return self.rng.choice(
+            (
+                text[:-1] + ",}",
+                text.replace(pair, f'"{key}":nan'),
+                text.replace(pair, f'"{key}":'),
+                text[: len(text) // 2],
+            )
+        )
+
+
+class Simulator:
+    """Serves a set of simulated stations from one aiohttp app."""
+
+    def __init__(self, stations: list[SimulatedStation]) -> None:
+        self.stations = stations
+        self.app = web.Application()
+        self.app.router.add_get("/s{index}/json", self._handle)
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+        # port of every station; all the same unless started with separate ports
+        self.ports: list[int] = []
+
+    @classmethod
+    def build(
+        cls,
+        count: int,
+        behaviour: StationBehaviour,
+        device_types: list[str] | None = None,
+        seed: int = 1,
+    ) -> Simulator:
+        rng = random.Random(seed)
+        types = device_types or list(PAYLOADS)
+        return cls(
+            [
+                SimulatedStation(types[i % len(types)], behaviour, random.Random(rng.random()))
+                for i in range(count)
+            ]
+        )
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        try:
+            station = self.stations[int(request.match_info["index"])]
+        except (ValueError, IndexError):
+            raise web.HTTPNotFound() from None
+        if station.behaviour.serial:
+            async with station.lock:
+                return await self._respond(station)
+        return await self._respond(station)
+
+    async def _respond(self, station: SimulatedStation) -> web.StreamResponse:
+        station.requests += 1
+        behaviour = station.behaviour
+        delay = behaviour.latency + station.rng.uniform(0, behaviour.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if station.rng.random() < behaviour.failure_rate:
+            raise web.HTTPInternalServerError()
+        return web.Response(body=station.body(), content_type="application/json")
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, separate_ports: bool = False) -> None:
+        """Listen on ``port``, or on one ephemeral port per station."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        for _ in range(len(self.stations) if separate_ports else 1):
+            site = web.TCPSite(self._runner, host, 0 if separate_ports else port)
+            await site.start()
+            bound = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+            self.ports.append(bound)
+        self.port = self.ports[0]
+        if not separate_ports:
+            self.ports *= len(self.stations)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def path(self, index: int) -> str:
+        return f"/s{index}/json"
+
+
+def add_behaviour_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency", type=float, default=0.0, help="base response latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency up to this (s)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of HTTP 500 answers")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="share of malformed bodies")
+    parser.add_argument("--update-every", type=float, default=10.0, help="seconds between new samples")
+    parser.add_argument("--serial", action="store_true", help="one request at a time per station")
+
+
+def behaviour_from_args(args: argparse.Namespace) -> StationBehaviour:
+    return StationBehaviour(
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        malformed_rate=args.malformed_rate,
+        update_every=args.update_every,
+        serial=args.serial,
+    )
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    simulator = Simulator.build(args.stations, behaviour_from_args(args), seed=args.seed)
+    await simulator.start(args.host, args.port, args.separate_ports)
+    for index, station in enumerate(simulator.stations):
+        print(f"{station.device_type:<16} http://{args.host}:{simulator.ports[index]}{simulator.path(index)}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await simulator.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=4)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--separate-ports", action="store_true", help="one port per station")
+    add_behaviour_arguments(parser)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Fake station uploader for push mode.
+
+Sends WU style (``GET`` query string) or Ecowitt style (``POST`` form)
+uploads with slowly changing values to a push URL, and reports how long
+Home Assistant takes to answer them.
+
+    python benchmarks/uploader.py http://127.0.0.1:8123/api/weatherduino/push/garden --every 5
+    python benchmarks/uploader.py URL --protocol ecowitt --count 1000 --every 0   # flood
+
+``--dry-run`` only prints the fields and the payload upload.py maps them
+to, without any network access.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+import random
+import statistics
+import sys
+import time
+
+from payloads import PACKAGE_DIR
+
+# payloads already did this on import; spelled out as this script needs nothing else from it
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+from upload import map_upload  # noqa: E402
+
+
+class FakeStation:
+    """Random-walk readings in the units the upload protocols use."""
+
+    def __init__(self, station_id: str, protocol: str, rng: random.Random) -> None:
+        self.station_id = station_id
+        self.protocol = protocol
+        self.rng = rng
+        self.state = {
+            "temp": 55.0, "humidity": 70.0, "baro": 29.92, "wind": 4.0,
+            "winddir": 180.0, "rain": 0.0, "solar": 250.0, "uv": 2.0,
+            "tempin": 70.0, "humidityin": 40.0,
+        }
+
+    def _step(self) -> None:
+        state, rng = self.state, self.rng
+        state["temp"] += rng.uniform(-0.3, 0.3)
+        state["humidity"] = min(100.0, max(5.0, state["humidity"] + rng.uniform(-1, 1)))
+        state["baro"] += rng.uniform(-0.005, 0.005)
+        state["wind"] = max(0.0, state["wind"] + rng.uniform(-1, 1))
+        state["winddir"] = (state["winddir"] + rng.uniform(-15, 15)) % 360
+        state["rain"] += max(0.0, rng.uniform(-0.02, 0.01))
+        state["solar"] = max(0.0, state["solar"] + rng.uniform(-20, 20))
+
+    def fields(self) -> dict[str, str]:
+        self._step()
+        s = self.state
+        now = datetime.now(timezone.utc)
+        if self.protocol == "wu":
+            return {
+                "ID": self.station_id, "PASSWORD": "secret", "action": "updateraw",
+                "dateutc": now.strftime("%Y-%m-%d %H:%M:%S"),
+                "tempf": f"{s['temp']:.1f}", "humidity": f"{s['humidity']:.0f}",
+                "baromin": f"{s['baro']:.3f}", "windspeedmph": f"{s['wind']:.1f}",
+                "windgustmph": f"{s['wind'] * 1.5:.1f}", "winddir": f"{s['winddir']:.0f}",
+                "dailyrainin": f"{s['rain']:.2f}", "rainin": "0.00",
+                "solarradiation": f"{s['solar']:.0f}", "UV": f"{s['uv']:.0f}",
+                "indoortempf": f"{s['tempin']:.1f}", "indoorhumidity": f"{s['humidityin']:.0f}",
+            }
+        return {
+            "PASSKEY": "0123456789ABCDEF", "stationtype": "WeatherDuino", "model": self.station_id,
+            "dateutc": now.strftime("%Y-%m-%d+%H:%M:%S"),
+            "tempf": f"{s['temp']:.1f}", "humidity": f"{s['humidity']:.0f}",
+            "baromrelin": f"{s['baro']:.3f}", "windspeedmph": f"{s['wind']:.1f}",
+            "windgustmph": f"{s['wind'] * 1.5:.1f}", "winddir": f"{s['winddir']:.0f}",
+            "dailyrainin": f"{s['rain']:.2f}", "rainratein": "0.00",
+            "solarradiation": f"{s['solar']:.0f}", "uv": f"{s['uv']:.0f}",
+            "tempinf": f"{s['tempin']:.1f}", "humidityin": f"{s['humidityin']:.0f}",
+        }
+
+
+async def _upload(args: argparse.Namespace, station: FakeStation) -> None:
+    from aiohttp import ClientSession, ClientTimeout
+
+    latencies: list[float] = []
+    errors = 0
+    async with ClientSession(timeout=ClientTimeout(total=10)) as session:
+        for _ in range(args.count):
+            fields = station.fields()
+            start = time.perf_counter()
+            try:
+                if args.protocol == "wu":
+                    request = session.get(args.url, params=fields)
+                else:
+                    request = session.post(args.url, data=fields)
+                async with request as resp:
+                    await resp.read()
+                    if resp.status != 200:
+                        errors += 1
+            except Exception:  # noqa: BLE001 - keep uploading, count it
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+            if args.every:
+                await asyncio.sleep(args.every)
+
+    ordered = sorted(latencies)
+    print(f"uploads      {len(latencies)} ({errors} failed)")
+    print(f"latency p50  {ordered[len(ordered) // 2] * 1e3:.2f} ms")
+    print(f"latency p99  {ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e3:.2f} ms")
+    print(f"latency mean {statistics.fmean(latencies) * 1e3:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url", nargs="?", help="push URL of the entry")
+    parser.add_argument("--protocol", choices=("wu", "ecowitt"), default="wu")
+    parser.add_argument("--station-id", default="WD-4Pro-RX")
+    parser.add_argument("--count", type=int, default=60)
+    parser.add_argument("--every", type=float, default=5.0, help="seconds between uploads")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    station = FakeStation(args.station_id, args.protocol, random.Random(args.seed))
+    if args.dry_run or not args.url:
+        fields = station.fields()
+        print(fields)
+        print(map_upload(fields))
+        return
+    asyncio.run(_upload(args, station))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,93 @@
 from __future__ import annotations
 
+import os
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError, ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS
+from .const import DOMAIN, MIN_PUSH_ID_LENGTH, PLATFORMS, STORAGE_VERSION
 from .coordinator import WeatherDuinoCoordinator
+from .push import async_get_push_registry
+from .services import async_setup_services
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = WeatherDuinoCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    if coordinator.push_id and len(coordinator.push_id) < MIN_PUSH_ID_LENGTH:
+        # set before IDs had a minimum length; too easy to guess for an open endpoint
+        await coordinator.async_shutdown()
+        raise ConfigEntryError(
+            f"The push ID needs at least {MIN_PUSH_ID_LENGTH} characters, set a longer one in the options"
+        )
+    # with a cached device the entities are created right away and the first
+    # poll runs in the background, so a slow or dead station does not hold up setup
+    cached = await coordinator.async_load_device_cache()
+    if not cached and not coordinator.push_id:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except ConfigEntryNotReady:
+            # release the device connection, setup is retried with a new coordinator
+            await coordinator.async_shutdown()
+            raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if coordinator.push_id:
+        # push mode: entities are added as the uploads bring their keys
+        entry.async_on_unload(async_get_push_registry(hass).async_register(coordinator))
+    elif cached:
+        entry.async_create_background_task(
+            hass, _async_first_poll(entry, coordinator), f"{coordinator.name} first poll"
+        )
+    else:
+        entry.async_on_unload(coordinator.scheduler.async_register(coordinator))
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
 
+async def _async_first_poll(entry: ConfigEntry, coordinator: WeatherDuinoCoordinator) -> None:
+    """Poll once right away, then hand the station to the scheduler."""
+    await coordinator.async_refresh()
+    entry.async_on_unload(coordinator.scheduler.async_register(coordinator))
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    # options (interval, deadbands, ...) are read when the coordinator is built
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator: WeatherDuinoCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the files kept for an entry."""
+    for name in ("rain", "device"):
+        await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.{name}").async_remove()
+
+    ring = hass.config.path(DOMAIN, f"{entry.entry_id}.ring")
+    await hass.async_add_executor_job(_remove_file, ring)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
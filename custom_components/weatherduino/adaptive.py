@@ -0,0 +1,103 @@
+"""Adaptive poll timing from the device's own ``ts`` sample timestamp.
+
+AQM3 and 4Pro payloads carry the epoch of the sample they report. From
+successive ``ts`` values the tracker learns how often the device produces a
+new sample and when the next one is due, so the coordinator can poll right
+after it instead of at a fixed interval. When a poll still returns the old
+sample, the tracker retries once shortly after (the sample may just be a
+little late), then waits one cadence and doubles from there up to the
+maximum interval, so a stalled device is polled less often than a fixed
+interval would.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+import math
+
+# seconds to wait after the expected sample before polling
+ADAPTIVE_GUARD = 1.0
+ADAPTIVE_MIN_INTERVAL = 5.0
+ADAPTIVE_MAX_INTERVAL = 600.0
+
+# weight of a new cadence measurement in the running average
+_ALPHA = 0.25
+# how fast the clock offset estimate may drift upwards per sample (seconds)
+_OFFSET_RELAX = 0.5
+
+
+class CadenceTracker:
+    """Learns a device's sample cadence and predicts the next poll time."""
+
+    def __init__(
+        self,
+        fallback: float,
+        min_interval: float = ADAPTIVE_MIN_INTERVAL,
+        max_interval: float = ADAPTIVE_MAX_INTERVAL,
+        guard: float = ADAPTIVE_GUARD,
+    ) -> None:
+        self.fallback = fallback
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.guard = guard
+
+        self.cadence: float | None = None
+        self.repeats = 0
+        self._last_ts: float | None = None
+        # smallest observed (wall clock - ts): device clock offset plus the
+        # shortest delay between sampling and our poll
+        self._offset: float | None = None
+
+    def observe(self, ts: float, now: float) -> bool:
+        """Feed the ``ts`` of a poll made at wall time ``now``.
+
+        Returns True if ``ts`` is a new sample.
+        """
+        last = self._last_ts
+        if last is not None and ts == last:
+            self.repeats += 1
+            return False
+
+        if last is not None and ts > last:
+            delta = ts - last
+            if self.cadence is not None and delta > 1.5 * self.cadence:
+                # we missed samples in between, count them
+                delta /= round(delta / self.cadence)
+            if self.cadence is None:
+                self.cadence = delta
+            else:
+                self.cadence += _ALPHA * (delta - self.cadence)
+        elif last is not None:
+            # device clock went backwards (reboot, time sync): start over
+            self.cadence = None
+            self._offset = None
+
+        offset = now - ts
+        if self._offset is None:
+            self._offset = offset
+        else:
+            self._offset = min(offset, self._offset + _OFFSET_RELAX)
+
+        self._last_ts = ts
+        self.repeats = 0
+        return True
+
+    def next_delay(self, now: float) -> float:
+        """Seconds from wall time ``now`` until the next poll should start."""
+        if self.cadence is None or self._last_ts is None or self._offset is None:
+            return self.fallback
+
+        cadence = max(self.cadence, self.min_interval)
+        if self.repeats == 1:
+            # the expected sample is late: one short retry
+            delay = min(self.guard * 2, cadence)
+        elif self.repeats:
+            # still stale: back off from the cadence
+            delay = cadence * 2 ** min(self.repeats - 2, 16)
+        else:
+            expected = self._last_ts + cadence + self._offset + self.guard
+            if expected < now:
+                expected += math.ceil((now - expected) / cadence) * cadence
+            delay = expected - now
+
+        return min(max(delay, self.min_interval), self.max_interval)
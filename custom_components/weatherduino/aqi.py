@@ -0,0 +1,195 @@
+"""Air quality indices computed from raw particulate samples (AQM2 / AQM3).
+
+Both device types report PM2.5 and PM10 in µg/m³, but pre-averaged and
+indexed differently, so the integration computes one scale for both:
+
+- US EPA NowCast: weighted average of the last 12 hourly means, the weight
+  ``max(min / max, 0.5)`` raised to the age of the hour; needs two of the
+  three most recent hours. The running hour counts as the most recent one,
+  so the value follows a change within the hour. The AQI is the higher of
+  the PM2.5 and PM10 sub-indices (2024 breakpoints).
+- EU CAQI (hourly grid): piecewise linear over the mean of the last 60
+  minutes, the higher of the PM2.5 and PM10 sub-indices.
+
+Samples go into fixed buckets (12 hourly, 12 of 5 minutes for the trailing
+hour, with a running total), so a sample is O(1) and the memory is bounded
+no matter how often the device is polled.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Mapping
+
+NOWCAST_HOURS = 12
+TRAILING_BUCKET = 5 * 60
+TRAILING_BUCKETS = 12
+
+# (concentration low, high, index low, high); truncation as in the EPA tables
+US_PM25 = (
+    (0.0, 9.0, 0, 50),
+    (9.1, 35.4, 51, 100),
+    (35.5, 55.4, 101, 150),
+    (55.5, 125.4, 151, 200),
+    (125.5, 225.4, 201, 300),
+    (225.5, 325.4, 301, 500),
+)
+US_PM10 = (
+    (0, 54, 0, 50),
+    (55, 154, 51, 100),
+    (155, 254, 101, 150),
+    (255, 354, 151, 200),
+    (355, 424, 201, 300),
+    (425, 604, 301, 500),
+)
+# CAQI hourly grid: concentration at index 0, 25, 50, 75, 100
+EU_PM25 = (0, 15, 30, 55, 110)
+EU_PM10 = (0, 25, 50, 90, 180)
+
+
+def us_aqi(concentration: float, table: tuple[tuple[float, float, int, int], ...], digits: int) -> int:
+    """EPA AQI of a concentration; above the table the top index (500)."""
+    factor = 10**digits
+    c = math.floor(concentration * factor) / factor
+    for c_low, c_high, i_low, i_high in table:
+        if c <= c_high:
+            if c < c_low:
+                # between two truncated breakpoints: belongs to the upper one
+                c = c_low
+            return round((i_high - i_low) / (c_high - c_low) * (c - c_low) + i_low)
+    return table[-1][3]
+
+
+def caqi(concentration: float, grid: tuple[float, ...]) -> float:
+    """CAQI sub-index; above the grid the last segment is extended."""
+    for level, (low, high) in enumerate(zip(grid, grid[1:])):
+        if concentration <= high:
+            return 25 * level + 25 * (concentration - low) / (high - low)
+    low, high = grid[-2], grid[-1]
+    return 100 + 25 * (concentration - high) / (high - low)
+
+
+class _Buckets:
+    """Sum and count per time bucket in a ring, keyed by bucket number."""
+
+    def __init__(self, width: int, size: int) -> None:
+        self.width = width
+        self.size = size
+        self._slot = [-1] * size
+        self._sum = [0.0] * size
+        self._count = [0] * size
+        # over the buckets still in the ring
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, now: float, value: float) -> None:
+        number = int(now // self.width)
+        index = number % self.size
+        if self._slot[index] != number:
+            # reuse the slot of a bucket that left the window
+            self.total -= self._sum[index]
+            self.count -= self._count[index]
+            self._slot[index] = number
+            self._sum[index] = 0.0
+            self._count[index] = 0
+        self._sum[index] += value
+        self._count[index] += 1
+        self.total += value
+        self.count += 1
+
+    def mean(self, number: int) -> float | None:
+        """Mean of bucket ``number``, None if it has no samples."""
+        index = number % self.size
+        if self._slot[index] != number or not self._count[index]:
+            return None
+        return self._sum[index] / self._count[index]
+
+    def window_mean(self, now: float) -> float | None:
+        """Mean of the samples in the last ``size`` buckets."""
+        oldest = int(now // self.width) - self.size + 1
+        for index, number in enumerate(self._slot):
+            if 0 <= number < oldest:
+                # expired but not yet overwritten
+                self.total -= self._sum[index]
+                self.count -= self._count[index]
+                self._slot[index] = -1
+                self._sum[index] = 0.0
+                self._count[index] = 0
+        return self.total / self.count if self.count else None
+
+
+class _Pollutant:
+    def __init__(self) -> None:
+        self.hours = _Buckets(3600, NOWCAST_HOURS)
+        self.trailing = _Buckets(TRAILING_BUCKET, TRAILING_BUCKETS)
+
+    def add(self, now: float, value: float) -> None:
+        self.hours.add(now, value)
+        self.trailing.add(now, value)
+
+    def nowcast(self, now: float) -> float | None:
+        hour = int(now // 3600)
+        means = [self.hours.mean(hour - age) for age in range(NOWCAST_HOURS)]
+        if sum(mean is not None for mean in means[:3]) < 2:
+            return None
+        known = [mean for mean in means if mean is not None]
+        high = max(known)
+        weight = max(min(known) / high, 0.5) if high > 0 else 1.0
+        numerator = denominator = 0.0
+        for age, mean in enumerate(means):
+            if mean is not None:
+                factor = weight**age
+                numerator += factor * mean
+                denominator += factor
+        return numerator / denominator
+
+
+def _number(values: Mapping[str, Any], key: str) -> float | None:
+    value = values.get(key)
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or not math.isfinite(value) or value < 0:
+        return None
+    return float(value)
+
+
+class AirQualityIndex:
+    """NowCast / US AQI and CAQI of one station's PM2.5 and PM10 readings."""
+
+    def __init__(self, pm25_key: str, pm10_key: str) -> None:
+        self.pm25_key = pm25_key
+        self.pm10_key = pm10_key
+        self._pm25 = _Pollutant()
+        self._pm10 = _Pollutant()
+
+    def update(self, now: float, values: Mapping[str, Any]) -> dict[str, Any]:
+        """Add a sample (µg/m³) and return the current indices."""
+        pm25 = _number(values, self.pm25_key)
+        pm10 = _number(values, self.pm10_key)
+        if pm25 is not None:
+            self._pm25.add(now, pm25)
+        if pm10 is not None:
+            self._pm10.add(now, pm10)
+
+        out: dict[str, Any] = {}
+        sub_us: list[int] = []
+        nowcast25 = self._pm25.nowcast(now)
+        if nowcast25 is not None:
+            out["pm25_nowcast"] = round(nowcast25, 1)
+            sub_us.append(us_aqi(nowcast25, US_PM25, 1))
+        nowcast10 = self._pm10.nowcast(now)
+        if nowcast10 is not None:
+            out["pm10_nowcast"] = round(nowcast10)
+            sub_us.append(us_aqi(nowcast10, US_PM10, 0))
+        if sub_us:
+            out["aqi_us"] = max(sub_us)
+
+        sub_eu: list[float] = []
+        mean25 = self._pm25.trailing.window_mean(now)
+        if mean25 is not None:
+            sub_eu.append(caqi(mean25, EU_PM25))
+        mean10 = self._pm10.trailing.window_mean(now)
+        if mean10 is not None:
+            sub_eu.append(caqi(mean10, EU_PM10))
+        if sub_eu:
+            out["caqi"] = round(max(sub_eu))
+        return out
@@ -0,0 +1,68 @@
+"""Circuit breaker for stations that stop answering.
+
+After ``threshold`` failed requests in a row the breaker opens: no requests
+go out until the backoff has passed. The backoff doubles with every trip up
+to ``maximum`` and is jittered, so stations that went down together do not
+come back in lockstep. When it has passed the breaker is half-open: one
+cheap probe (and, if that connects, one real request) decides whether it
+closes again or opens for the next, longer backoff.
+
+Times are monotonic seconds (the event loop clock). Plain Python on purpose
+(no Home Assistant imports).
+"""
+from __future__ import annotations
+
+import random
+from typing import Callable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATES = (CLOSED, OPEN, HALF_OPEN)
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open probe -> closed."""
+
+    def __init__(
+        self,
+        base: float,
+        maximum: float,
+        threshold: int = 3,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.base = base
+        self.maximum = maximum
+        self.threshold = threshold
+        self._rng = rng
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.backoff = 0.0
+        self.retry_at: float | None = None
+
+    def allow(self, now: float) -> bool:
+        """Whether a request may go out now; moves open -> half-open when due."""
+        if self.state == OPEN:
+            if self.retry_at is not None and now < self.retry_at:
+                return False
+            self.state = HALF_OPEN
+        return True
+
+    def success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.backoff = 0.0
+        self.retry_at = None
+
+    def failure(self, now: float) -> None:
+        self.failures += 1
+        if self.state != HALF_OPEN and self.failures < self.threshold:
+            return
+        self.trips += 1
+        backoff = min(self.maximum, self.base * 2 ** (self.trips - 1))
+        # "equal jitter": at least half the backoff, at most all of it
+        self.backoff = backoff / 2 + backoff / 2 * self._rng()
+        self.retry_at = now + self.backoff
+        self.state = OPEN
@@ -0,0 +1,178 @@
+"""Capture of the raw payloads a station sends, for offline replay.
+
+One JSON object per line, appended to ``<name>.jsonl``:
+
+    {"t": 1770066996.2, "path": "/json", "body": "{\\"ID\\": ...}"}   new body
+    {"t": 1770067026.2, "path": "/json", "same": true}                same body / 304
+    {"t": 1770067056.2, "error": "Cannot connect to host ..."}        failed poll
+    {"t": 1770067086.2, "push": true, "body": "{...}"}                push upload (mapped)
+
+A body equal to the last one captured for its path is written as ``same``.
+Bodies are kept byte for byte: bytes that are not UTF-8 round-trip through
+``surrogateescape``. Lines are buffered in memory and written in batches
+(``take`` on the event loop, ``write`` in the executor); the coordinator
+queues the batches one behind the other, so they reach the file in order. When the file
+would grow past ``max_bytes`` it is compressed to ``<name>.jsonl.1.gz``,
+older captures move up one number and the oldest beyond ``backups`` is
+deleted, so a capture never takes more than roughly ``max_bytes`` plus its
+compressed backups. A ``same`` line can refer to a body in the previous
+file: read a capture with its backups (``capture_files``).
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Iterable, Iterator
+
+
+@dataclass
+class CaptureRecord:
+    time: float
+    path: str | None = None
+    body: bytes | None = None
+    same: bool = False
+    push: bool = False
+    error: str | None = None
+
+
+def encode_record(record: CaptureRecord) -> str:
+    line: dict[str, Any] = {"t": round(record.time, 3)}
+    if record.push:
+        line["push"] = True
+    elif record.path is not None:
+        line["path"] = record.path
+    if record.body is not None:
+        line["body"] = record.body.decode("utf-8", "surrogateescape")
+    if record.same:
+        line["same"] = True
+    if record.error is not None:
+        line["error"] = record.error
+    return json.dumps(line, separators=(",", ":")) + "\n"
+
+
+def decode_record(line: str) -> CaptureRecord:
+    data = json.loads(line)
+    body = data.get("body")
+    return CaptureRecord(
+        time=float(data["t"]),
+        path=data.get("path"),
+        body=body.encode("utf-8", "surrogateescape") if body is not None else None,
+        same=bool(data.get("same")),
+        push=bool(data.get("push")),
+        error=data.get("error"),
+    )
+
+
+def capture_files(path: str) -> list[str]:
+    """The capture at ``path`` and its rotated backups, oldest first."""
+    files = []
+    number = 1
+    while os.path.exists(f"{path}.{number}.gz"):
+        files.append(f"{path}.{number}.gz")
+        number += 1
+    files.reverse()
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def read_capture(paths: Iterable[str]) -> Iterator[CaptureRecord]:
+    """Records of capture files (plain or gzip), in the given order."""
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield decode_record(line)
+
+
+class PayloadCapture:
+    """Buffered, size-capped capture file of one station."""
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int,
+        backups: int,
+        flush_lines: int,
+        flush_interval: float,
+        clock: Any = time.monotonic,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_lines = flush_lines
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._buffer: list[str] = []
+        self._flushed = clock()
+        self._lock = threading.Lock()
+        # last body captured per path
+        self._bodies: dict[str | None, bytes] = {}
+        self.records = 0
+        self.rotations = 0
+
+    def add(self, record: CaptureRecord) -> bool:
+        """Buffer a record; True when the buffer should be written."""
+        if record.body is not None and not record.push:
+            if self._bodies.get(record.path) == record.body:
+                record = CaptureRecord(record.time, record.path, same=True)
+            else:
+                self._bodies[record.path] = record.body
+        self._buffer.append(encode_record(record))
+        self.records += 1
+        return (
+            len(self._buffer) >= self.flush_lines
+            or self._clock() - self._flushed >= self.flush_interval
+        )
+
+    def take(self) -> list[str]:
+        """Hand over the buffered lines (event loop side)."""
+        lines, self._buffer = self._buffer, []
+        self._flushed = self._clock()
+        return lines
+
+    def write(self, lines: list[str]) -> None:
+        """Append lines, rotating first if the file would get too large (blocking)."""
+        if not lines:
+            return
+        data = "".join(lines).encode("utf-8")
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            try:
+                size = os.path.getsize(self.path)
+            except FileNotFoundError:
+                size = 0
+            if size and size + len(data) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "ab") as file:
+                file.write(data)
+
+    def _rotate(self) -> None:
+        oldest = f"{self.path}.{self.backups}.gz"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for number in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{number}.gz"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{number + 1}.gz")
+        if self.backups > 0:
+            with open(self.path, "rb") as source, gzip.open(f"{self.path}.1.gz", "wb") as target:
+                shutil.copyfileobj(source, target)
+        os.remove(self.path)
+        self.rotations += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "file": os.path.basename(self.path),
+            "records": self.records,
+            "buffered": len(self._buffer),
+            "rotations": self.rotations,
+        }
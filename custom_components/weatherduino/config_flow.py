@@ -1,22 +1,60 @@
 from __future__ import annotations
 
+import re
+import secrets
+from typing import Any
+
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.components.network import async_get_source_ip
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.exceptions import HomeAssistantError
 
 from .const import (
     DOMAIN,
     CONF_PATH,
     CONF_SCAN_INTERVAL,
+    CONF_CAPTURE,
     CONF_DEVICE_TYPE,
+    CONF_EXTRA_PATHS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_HISTORY_HOURS,
+    CONF_HISTORY_PERSIST,
+    CONF_IMPORT_STATISTICS,
+    CONF_STATISTICS_WINDOWS,
+    CONF_PUSH_ID,
+    CONF_WIND_SAMPLE_INTERVAL,
+    DEADBAND_OPTIONS,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_CAPTURE,
+    DEFAULT_DEADBAND,
+    DEFAULT_EXTRA_PATHS,
+    DEFAULT_HISTORY_HOURS,
+    DEFAULT_HISTORY_PERSIST,
+    DEFAULT_IMPORT_STATISTICS,
+    DEFAULT_STATISTICS_WINDOWS,
+    DEFAULT_PUSH_ID,
+    GENERATE_PUSH_ID,
+    DEFAULT_WIND_SAMPLE_INTERVAL,
     DEFAULT_PORT,
     DEFAULT_PATH,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_DEVICE_TYPE,
+    DEVICE_MODELS,
     DEVICE_TYPES,
+    MAX_WIND_SAMPLE_INTERVAL,
+    MIN_PUSH_ID_LENGTH,
 )
+from .discovery import DiscoveredDevice, async_scan, subnet_hosts
+from .endpoints import parse_extra_paths
+from .history import parse_windows
+
+# push IDs end up in the upload URL; empty = polling
+_PUSH_ID = re.compile(rf"([A-Za-z0-9_-]{{{MIN_PUSH_ID_LENGTH},64}})?")
+
+CONF_SUBNET = "subnet"
 
 
 def _normalize_path(raw: str | None) -> str:
@@ -37,7 +75,67 @@ def _normalize_path(raw: str | None) -> str:
 class WeatherDuinoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    def __init__(self) -> None:
+        # defaults of the manual step, filled in from a discovered device
+        self._defaults: dict[str, Any] = {}
+        self._discovered: dict[str, DiscoveredDevice] = {}
+
     async def async_step_user(self, user_input: dict | None = None) -> FlowResult:
+        return self.async_show_menu(step_id="user", menu_options=["discover", "manual"])
+
+    async def async_step_discover(self, user_input: dict | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            port = int(user_input.get(CONF_PORT, DEFAULT_PORT))
+            path = _normalize_path(user_input.get(CONF_PATH, DEFAULT_PATH))
+            try:
+                hosts = subnet_hosts(str(user_input.get(CONF_SUBNET, "")))
+            except ValueError:
+                errors[CONF_SUBNET] = "invalid_subnet"
+            else:
+                configured = self._async_current_ids()
+                found = await async_scan(
+                    [host for host in hosts if f"{host}:{port}" not in configured], port, path
+                )
+                if found:
+                    self._discovered = {device.host: device for device in found}
+                    self._defaults = {CONF_PORT: port, CONF_PATH: path}
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
+
+        try:
+            source_ip = await async_get_source_ip(self.hass)
+        except HomeAssistantError:
+            source_ip = None
+        default_subnet = f"{source_ip.rsplit('.', 1)[0]}.0/24" if source_ip and "." in source_ip else ""
+
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_SUBNET, default=default_subnet): str,
+                vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+                vol.Optional(CONF_PATH, default=DEFAULT_PATH): str,
+            }
+        )
+
+        return self.async_show_form(step_id="discover", data_schema=schema, errors=errors)
+
+    async def async_step_pick(self, user_input: dict | None = None) -> FlowResult:
+        if user_input is not None:
+            device = self._discovered[user_input[CONF_HOST]]
+            self._defaults.update({CONF_HOST: device.host, CONF_DEVICE_TYPE: device.device_type})
+            return await self.async_step_manual()
+
+        devices = {
+            host: f"{host} – {DEVICE_MODELS.get(device.device_type, device.device_type)}"
+            + (f" ({device.device_id})" if device.device_id else "")
+            for host, device in self._discovered.items()
+        }
+        schema = vol.Schema({vol.Required(CONF_HOST): vol.In(devices)})
+
+        return self.async_show_form(step_id="pick", data_schema=schema)
+
+    async def async_step_manual(self, user_input: dict | None = None) -> FlowResult:
         errors: dict[str, str] = {}
 
         if user_input is not None:
@@ -64,17 +162,20 @@ class WeatherDuinoConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     },
                 )
 
+        defaults = self._defaults
         schema = vol.Schema(
             {
-                vol.Required(CONF_HOST): str,
-                vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
-                vol.Optional(CONF_PATH, default=DEFAULT_PATH): str,
-                vol.Optional(CONF_DEVICE_TYPE, default=DEFAULT_DEVICE_TYPE): vol.In(DEVICE_TYPES),
+                vol.Required(CONF_HOST, default=defaults.get(CONF_HOST, vol.UNDEFINED)): str,
+                vol.Optional(CONF_PORT, default=defaults.get(CONF_PORT, DEFAULT_PORT)): int,
+                vol.Optional(CONF_PATH, default=defaults.get(CONF_PATH, DEFAULT_PATH)): str,
+                vol.Optional(
+                    CONF_DEVICE_TYPE, default=defaults.get(CONF_DEVICE_TYPE, DEFAULT_DEVICE_TYPE)
+                ): vol.In(DEVICE_TYPES),
                 vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
             }
         )
 
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="manual", data_schema=schema, errors=errors)
 
     @staticmethod
     def async_get_options_flow(config_entry: config_entries.ConfigEntry) -> config_entries.OptionsFlow:
@@ -86,30 +187,105 @@ class WeatherDuinoOptionsFlowHandler(config_entries.OptionsFlow):
         self._entry = config_entry
 
     async def async_step_init(self, user_input: dict | None = None) -> FlowResult:
+        errors: dict[str, str] = {}
+
         if user_input is not None:
+            windows = str(user_input.get(CONF_STATISTICS_WINDOWS, DEFAULT_STATISTICS_WINDOWS))
+            try:
+                parse_windows(windows)
+            except ValueError:
+                errors[CONF_STATISTICS_WINDOWS] = "invalid_windows"
+            extra_paths = str(user_input.get(CONF_EXTRA_PATHS, DEFAULT_EXTRA_PATHS)).strip()
+            try:
+                parse_extra_paths(extra_paths)
+            except ValueError:
+                errors[CONF_EXTRA_PATHS] = "invalid_extra_paths"
+            push_id = str(user_input.get(CONF_PUSH_ID, DEFAULT_PUSH_ID)).strip()
+            if push_id.lower() == GENERATE_PUSH_ID:
+                push_id = secrets.token_urlsafe(24)
+            elif not _PUSH_ID.fullmatch(push_id):
+                errors[CONF_PUSH_ID] = "invalid_push_id"
+
+        if user_input is not None and not errors:
             path = _normalize_path(user_input.get(CONF_PATH))
             device_type = user_input.get(CONF_DEVICE_TYPE, DEFAULT_DEVICE_TYPE)
             scan_interval = int(user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+            deadbands = {
+                option: float(user_input.get(option, DEFAULT_DEADBAND))
+                for option in DEADBAND_OPTIONS.values()
+            }
 
             return self.async_create_entry(
                 title="",
                 data={
                     CONF_PATH: path,
+                    CONF_EXTRA_PATHS: extra_paths,
                     CONF_DEVICE_TYPE: device_type,
                     CONF_SCAN_INTERVAL: scan_interval,
+                    CONF_ADAPTIVE_POLLING: bool(user_input.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)),
+                    CONF_HISTORY_HOURS: int(user_input.get(CONF_HISTORY_HOURS, DEFAULT_HISTORY_HOURS)),
+                    CONF_HISTORY_PERSIST: bool(user_input.get(CONF_HISTORY_PERSIST, DEFAULT_HISTORY_PERSIST)),
+                    CONF_STATISTICS_WINDOWS: windows,
+                    CONF_IMPORT_STATISTICS: bool(user_input.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS)),
+                    CONF_PUSH_ID: push_id,
+                    CONF_CAPTURE: bool(user_input.get(CONF_CAPTURE, DEFAULT_CAPTURE)),
+                    CONF_WIND_SAMPLE_INTERVAL: int(user_input.get(CONF_WIND_SAMPLE_INTERVAL, DEFAULT_WIND_SAMPLE_INTERVAL)),
+                    **deadbands,
                 },
             )
 
-        current_path = self._entry.options.get(CONF_PATH, self._entry.data.get(CONF_PATH, DEFAULT_PATH))
-        current_device_type = self._entry.options.get(CONF_DEVICE_TYPE, self._entry.data.get(CONF_DEVICE_TYPE, DEFAULT_DEVICE_TYPE))
-        current_scan = self._entry.options.get(CONF_SCAN_INTERVAL, self._entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        # options fall back to what was entered at setup; after a validation
+        # error the form keeps what the user typed
+        current = {**self._entry.data, **self._entry.options, **(user_input or {})}
 
         schema = vol.Schema(
             {
-                vol.Optional(CONF_PATH, default=current_path): str,
-                vol.Optional(CONF_DEVICE_TYPE, default=current_device_type): vol.In(DEVICE_TYPES),
-                vol.Optional(CONF_SCAN_INTERVAL, default=current_scan): int,
+                vol.Optional(CONF_PATH, default=current.get(CONF_PATH, DEFAULT_PATH)): str,
+                vol.Optional(
+                    CONF_EXTRA_PATHS,
+                    default=current.get(CONF_EXTRA_PATHS, DEFAULT_EXTRA_PATHS),
+                ): str,
+                vol.Optional(CONF_DEVICE_TYPE, default=current.get(CONF_DEVICE_TYPE, DEFAULT_DEVICE_TYPE)): vol.In(DEVICE_TYPES),
+                vol.Optional(CONF_SCAN_INTERVAL, default=current.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)): int,
+                vol.Optional(
+                    CONF_ADAPTIVE_POLLING,
+                    default=current.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+                ): bool,
+                vol.Optional(
+                    CONF_HISTORY_HOURS,
+                    default=current.get(CONF_HISTORY_HOURS, DEFAULT_HISTORY_HOURS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=168)),
+                vol.Optional(
+                    CONF_HISTORY_PERSIST,
+                    default=current.get(CONF_HISTORY_PERSIST, DEFAULT_HISTORY_PERSIST),
+                ): bool,
+                vol.Optional(
+                    CONF_STATISTICS_WINDOWS,
+                    default=current.get(CONF_STATISTICS_WINDOWS, DEFAULT_STATISTICS_WINDOWS),
+                ): str,
+                vol.Optional(
+                    CONF_IMPORT_STATISTICS,
+                    default=current.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS),
+                ): bool,
+                vol.Optional(
+                    CONF_WIND_SAMPLE_INTERVAL,
+                    default=current.get(CONF_WIND_SAMPLE_INTERVAL, DEFAULT_WIND_SAMPLE_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_WIND_SAMPLE_INTERVAL)),
+                vol.Optional(
+                    CONF_PUSH_ID,
+                    default=current.get(CONF_PUSH_ID, DEFAULT_PUSH_ID),
+                ): str,
+                vol.Optional(
+                    CONF_CAPTURE,
+                    default=current.get(CONF_CAPTURE, DEFAULT_CAPTURE),
+                ): bool,
+                **{
+                    vol.Optional(
+                        option, default=current.get(option, DEFAULT_DEADBAND)
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0))
+                    for option in DEADBAND_OPTIONS.values()
+                },
             }
         )
 
-        return self.async_show_form(step_id="init", data_schema=schema)
\ No newline at end of file
+        return self.async_show_form(step_id="init", data_schema=schema, errors=errors)
\ No newline at end of file
@@ -0,0 +1,227 @@
+"""Per-device HTTP connections.
+
+The ESP web servers on the WeatherDuino boards handle one connection at a
+time. Every device (host and port) therefore gets one ``DeviceConnection``,
+shared by all entries pointing at it:
+
+- a gate that lets one request through at a time, so a manual refresh and a
+  scheduled poll queue here instead of piling up sockets on the device
+- its own connector limited to one connection, kept alive between polls
+  as long as the device allows it; when a reused connection turns out to
+  be closed by the device the request is retried once on a fresh one, and
+  only after that happened several times in a row do later requests ask
+  for ``Connection: close``
+- separate connect and read timeouts below the overall request timeout
+- a cap on the response size
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+from typing import Mapping
+
+from aiohttp import (
+    ClientPayloadError,
+    ClientSession,
+    ClientTimeout,
+    HttpVersion11,
+    ServerDisconnectedError,
+    TCPConnector,
+)
+from aiohttp.hdrs import CONNECTION, ETAG, LAST_MODIFIED
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    CONNECT_TIMEOUT,
+    DATA_CONNECTIONS,
+    DOMAIN,
+    KEEPALIVE_MAX_STALE,
+    KEEPALIVE_TIMEOUT,
+    MAX_RESPONSE_BYTES,
+    READ_TIMEOUT,
+    REQUEST_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_TIMEOUT = ClientTimeout(
+    total=REQUEST_TIMEOUT, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+)
+
+
+class ResponseTooLarge(ClientPayloadError):
+    """The device sent more than ``MAX_RESPONSE_BYTES``."""
+
+
+@dataclass
+class DeviceResponse:
+    status: int
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass
+class _Stats:
+    requests: int = 0
+    queued: int = 0
+    # requests answered on a kept-alive connection, and kept-alive
+    # connections found closed by the device (retried on a fresh one)
+    reused: int = 0
+    reconnects: int = 0
+    # kept-alive connections found closed in a row
+    stale: int = 0
+    keepalive: bool = True
+
+
+class DeviceConnection:
+    """Serialized, kept-alive HTTP requests to one device."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        base = f"http://{host}"
+        if port and port != 80:
+            base = f"{base}:{port}"
+        self.base_url = base
+        self.users = 0
+        self.stats = _Stats()
+        self._gate = asyncio.Lock()
+        self._session: ClientSession | None = None
+        # the last response left its connection open for the next request
+        self._idle = False
+
+    def _get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(limit=1, keepalive_timeout=KEEPALIVE_TIMEOUT),
+                timeout=_TIMEOUT,
+            )
+        return self._session
+
+    async def async_get(self, path: str, headers: Mapping[str, str] | None = None) -> DeviceResponse:
+        """GET ``path``; raises ``ClientError`` / ``TimeoutError`` like aiohttp."""
+        stats = self.stats
+        if self._gate.locked():
+            stats.queued += 1
+        async with self._gate:
+            stats.requests += 1
+            request_headers = dict(headers or {})
+            if not stats.keepalive:
+                request_headers[CONNECTION] = "close"
+            reused, self._idle = self._idle, False
+            try:
+                response = await self._async_request(path, request_headers)
+            except ServerDisconnectedError:
+                if not reused:
+                    raise
+                # the device dropped the idle connection we tried to reuse:
+                # retry once on a fresh one
+                stats.reconnects += 1
+                stats.stale += 1
+                if stats.stale >= KEEPALIVE_MAX_STALE:
+                    _LOGGER.debug(
+                        "%s closed %d kept-alive connections in a row, disabling keep-alive",
+                        self.base_url,
+                        stats.stale,
+                    )
+                    stats.keepalive = False
+                    request_headers[CONNECTION] = "close"
+                return await self._async_request(path, request_headers)
+            if reused:
+                stats.reused += 1
+                stats.stale = 0
+            return response
+
+    async def async_probe(self) -> None:
+        """Open and close a TCP connection; raises ``OSError`` / ``TimeoutError``."""
+        async with self._gate:
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                _, writer = await asyncio.open_connection(self.host, self.port or 80)
+            writer.close()
+            await writer.wait_closed()
+
+    async def _async_request(self, path: str, headers: dict[str, str]) -> DeviceResponse:
+        async with self._get_session().get(f"{self.base_url}{path}", headers=headers) as resp:
+            resp.raise_for_status()
+            if resp.content_length is not None and resp.content_length > MAX_RESPONSE_BYTES:
+                raise ResponseTooLarge(f"response of {resp.content_length} bytes is too large")
+            body = bytearray()
+            async for chunk in resp.content.iter_chunked(4096):
+                body += chunk
+                if len(body) > MAX_RESPONSE_BYTES:
+                    raise ResponseTooLarge(f"response exceeds {MAX_RESPONSE_BYTES} bytes")
+            # read in full: the connection goes back to the connector unless
+            # either side asked to close it
+            self._idle = (
+                CONNECTION not in headers
+                and resp.headers.get(CONNECTION, "").lower() != "close"
+                and resp.version is not None
+                and resp.version >= HttpVersion11
+            )
+            return DeviceResponse(
+                resp.status,
+                bytes(body),
+                resp.headers.get(ETAG),
+                resp.headers.get(LAST_MODIFIED),
+            )
+
+    async def async_close(self) -> None:
+        self._idle = False
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "users": self.users,
+            "requests": self.stats.requests,
+            "queued": self.stats.queued,
+            "reused": self.stats.reused,
+            "reconnects": self.stats.reconnects,
+            "keepalive": self.stats.keepalive,
+        }
+
+
+class ConnectionPool:
+    """The ``DeviceConnection`` of every device, reference counted."""
+
+    def __init__(self) -> None:
+        self._connections: dict[tuple[str, int], DeviceConnection] = {}
+
+    def acquire(self, host: str, port: int) -> DeviceConnection:
+        connection = self._connections.get((host, port))
+        if connection is None:
+            connection = self._connections[(host, port)] = DeviceConnection(host, port)
+        connection.users += 1
+        return connection
+
+    async def async_release(self, connection: DeviceConnection) -> None:
+        connection.users -= 1
+        if connection.users <= 0:
+            self._connections.pop((connection.host, connection.port), None)
+            await connection.async_close()
+
+    async def async_close_all(self) -> None:
+        connections = list(self._connections.values())
+        self._connections.clear()
+        for connection in connections:
+            await connection.async_close()
+
+
+@callback
+def async_get_connection_pool(hass: HomeAssistant) -> ConnectionPool:
+    """Return the shared connection pool, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    pool = domain_data.get(DATA_CONNECTIONS)
+    if pool is None:
+        pool = domain_data[DATA_CONNECTIONS] = ConnectionPool()
+
+        async def _async_close(_: Event) -> None:
+            await pool.async_close_all()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return pool
@@ -5,11 +5,110 @@ PLATFORMS: list[str] = ["sensor"]
 CONF_PATH = "path"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_DEVICE_TYPE = "device_type"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_HISTORY_HOURS = "history_hours"
+CONF_HISTORY_PERSIST = "history_persist"
+CONF_STATISTICS_WINDOWS = "statistics_windows"
+CONF_PUSH_ID = "push_id"
+CONF_WIND_SAMPLE_INTERVAL = "wind_sample_interval"
+CONF_EXTRA_PATHS = "extra_paths"
+CONF_IMPORT_STATISTICS = "import_statistics"
+CONF_CAPTURE = "capture_payloads"
+
+# Deadbands: changes smaller than these do not write a new state
+CONF_DEADBAND_TEMPERATURE = "deadband_temperature"
+CONF_DEADBAND_HUMIDITY = "deadband_humidity"
+CONF_DEADBAND_PRESSURE = "deadband_pressure"
+CONF_DEADBAND_PARTICULATE = "deadband_particulate"
 
 DEFAULT_PORT = 80
 DEFAULT_PATH = "/json"
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_DEVICE_TYPE = "auto"
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_HISTORY_HOURS = 0
+DEFAULT_HISTORY_PERSIST = False
+DEFAULT_STATISTICS_WINDOWS = "60"
+DEFAULT_DEADBAND = 0.0
+DEFAULT_PUSH_ID = ""
+# the push endpoint is unauthenticated: the ID has to be hard to guess
+MIN_PUSH_ID_LENGTH = 16
+# typed as push ID, replaced by a random one
+GENERATE_PUSH_ID = "generate"
+DEFAULT_WIND_SAMPLE_INTERVAL = 0
+MIN_WIND_SAMPLE_INTERVAL = 2
+MAX_WIND_SAMPLE_INTERVAL = 30
+DEFAULT_EXTRA_PATHS = ""
+DEFAULT_IMPORT_STATISTICS = False
+DEFAULT_CAPTURE = False
+
+# seconds before a request to the device is given up, overall and per phase
+REQUEST_TIMEOUT = 10
+CONNECT_TIMEOUT = 3
+READ_TIMEOUT = 8
+# idle kept-alive connections are dropped after this many seconds
+KEEPALIVE_TIMEOUT = 75
+# keep-alive is turned off after this many reused connections in a row were
+# found closed by the device
+KEEPALIVE_MAX_STALE = 3
+# larger responses are not a WeatherDuino payload
+MAX_RESPONSE_BYTES = 64 * 1024
+
+# subnet discovery: probes in flight, per-probe timeouts (s), largest network
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_CONNECT_TIMEOUT = 1.0
+DISCOVERY_TIMEOUT = 2.0
+DISCOVERY_MAX_HOSTS = 1024
+
+# a memory-mapped sample history is written to its file this often (seconds)
+HISTORY_SYNC_INTERVAL = 60
+
+# payload capture (<config>/weatherduino/capture/): file size before it is
+# rotated, compressed backups kept, and when buffered lines are written
+CAPTURE_MAX_BYTES = 1024 * 1024
+CAPTURE_BACKUPS = 5
+CAPTURE_FLUSH_LINES = 20
+CAPTURE_FLUSH_INTERVAL = 60
+
+# station telemetry that moves on every poll: smallest change that writes a
+# new state (ms, ms, bytes, s); last_success is only written after a failure
+TELEMETRY_DEADBANDS = {
+    "fetch_latency": 50,
+    "decode_time": 1.0,
+    "payload_bytes": 64,
+    "poll_lag": 1.0,
+}
+
+# circuit breaker: open after this many failed polls in a row, then back off
+# from the scan interval (at least the minimum) doubling up to the maximum
+BREAKER_THRESHOLD = 3
+BREAKER_MIN_BACKOFF = 30
+BREAKER_MAX_BACKOFF = 3600
+
+# Home Assistant storage (rain ledger, ...)
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 60
+
+# Per-device connections (hass.data[DOMAIN][DATA_CONNECTIONS])
+DATA_CONNECTIONS = "connections"
+
+# Push mode registry (hass.data[DOMAIN][DATA_PUSH])
+DATA_PUSH = "push"
+
+# Running weatherduino.profile call (hass.data[DOMAIN][DATA_PROFILE])
+DATA_PROFILE = "profile"
+DEFAULT_PROFILE_CYCLES = 10
+MAX_PROFILE_CYCLES = 1000
+# a profiling run reports what it has after this many seconds
+PROFILE_TIMEOUT = 3600
+
+# Dispatcher signal (per entry id) when a payload brings keys not seen before
+SIGNAL_NEW_KEYS = f"{DOMAIN}_new_keys_{{}}"
+
+# Shared poll scheduler (hass.data[DOMAIN][DATA_SCHEDULER])
+DATA_SCHEDULER = "scheduler"
+# requests in flight across all entries (each host has one at a time anyway)
+DEFAULT_MAX_CONCURRENT = 4
 
 ATTRIBUTION = "Data provided by WeatherDuino Local JSON"
 
@@ -26,4 +125,19 @@ DEVICE_TYPES = [
     DEVICE_TYPE_WEATHERDISPLAY,
     DEVICE_TYPE_AQM2,
     DEVICE_TYPE_AQM3,
-]
\ No newline at end of file
+]
+
+DEVICE_MODELS = {
+    DEVICE_TYPE_4PRO: "WeatherDuino 4Pro",
+    DEVICE_TYPE_WEATHERDISPLAY: "WeatherDuino WeatherDisplay",
+    DEVICE_TYPE_AQM2: "WeatherDuino 2Pro Air Quality",
+    DEVICE_TYPE_AQM3: "WeatherDuino Air Quality Monitor 3",
+}
+
+# Deadband option per group of sensors (see descriptions.DEADBAND_GROUPS)
+DEADBAND_OPTIONS = {
+    "temperature": CONF_DEADBAND_TEMPERATURE,
+    "humidity": CONF_DEADBAND_HUMIDITY,
+    "pressure": CONF_DEADBAND_PRESSURE,
+    "particulate": CONF_DEADBAND_PARTICULATE,
+}
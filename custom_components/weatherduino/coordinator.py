@@ -1,31 +1,94 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import Any, Literal
+import asyncio
+from datetime import datetime
+from http import HTTPStatus
+import json
+from typing import Any
 import logging
+import time
 
 from aiohttp import ClientError
+from aiohttp.hdrs import IF_MODIFIED_SINCE, IF_NONE_MATCH
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util, slugify
 
+from .adaptive import CadenceTracker
+from .aqi import AirQualityIndex
+from .breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from .capture import CaptureRecord, PayloadCapture
+from .connection import DeviceConnection, DeviceResponse, async_get_connection_pool
 from .const import (
+    BREAKER_MAX_BACKOFF,
+    BREAKER_MIN_BACKOFF,
+    BREAKER_THRESHOLD,
+    CAPTURE_BACKUPS,
+    CAPTURE_FLUSH_INTERVAL,
+    CAPTURE_FLUSH_LINES,
+    CAPTURE_MAX_BYTES,
+    CONF_ADAPTIVE_POLLING,
+    CONF_CAPTURE,
     CONF_DEVICE_TYPE,
+    CONF_EXTRA_PATHS,
+    CONF_HISTORY_HOURS,
+    CONF_HISTORY_PERSIST,
+    CONF_IMPORT_STATISTICS,
     CONF_PATH,
+    CONF_PUSH_ID,
     CONF_SCAN_INTERVAL,
+    CONF_STATISTICS_WINDOWS,
+    CONF_WIND_SAMPLE_INTERVAL,
+    DEADBAND_OPTIONS,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_CAPTURE,
+    DEFAULT_DEADBAND,
     DEFAULT_DEVICE_TYPE,
+    DEFAULT_EXTRA_PATHS,
+    DEFAULT_HISTORY_HOURS,
+    DEFAULT_HISTORY_PERSIST,
+    DEFAULT_IMPORT_STATISTICS,
     DEFAULT_PATH,
     DEFAULT_PORT,
+    DEFAULT_PUSH_ID,
+    DEFAULT_STATISTICS_WINDOWS,
+    DEFAULT_WIND_SAMPLE_INTERVAL,
+    DEVICE_MODELS,
     DOMAIN,
+    HISTORY_SYNC_INTERVAL,
+    MIN_WIND_SAMPLE_INTERVAL,
+    REQUEST_TIMEOUT,
+    SIGNAL_NEW_KEYS,
+    TELEMETRY_DEADBANDS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
 )
+from .decode import DeviceType, detect_device_type, diff_values
+from .descriptions import (
+    AQI_INPUTS,
+    DEADBAND_GROUPS,
+    DECODE_PLANS,
+    STATISTICS_KEYS,
+    resolve_device_type,
+)
+from .endpoints import ExtraPath, merge_payloads, parse_extra_paths
+from .history import STATISTICS, SampleRing, open_ring, parse_windows, statistic_key
+from .longterm import LongTermStatistics
+from .meteo import DerivedMeteo
+from .profiling import CycleProfiler
+from .rain import RainLedger
+from .payload import PayloadError, parse_payload
+from .scheduler import async_get_scheduler
+from .telemetry import StationTelemetry
+from .wind import WindAggregator
 
 _LOGGER = logging.getLogger(__name__)
 
-DeviceType = Literal["auto", "4pro", "weatherdisplay", "aqm2", "aqm3", "unknown"]
-
 
 def _normalize_path(raw: str | None) -> str:
     # IMPORTANT: empty => "/"
@@ -39,22 +102,6 @@ def _normalize_path(raw: str | None) -> str:
     return raw
 
 
-def _has_any(data: dict[str, Any], keys: list[str]) -> bool:
-    return any(k in data for k in keys)
-
-
-def _detect_device_type(data: dict[str, Any]) -> DeviceType:
-    if _has_any(data, ["Wsp", "Wgs", "Wdir", "Rtd", "Rfr"]):
-        return "4pro"
-    if _has_any(data, ["PM25_last", "PM25_24H", "ts"]):
-        return "aqm3"
-    if _has_any(data, ["PM25AQI", "PM100AQI", "AVG_M"]):
-        return "aqm2"
-    if "T" in data and "H" in data:
-        return "weatherdisplay"
-    return "unknown"
-
-
 class WeatherDuinoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.hass = hass
@@ -74,6 +121,9 @@ class WeatherDuinoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             entry.data.get(CONF_SCAN_INTERVAL, 30),
         )
 
+        # push mode: the station uploads to the push view instead of being polled
+        self.push_id: str = entry.options.get(CONF_PUSH_ID, DEFAULT_PUSH_ID)
+
         self.forced_device_type: DeviceType = entry.options.get(
             CONF_DEVICE_TYPE,
             entry.data.get(CONF_DEVICE_TYPE, DEFAULT_DEVICE_TYPE),
@@ -84,24 +134,145 @@ class WeatherDuinoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             base = f"{base}:{self.port}"
         self.url = f"{base}{self.path}"
 
+        # more JSON paths of the same device, merged into every payload
+        self.extra_paths: list[ExtraPath] = [
+            ExtraPath(path, interval)
+            for path, interval in parse_extra_paths(
+                entry.options.get(CONF_EXTRA_PATHS, DEFAULT_EXTRA_PATHS)
+            )
+            if path != self.path
+        ]
+
+        # requests go through the device's shared, serialized connection;
+        # a push station is never polled and does not hold one
+        self._connections = async_get_connection_pool(hass)
+        self.connection: DeviceConnection | None = (
+            None if self.push_id else self._connections.acquire(self.host, self.port)
+        )
+        # shutdown can run more than once (unload, then Home Assistant stop)
+        self._connection_released = False
+
         self.device_type: DeviceType = "unknown"
         self.device_id: str | None = None
+        # keys of the last payload; entities are created from these
+        self.payload_keys: frozenset[str] = frozenset()
+        # device type, id and payload keys, kept so setup does not wait for the device
+        self._device_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.device"
+        )
+
+        # decoded, pre-scaled values of the last payload (see decode.py)
+        self.values: dict[str, Any] = {}
+        # the payload decoded, before anything was derived from it; reused
+        # when the device sends the same bytes again
+        self._decoded: dict[str, Any] = {}
+
+        # per-key deadbands from the options, only for groups that are set
+        self._deadbands: dict[str, float] = {}
+        for key, group in DEADBAND_GROUPS.items():
+            band = float(entry.options.get(DEADBAND_OPTIONS[group], DEFAULT_DEADBAND))
+            if band > 0:
+                self._deadbands[key] = band
+
+        # polls are timed by the shared scheduler, not by update_interval
+        self.scheduler = async_get_scheduler(hass)
+        # loop time the running scheduled poll was due, and how late it started
+        self.poll_due: float | None = None
+        self.poll_lag: float | None = None
+
+        # adaptive mode: poll right after the device's next expected sample
+        self.adaptive: bool = entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING)
+        self._cadence = CadenceTracker(float(self.scan_interval)) if self.adaptive else None
+
+        # sample history for windowed statistics, created with the first payload
+        self.history_hours: int = entry.options.get(CONF_HISTORY_HOURS, DEFAULT_HISTORY_HOURS)
+        self.history_persist: bool = entry.options.get(CONF_HISTORY_PERSIST, DEFAULT_HISTORY_PERSIST)
+        self.statistics_windows: tuple[int, ...] = parse_windows(
+            entry.options.get(CONF_STATISTICS_WINDOWS, DEFAULT_STATISTICS_WINDOWS)
+        )
+        self.history: SampleRing | None = None
+        self._history_synced = 0.0
+        # statistic value key -> (field, statistic, window)
+        self._statistic_keys: dict[str, tuple[str, str, int]] = {}
+
+        # hourly long-term statistics imported straight from the samples
+        self.long_term = (
+            LongTermStatistics(hass, self)
+            if entry.options.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS)
+            else None
+        )
+
+        # high-frequency wind mode (4Pro): sample every few seconds, publish
+        # the aggregated wind once per scan interval
+        wind_interval = int(entry.options.get(CONF_WIND_SAMPLE_INTERVAL, DEFAULT_WIND_SAMPLE_INTERVAL))
+        self.wind_sample_interval: int = max(wind_interval, MIN_WIND_SAMPLE_INTERVAL) if wind_interval else 0
+        self._wind = (
+            WindAggregator()
+            if 0 < self.wind_sample_interval < self.scan_interval
+            else None
+        )
+        self._wind_published: float | None = None
+
+        # derived meteorology (4Pro), created with the first 4Pro payload
+        self._meteo: DerivedMeteo | None = None
+        # NowCast / AQI / CAQI (AQM2, AQM3), created with the first payload
+        self._aqi: AirQualityIndex | None = None
+        # rain ledger (4Pro Rtd), loaded from storage with the first reading
+        self._rain: RainLedger | None = None
+        self._rain_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.rain"
+        )
+
+        # raw body of the last payload, and its validators if the device sends any
+        self._last_body: bytes | None = None
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self.payload_unchanged = 0
+        self.payload_changed = 0
+
+        # request latency, decode time, payload size and failure counters
+        self.telemetry = StationTelemetry(REQUEST_TIMEOUT)
+        # stops polling an unreachable station, probes it with growing backoff
+        self.breaker = CircuitBreaker(
+            base=max(float(self.scan_interval), BREAKER_MIN_BACKOFF),
+            maximum=BREAKER_MAX_BACKOFF,
+            threshold=BREAKER_THRESHOLD,
+        )
+
+        # raw payloads appended to a rotating file, for offline replay
+        self.capture = (
+            PayloadCapture(
+                hass.config.path(DOMAIN, "capture", f"{slugify(f'{self.host}_{self.port}')}.jsonl"),
+                CAPTURE_MAX_BYTES,
+                CAPTURE_BACKUPS,
+                CAPTURE_FLUSH_LINES,
+                CAPTURE_FLUSH_INTERVAL,
+            )
+            if entry.options.get(CONF_CAPTURE, DEFAULT_CAPTURE)
+            else None
+        )
+        # the last queued capture write; each one waits for the one before,
+        # so batches reach the file in order
+        self._capture_write: asyncio.Task[None] | None = None
+
+        # set by weatherduino.profile for the cycles it times
+        self.profiler: CycleProfiler | None = None
+
+        # value key -> listeners of entities showing that key
+        self._key_listeners: dict[object, list[CALLBACK_TYPE]] = {}
+        # keys changed by the last update; None means notify everyone
+        self._changed_keys: set[str] | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}-{self.host}",
-            update_interval=timedelta(seconds=self.scan_interval),
+            update_interval=None,
         )
 
     @property
     def device_model(self) -> str:
-        return {
-            "4pro": "WeatherDuino 4Pro",
-            "weatherdisplay": "WeatherDuino WeatherDisplay",
-            "aqm2": "WeatherDuino 2Pro Air Quality",
-            "aqm3": "WeatherDuino Air Quality Monitor 3",
-        }.get(self.device_type, "WeatherDuino")
+        return DEVICE_MODELS.get(self.device_type, "WeatherDuino")
 
     @property
     def configuration_url(self) -> str | None:
@@ -112,20 +283,492 @@ class WeatherDuinoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return f"{base}/weather"
         return None
 
+    async def async_load_device_cache(self) -> bool:
+        """Restore device type, id and payload keys of the last run.
+
+        Returns False when nothing is cached yet (first setup).
+        """
+        cached = await self._device_store.async_load()
+        if not cached or not cached.get("keys"):
+            return False
+        self.device_type = (
+            cached.get("device_type", "unknown")
+            if self.forced_device_type == "auto"
+            else self.forced_device_type
+        )
+        self.device_id = cached.get("device_id")
+        self.payload_keys = frozenset(cached["keys"])
+        return True
+
+    def _device_cache(self) -> dict[str, Any]:
+        return {
+            "device_type": self.device_type,
+            "device_id": self.device_id,
+            "keys": sorted(self.payload_keys),
+        }
+
+    @property
+    def wind_mode(self) -> bool:
+        """High-frequency wind sampling is on and the station is a 4Pro."""
+        return self._wind is not None and resolve_device_type(self.device_type, self.payload_keys) == "4pro"
+
+    def next_poll_delay(self) -> float:
+        """Seconds until the next scheduled poll."""
+        if self.wind_mode:
+            return float(self.wind_sample_interval)
+        return float(self.scan_interval)
+
+    def next_poll_time(self, due: float, now: float) -> float:
+        """Loop time of the next poll after the one planned for ``due``."""
+        if self._cadence is not None and self._cadence.cadence is not None and not self.wind_mode:
+            planned = now + self._cadence.next_delay(time.time())
+        else:
+            planned = due + self.next_poll_delay()
+        # an open breaker holds polls back until its backoff has passed
+        if self.breaker.state == OPEN and self.breaker.retry_at is not None:
+            return max(planned, self.breaker.retry_at)
+        return planned
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for updates; ``context`` is the value key the entity shows."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        listeners = self._key_listeners.setdefault(context, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove() -> None:
+            remove_listener()
+            listeners.remove(update_callback)
+            if not listeners:
+                self._key_listeners.pop(context, None)
+
+        return remove
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Only wake the entities whose value key changed."""
+        changed = self._changed_keys
+        self._changed_keys = None
+        if changed is None:
+            super().async_update_listeners()
+            woken = len(self._listeners)
+        else:
+            # listeners without a key (e.g. other integrations) always run
+            callbacks = list(self._key_listeners.get(None, ()))
+            for key in changed:
+                callbacks.extend(self._key_listeners.get(key, ()))
+            for update_callback in callbacks:
+                update_callback()
+            woken = len(callbacks)
+        if self.profiler is not None:
+            # entity state writes: native_value, attributes, state machine
+            self.profiler.count_entity_updates(woken)
+            self.profiler.lap("entities")
+
+    def _lap(self, stage: str) -> None:
+        if self.profiler is not None:
+            self.profiler.lap(stage)
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh; one update cycle for a running ``weatherduino.profile``."""
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin()
+        previous = self.last_exception
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            if profiler is not None:
+                profiler.end()
+        # every failed update sets a new exception; a skipped refresh keeps the old one
+        if not self.last_update_success and self.last_exception is not previous:
+            self._record_failure()
+
+    def _station_values(self) -> dict[str, Any]:
+        """Values the coordinator provides itself, next to the payload."""
+        values: dict[str, Any] = {}
+        if self.poll_lag is not None:
+            values["poll_lag"] = round(self.poll_lag, 1)
+        total = self.payload_unchanged + self.payload_changed
+        if total:
+            values["payload_unchanged_ratio"] = round(100 * self.payload_unchanged / total)
+        values.update(self._telemetry_values())
+        return values
+
+    def _telemetry_values(self) -> dict[str, Any]:
+        telemetry = self.telemetry
+        values: dict[str, Any] = {"consecutive_failures": telemetry.consecutive_failures}
+        if telemetry.last_fetch is not None:
+            values["fetch_latency"] = round(telemetry.last_fetch * 1000)
+        if telemetry.decode_time is not None:
+            values["decode_time"] = round(telemetry.decode_time * 1000, 2)
+        if telemetry.payload_bytes is not None:
+            values["payload_bytes"] = telemetry.payload_bytes
+        if telemetry.last_success is not None:
+            values["last_success"] = dt_util.utc_from_timestamp(telemetry.last_success)
+        values["breaker_state"] = self.breaker.state
+        return values
+
+    @callback
+    def _record_failure(self) -> None:
+        """Count a failed update; keep the telemetry sensors current while failing."""
+        error = str(self.last_exception) if self.last_exception is not None else None
+        self.telemetry.record_failure(time.time(), error)
+        self.values = {**self.values, **self._telemetry_values()}
+        # the base class only notifies on the first failure in a row, and
+        # before the counters above were updated
+        for key in ("consecutive_failures", "fetch_latency", "breaker_state"):
+            for update_callback in list(self._key_listeners.get(key, ())):
+                update_callback()
+
+    def _hold_volatile(self, station: dict[str, Any]) -> None:
+        """Keep the published telemetry that did not move enough to be worth a state write."""
+        published = self.values
+        for key, band in TELEMETRY_DEADBANDS.items():
+            old = published.get(key)
+            new = station.get(key)
+            if old is not None and new is not None and abs(new - old) < band:
+                station[key] = old
+        # the time of the last success only matters when it ends a failure
+        if "last_success" in published and self.last_update_success:
+            station["last_success"] = published["last_success"]
+
+    def _publish(self, decoded: dict[str, Any]) -> None:
+        station = self._station_values()
+        self._hold_volatile(station)
+        decoded.update(station)
+        self.values, changed = diff_values(self.values, decoded, self._deadbands)
+
+        # entities were unavailable after a failed update, wake all of them
+        self._changed_keys = changed if self.last_update_success else None
+
+    def _aggregate_wind(self, sample: dict[str, Any], out: dict[str, Any], now: float) -> bool:
+        """Fold a wind sample in; False while the next publish is not due yet.
+
+        When it is due, the aggregated wind of the interval goes into ``out``.
+        """
+        if not self.wind_mode:
+            return True
+        self._wind.add(sample)
+        published = self._wind_published
+        if published is not None and now - published < self.scan_interval - self.wind_sample_interval / 2:
+            return False
+        self._wind_published = now
+        out.update(self._wind.aggregate())
+        return True
+
+    def _derive(self, dtype: str, decoded: dict[str, Any], now: float) -> None:
+        """Add the derived values: meteorology (4Pro), air quality indices (AQM)."""
+        if dtype == "4pro":
+            if self._meteo is None:
+                self._meteo = DerivedMeteo()
+            decoded.update(self._meteo.update(now, decoded))
+        elif dtype in AQI_INPUTS:
+            if self._aqi is None:
+                self._aqi = AirQualityIndex(*AQI_INPUTS[dtype])
+            decoded.update(self._aqi.update(now, decoded))
+
+    async def _async_track_rain(self, dtype: str, decoded: dict[str, Any]) -> None:
+        """Book the Rtd counter into the rain ledger and publish its totals."""
+        counter = decoded.get("Rtd")
+        if dtype != "4pro" or not isinstance(counter, float):
+            return
+        if self._rain is None:
+            self._rain = RainLedger(await self._rain_store.async_load())
+        self._rain.update(dt_util.now(), counter)
+        decoded.update(self._rain.totals())
+        self._rain_store.async_delay_save(self._rain.as_dict, STORAGE_SAVE_DELAY)
+
+    async def _async_record_history(self, dtype: str, decoded: dict[str, Any], now: float) -> None:
+        """Add a sample to the history and publish the statistics in use."""
+        if self.history_hours <= 0 or dtype not in STATISTICS_KEYS:
+            return
+
+        if self.history is None:
+            fields = STATISTICS_KEYS[dtype]
+            # one slot per scan interval: faster polls (adaptive, wind
+            # sampling) replace the newest slot instead of shortening the span
+            spacing = float(max(self.scan_interval, 1))
+            capacity = max(2, int(self.history_hours * 3600 / spacing))
+            if self.history_persist:
+                path = self.hass.config.path(DOMAIN, f"{self.entry.entry_id}.ring")
+                self.history = await self.hass.async_add_executor_job(
+                    open_ring, path, fields, capacity, spacing
+                )
+                self._history_synced = now
+            else:
+                self.history = SampleRing(fields, capacity, spacing)
+            self._statistic_keys = {
+                statistic_key(field, stat, window): (field, stat, window)
+                for field in fields
+                for window in self.statistics_windows
+                for stat in STATISTICS
+            }
+
+        self.history.append(now, decoded)
+        if self.history.persistent and now - self._history_synced >= HISTORY_SYNC_INTERVAL:
+            # the file is only written here, in batches, off the event loop
+            self._history_synced = now
+            await self.hass.async_add_executor_job(self.history.sync, self.history.pending())
+
+        # only read what enabled entities show, once per field and window;
+        # the windows are running aggregates, created when first needed
+        computed: dict[tuple[str, int], Any] = {}
+        for key, (field, stat, window) in self._statistic_keys.items():
+            if key not in self._key_listeners:
+                continue
+            if (field, window) not in computed:
+                computed[(field, window)] = self.history.window(field, window * 60).stats(now)
+            stats = computed[(field, window)]
+            if stats is not None:
+                decoded[key] = round(getattr(stats, stat), 2)
+
+    async def async_shutdown(self) -> None:
+        """Release the connection, save the rain ledger and close the history."""
+        await super().async_shutdown()
+        if self.connection is not None and not self._connection_released:
+            self._connection_released = True
+            await self._connections.async_release(self.connection)
+        if self.capture is not None:
+            # the lines still buffered, after every write already queued
+            await self._flush_capture(self.capture)
+        if self._rain is not None:
+            await self._rain_store.async_save(self._rain.as_dict())
+        if self.history is not None:
+            history, self.history = self.history, None
+            await self.hass.async_add_executor_job(history.close)
+
+    def _capture(self, record: CaptureRecord) -> None:
+        if self.capture is not None and self.capture.add(record):
+            self._flush_capture(self.capture)
+
+    def _flush_capture(self, capture: PayloadCapture) -> asyncio.Task[None]:
+        """Queue a write of the buffered capture lines behind the previous one."""
+        self._capture_write = self.hass.async_create_task(
+            self._async_write_capture(capture, self._capture_write, capture.take()),
+            f"{self.name} capture write",
+        )
+        return self._capture_write
+
+    async def _async_write_capture(
+        self, capture: PayloadCapture, previous: asyncio.Task[None] | None, lines: list[str]
+    ) -> None:
+        if previous is not None:
+            await previous
+        try:
+            await self.hass.async_add_executor_job(capture.write, lines)
+        except OSError as err:
+            # these lines are lost, later batches are still written
+            _LOGGER.warning("Could not write the payload capture %s: %s", capture.path, err)
+
+    def _observe_sample(self, values: dict[str, Any]) -> None:
+        if self._cadence is not None and isinstance(sample := values.get("ts"), datetime):
+            self._cadence.observe(sample.timestamp(), time.time())
+
+    async def _async_get_main(self, headers: dict[str, str]) -> DeviceResponse:
+        started = time.perf_counter()
+        try:
+            return await self.connection.async_get(self.path, headers)
+        finally:
+            self.telemetry.record_fetch(time.perf_counter() - started)
+
+    async def _async_get_extra(self, extra: ExtraPath) -> bool:
+        """Fetch one additional path; True if its payload changed.
+
+        Failures are logged and keep the last good payload of the path: the
+        main path alone decides whether an update failed.
+        """
+        try:
+            resp = await self.connection.async_get(extra.path)
+            data, _ = parse_payload(resp.body)
+        except (ClientError, OSError, TimeoutError, PayloadError) as err:
+            _LOGGER.debug("Error fetching %s%s: %s", self.connection.base_url, extra.path, err)
+            return extra.fetched(self.hass.loop.time(), None, None)
+        changed = extra.fetched(self.hass.loop.time(), resp.body, data)
+        if changed:
+            self._capture(CaptureRecord(time.time(), extra.path, resp.body))
+        return changed
+
+    async def _async_fetch(
+        self, headers: dict[str, str], due: list[ExtraPath]
+    ) -> tuple[DeviceResponse, list[bool]]:
+        """Fetch the main path and the due additional paths.
+
+        When the main path fails, the additional paths still waiting for the
+        device are cancelled: the update fails anyway.
+        """
+        if not due:
+            return await self._async_get_main(headers), []
+        # created before the main request starts, but only run once it holds
+        # the device's gate, so they queue up right behind it
+        tasks = [asyncio.create_task(self._async_get_extra(extra)) for extra in due]
+        try:
+            resp = await self._async_get_main(headers)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return resp, list(await asyncio.gather(*tasks))
+
     async def _async_update_data(self) -> dict[str, Any]:
-        session = async_get_clientsession(self.hass)
+        if self.connection is None:
+            # push mode (e.g. a manual entity update): nothing to poll
+            return self.data or {}
+
+        headers: dict[str, str] = {}
+        if self._etag is not None:
+            headers[IF_NONE_MATCH] = self._etag
+        if self._last_modified is not None:
+            headers[IF_MODIFIED_SINCE] = self._last_modified
+
+        breaker = self.breaker
+        if not breaker.allow(self.hass.loop.time()):
+            self._changed_keys = None
+            raise UpdateFailed(
+                f"{self.host} is not answering, next attempt in "
+                f"{breaker.retry_at - self.hass.loop.time():.0f} s"
+            )
 
         try:
-            async with session.get(self.url, timeout=10) as resp:
-                resp.raise_for_status()
-                data = await resp.json(content_type=None)
-        except (ClientError, TimeoutError, ValueError) as err:
+            async with self.scheduler.slot(self):
+                self._lap("slot")
+                if breaker.state == HALF_OPEN:
+                    # cheap check first: only connect, no request
+                    await self.connection.async_probe()
+                # timed inside the slot: waiting for a free slot is poll lag,
+                # waiting for the device's gate counts as fetch latency.
+                # The due additional paths go out at the same time; the
+                # device's gate sends them one after the other on its
+                # kept-alive connection, right behind the main path.
+                now = self.hass.loop.time()
+                resp, extras = await self._async_fetch(
+                    headers, [extra for extra in self.extra_paths if extra.is_due(now)]
+                )
+                self._lap("fetch")
+        except (ClientError, OSError, TimeoutError) as err:
+            self._changed_keys = None
+            breaker.failure(self.hass.loop.time())
+            self._capture(CaptureRecord(time.time(), error=str(err) or type(err).__name__))
             raise UpdateFailed(f"Error fetching WeatherDuino JSON: {err}") from err
+        if breaker.state != CLOSED:
+            _LOGGER.debug("%s answers again, closing the circuit breaker", self.host)
+        breaker.success()
+        not_modified = resp.status == HTTPStatus.NOT_MODIFIED
+        extras_changed = any(extras)
+        body = resp.body
+        etag = resp.etag
+        last_modified = resp.last_modified
+        if not_modified:
+            # only an additional path may have changed: reuse the main payload
+            body, etag, last_modified = self._last_body, self._etag, self._last_modified
+        else:
+            self.telemetry.record_payload(len(body))
+
+        if self.capture is not None:
+            self._capture(CaptureRecord(time.time(), self.path, body))
+
+        # same bytes as last time: nothing to parse, detect or decode, but
+        # time moves on for the wind average, rain hours, windows and statistics
+        if self.data is not None and not extras_changed and (not_modified or body == self._last_body):
+            self.payload_unchanged += 1
+            dtype = resolve_device_type(self.device_type, self.payload_keys)
+            await self._async_update_sample(dtype, dict(self._decoded))
+            return self.data
 
-        detected = _detect_device_type(data)
+        started = time.perf_counter()
+        try:
+            data, repaired = parse_payload(body)
+        except PayloadError as err:
+            self._changed_keys = None
+            raise UpdateFailed(f"Error fetching WeatherDuino JSON: {err}") from err
+        if repaired:
+            _LOGGER.debug("Repaired malformed JSON from %s, kept keys: %s", self.url, list(data))
+        self._lap("parse")
+
+        self._last_body = body
+        self._etag = etag
+        self._last_modified = last_modified
+        data = merge_payloads(data, self.extra_paths)
+        await self._async_process(data, started)
+        return data
+
+    async def async_push(self, data: dict[str, Any], size: int) -> None:
+        """Take an uploaded payload (push mode) through the normal data path."""
+        started = time.perf_counter()
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin()
+        try:
+            self.telemetry.record_payload(size)
+            if self.capture is not None:
+                self._capture(CaptureRecord(time.time(), body=json.dumps(data).encode(), push=True))
+            # uploads are always mapped onto 4Pro keys: no detection
+            await self._async_process(data, started, detected="4pro")
+            self.async_set_updated_data(data)
+        finally:
+            if profiler is not None:
+                profiler.end()
+
+    async def _async_process(
+        self, data: dict[str, Any], started: float, detected: DeviceType | None = None
+    ) -> None:
+        """Detect (unless ``detected`` is known), decode, derive and publish a new payload."""
+        self.payload_changed += 1
+        device = (self.device_type, self.device_id)
+        if detected is None:
+            detected = detect_device_type(data)
         self.device_type = (
             detected if self.forced_device_type == "auto" else self.forced_device_type
         )
 
         self.device_id = data.get("ID", self.host)
-        return data
+
+        # compared per new payload only; the set is rebuilt when it changed
+        keys_changed = data.keys() != self.payload_keys
+        added = keys_changed and not data.keys() <= self.payload_keys
+        if keys_changed or (self.device_type, self.device_id) != device:
+            self.payload_keys = frozenset(data)
+            self._device_store.async_delay_save(self._device_cache, STORAGE_SAVE_DELAY)
+        self._lap("detect")
+
+        dtype = resolve_device_type(self.device_type, data)
+        plan = DECODE_PLANS.get(dtype)
+        decoded = plan.decode(data) if plan is not None else {}
+        self.telemetry.record_decode(time.perf_counter() - started)
+        self._lap("decode")
+        self._decoded = decoded
+        if not await self._async_update_sample(dtype, dict(decoded), keys_changed):
+            return
+        if keys_changed:
+            # sensors come and go with their keys: wake every entity once
+            self._changed_keys = None
+        if added:
+            async_dispatcher_send(self.hass, SIGNAL_NEW_KEYS.format(self.entry.entry_id))
+
+    async def _async_update_sample(
+        self, dtype: str, decoded: dict[str, Any], keys_changed: bool = False
+    ) -> bool:
+        """Derive, book and publish a decoded sample; False if nothing was published."""
+        self._observe_sample(decoded)
+        now = time.time()
+        self.telemetry.record_success(now)
+        if not self._aggregate_wind(decoded, decoded, now) and not keys_changed:
+            # between two publishes of the wind mode: keep the sample, write nothing
+            self._changed_keys = set()
+            return False
+        self._derive(dtype, decoded, now)
+        self._lap("derive")
+        await self._async_track_rain(dtype, decoded)
+        self._lap("rain")
+        await self._async_record_history(dtype, decoded, now)
+        self._lap("history")
+        if self.long_term is not None:
+            await self.long_term.async_add(dtype, decoded, now)
+            self._lap("statistics")
+        self._publish(decoded)
+        self._lap("publish")
+        return True
@@ -0,0 +1,207 @@
+"""Payload decoding for WeatherDuino JSON.
+
+Every sensor key is bound to a small converter (``div10``, ``raw_int`` ...).
+Instead of letting each entity run its converter against the raw payload on
+every state read, the converters of one device type are compiled into a
+``DecodePlan`` which turns the raw dict into a typed value table in a single
+pass. Entities then only do a dict lookup.
+
+This module has no Home Assistant imports on purpose, so it can be used from
+the benchmarks without a running instance.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Literal, Mapping
+
+DeviceType = Literal["auto", "4pro", "weatherdisplay", "aqm2", "aqm3", "unknown"]
+
+
+# ---------- device detection ----------
+
+def _has_any(data: Mapping[str, Any], keys: list[str]) -> bool:
+    return any(k in data for k in keys)
+
+
+def detect_device_type(data: Mapping[str, Any]) -> DeviceType:
+    """Device type of a raw payload, from the keys it carries."""
+    if _has_any(data, ["Wsp", "Wgs", "Wdir", "Rtd", "Rfr"]):
+        return "4pro"
+    if _has_any(data, ["PM25_last", "PM25_24H", "ts"]):
+        return "aqm3"
+    if _has_any(data, ["PM25AQI", "PM100AQI", "AVG_M"]):
+        return "aqm2"
+    if "T" in data and "H" in data:
+        return "weatherdisplay"
+    return "unknown"
+
+
+# ---------- helpers ----------
+
+def _to_number(v: Any) -> float | None:
+    if v is None:
+        return None
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, str):
+        s = v.strip().replace(",", ".")
+        try:
+            return float(s)
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass(frozen=True)
+class WDValue:
+    """Binds a payload key to a converter for its raw value.
+
+    ``target`` is the key the converted value is stored under in the value
+    table; it defaults to ``key``.
+    """
+
+    key: str
+    convert: Callable[[Any], Any]
+    target: str | None = None
+
+    def fn(self, data: Mapping[str, Any]) -> Any:
+        """Convert the value of ``key`` from a raw payload."""
+        return self.convert(data.get(self.key))
+
+
+def _div10(raw: Any) -> float | None:
+    n = _to_number(raw)
+    return n / 10 if n is not None else None
+
+
+def _epoch(raw: Any) -> datetime | None:
+    n = _to_number(raw)
+    return datetime.fromtimestamp(n, tz=timezone.utc) if n is not None else None
+
+
+def _raw_int(raw: Any) -> Any:
+    n = _to_number(raw)
+    if n is None:
+        return raw
+    return int(round(n))
+
+
+def div10(key: str) -> WDValue:
+    return WDValue(key, _div10)
+
+
+def num(key: str) -> WDValue:
+    return WDValue(key, _to_number)
+
+
+def epoch(key: str) -> WDValue:
+    return WDValue(key, _epoch)
+
+
+def raw_int(key: str) -> WDValue:
+    """Return numeric if possible and cast to int (e.g. for CO2, Wdir, TID)."""
+    return WDValue(key, _raw_int)
+
+
+AQ_AVGMODES = {
+    1: "1 hour",
+    2: "3 hours",
+    3: "nowcast 12h",
+    4: "24 hours",
+}
+
+
+def aq_avgmode_value() -> WDValue:
+    """
+    AQM2: AVG_M is AQ_AVGMODE:
+      1= 1 Hour Average
+      2= 3 Hours Average
+      3= Nowcast 12H
+      4= 24 Hours Average
+    """
+
+    def _fn(raw: Any) -> Any:
+        n = _to_number(raw)
+        if n is None:
+            return None
+        code = int(round(n))
+        return AQ_AVGMODES.get(code, f"unknown ({code})")
+
+    return WDValue("AVG_M", _fn)
+
+
+def aq_avgmode_code() -> WDValue:
+    """Numeric AVG_M code, exposed as the ``mode_code`` attribute."""
+    return WDValue("AVG_M", _raw_int, target="AVG_M_code")
+
+
+# ---------- decode plan ----------
+
+class DecodePlan:
+    """All converters of one device type, applied in one pass."""
+
+    __slots__ = ("_steps", "keys")
+
+    def __init__(self, values: Iterable[WDValue]) -> None:
+        steps: dict[str, tuple[str, Callable[[Any], Any]]] = {}
+        for wd in values:
+            # first definition wins, like the entity tables do
+            steps.setdefault(wd.target or wd.key, (wd.key, wd.convert))
+        self._steps = tuple((key, target, convert) for target, (key, convert) in steps.items())
+        self.keys: frozenset[str] = frozenset(key for key, _, _ in self._steps)
+
+    def decode(self, data: Mapping[str, Any]) -> dict[str, Any]:
+        """Return ``{key: converted value}`` for every planned key in ``data``."""
+        out: dict[str, Any] = {}
+        get = data.get
+        for key, target, convert in self._steps:
+            raw = get(key)
+            if raw is None and key not in data:
+                continue
+            out[target] = convert(raw)
+        return out
+
+
+# ---------- publishing ----------
+
+_MISSING = object()
+# float noise of one-decimal readings, not a real change
+_EPSILON = 1e-9
+
+
+def diff_values(
+    published: Mapping[str, Any],
+    decoded: Mapping[str, Any],
+    deadbands: Mapping[str, float],
+) -> tuple[dict[str, Any], set[str]]:
+    """Merge a freshly decoded table into the published one.
+
+    Returns the new published table and the keys whose value changed. A
+    numeric value that moved less than its deadband keeps the previously
+    published value and does not count as a change.
+    """
+    out: dict[str, Any] = {}
+    changed: set[str] = set()
+    for key, value in decoded.items():
+        old = published.get(key, _MISSING)
+        if old is not _MISSING:
+            if value == old:
+                out[key] = old
+                continue
+            band = deadbands.get(key)
+            if (
+                band
+                and isinstance(value, float)
+                and isinstance(old, float)
+                # a change of exactly the deadband (0.2 on 0.1 steps) is published
+                and abs(value - old) < band - _EPSILON
+            ):
+                out[key] = old
+                continue
+        out[key] = value
+        changed.add(key)
+    for key in published:
+        if key not in out:
+            changed.add(key)
+    return out, changed
@@ -0,0 +1,292 @@
+"""Entity descriptions for all supported WeatherDuino device types.
+
+Each table pairs a ``SensorEntityDescription`` with the ``WDValue`` that
+converts its raw payload value. The tables are compiled into one
+``DecodePlan`` per device type, which the coordinator runs once per poll.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Collection
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfInformation,
+    UnitOfLength,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfTime,
+    UnitOfVolumetricFlux,
+    CONCENTRATION_PARTS_PER_MILLION,
+)
+from homeassistant.helpers.entity import EntityCategory
+
+from .breaker import STATES as BREAKER_STATES
+from .decode import (
+    DecodePlan,
+    WDValue,
+    aq_avgmode_code,
+    aq_avgmode_value,
+    div10,
+    epoch,
+    raw_int,
+)
+from .history import STATISTICS, statistic_key
+
+SensorDefs = tuple[tuple[SensorEntityDescription, WDValue], ...]
+
+
+# ---------- sensor definitions ----------
+
+PREC2 = 2
+
+SENSORS_4PRO = (
+    (SensorEntityDescription(key="Tin", name="Inside Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("Tin")),
+    (SensorEntityDescription(key="Hin", name="Inside Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("Hin")),
+    (SensorEntityDescription(key="Tout", name="Outside Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("Tout")),
+    (SensorEntityDescription(key="Hout", name="Outside Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("Hout")),
+    (SensorEntityDescription(key="P", name="Pressure", device_class=SensorDeviceClass.PRESSURE, native_unit_of_measurement=UnitOfPressure.HPA, suggested_display_precision=PREC2, icon="mdi:gauge"), div10("P")),
+
+    (SensorEntityDescription(key="Wsp", name="Wind Speed", device_class=SensorDeviceClass.WIND_SPEED, native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND, suggested_display_precision=PREC2, icon="mdi:weather-windy"), div10("Wsp")),
+    (SensorEntityDescription(key="Wgs", name="Wind Gust", device_class=SensorDeviceClass.WIND_SPEED, native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND, suggested_display_precision=PREC2, icon="mdi:weather-windy-variant"), div10("Wgs")),
+    (SensorEntityDescription(key="Wdir", name="Wind Direction", native_unit_of_measurement="°", suggested_display_precision=0, icon="mdi:compass-outline"), raw_int("Wdir")),
+
+    (SensorEntityDescription(key="Rtd", name="Rain Today", native_unit_of_measurement=UnitOfLength.MILLIMETERS, suggested_display_precision=PREC2, icon="mdi:cup-water"), div10("Rtd")),
+    (SensorEntityDescription(key="Rfr", name="Rain Rate", native_unit_of_measurement=UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR, suggested_display_precision=PREC2, icon="mdi:weather-pouring"), div10("Rfr")),
+
+    (SensorEntityDescription(key="SR", name="Solar Radiation", device_class=SensorDeviceClass.IRRADIANCE, native_unit_of_measurement="W/m²", suggested_display_precision=0, icon="mdi:white-balance-sunny"), raw_int("SR")),
+    (SensorEntityDescription(key="UV", name="UV Index", suggested_display_precision=0, icon="mdi:sun-wireless"), raw_int("UV")),
+
+    (SensorEntityDescription(key="C02", name="CO2", native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION, suggested_display_precision=0, icon="mdi:molecule-co2"), raw_int("C02")),
+    (SensorEntityDescription(key="PM25", name="PM2.5", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25")),
+    (SensorEntityDescription(key="PM100", name="PM10", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100")),
+    (SensorEntityDescription(key="AQI", name="Air Quality Index", suggested_display_precision=0, icon="mdi:airballoon-outline"), raw_int("AQI")),
+
+    (SensorEntityDescription(key="ES1T", name="Extra Sensor 1 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("ES1T")),
+    (SensorEntityDescription(key="ES1H", name="Extra Sensor 1 Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("ES1H")),
+    (SensorEntityDescription(key="ES2T", name="Extra Sensor 2 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("ES2T")),
+    (SensorEntityDescription(key="ES2H", name="Extra Sensor 2 Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("ES2H")),
+    (SensorEntityDescription(key="ES3T", name="Extra Sensor 3 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("ES3T")),
+    (SensorEntityDescription(key="ES3H", name="Extra Sensor 3 Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("ES3H")),
+    (SensorEntityDescription(key="ES4T", name="Extra Sensor 4 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("ES4T")),
+    (SensorEntityDescription(key="ES4H", name="Extra Sensor 4 Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("ES4H")),
+
+    (SensorEntityDescription(key="So1T", name="Soil 1 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer-lines"), div10("So1T")),
+    (SensorEntityDescription(key="So1M", name="Soil 1 Moisture", native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:sprout"), div10("So1M")),
+    (SensorEntityDescription(key="So2T", name="Soil 2 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer-lines"), div10("So2T")),
+    (SensorEntityDescription(key="So2M", name="Soil 2 Moisture", native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:sprout"), div10("So2M")),
+
+    (SensorEntityDescription(key="ts", name="Last Update", device_class=SensorDeviceClass.TIMESTAMP, entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:clock-outline"), epoch("ts")),
+    (SensorEntityDescription(key="TID", name="Device Type", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:information-outline"), raw_int("TID")),
+)
+
+SENSORS_WEATHERDISPLAY = (
+    (SensorEntityDescription(key="T", name="Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("T")),
+    (SensorEntityDescription(key="H", name="Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("H")),
+    (SensorEntityDescription(key="TID", name="Device Type", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:information-outline"), raw_int("TID")),
+)
+
+SENSORS_AQM3 = (
+    (SensorEntityDescription(key="T", name="Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("T")),
+    (SensorEntityDescription(key="H", name="Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("H")),
+    (SensorEntityDescription(key="P", name="Pressure", device_class=SensorDeviceClass.PRESSURE, native_unit_of_measurement=UnitOfPressure.HPA, suggested_display_precision=PREC2, icon="mdi:gauge"), div10("P")),
+
+    (SensorEntityDescription(key="PM25_last", name="PM2.5 Last", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_last")),
+    (SensorEntityDescription(key="PM100_last", name="PM10 Last", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_last")),
+    (SensorEntityDescription(key="PM25_1H", name="PM2.5 1h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_1H")),
+    (SensorEntityDescription(key="PM100_1H", name="PM10 1h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_1H")),
+    (SensorEntityDescription(key="PM25_3H", name="PM2.5 3h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_3H")),
+    (SensorEntityDescription(key="PM100_3H", name="PM10 3h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_3H")),
+    (SensorEntityDescription(key="PM25_12H", name="PM2.5 12h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_12H")),
+    (SensorEntityDescription(key="PM100_12H", name="PM10 12h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_12H")),
+    (SensorEntityDescription(key="PM25_24H", name="PM2.5 24h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_24H")),
+    (SensorEntityDescription(key="PM100_24H", name="PM10 24h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_24H")),
+
+    (SensorEntityDescription(key="CO2", name="CO2", native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION, suggested_display_precision=0, icon="mdi:molecule-co2"), raw_int("CO2")),
+
+    (SensorEntityDescription(key="ts", name="Last Update", device_class=SensorDeviceClass.TIMESTAMP, entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:clock-outline"), epoch("ts")),
+    (SensorEntityDescription(key="TID", name="Device Type", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:information-outline"), raw_int("TID")),
+)
+
+SENSORS_AQM2 = (
+    (SensorEntityDescription(key="T", name="Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("T")),
+    (SensorEntityDescription(key="H", name="Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("H")),
+
+    (SensorEntityDescription(key="PM25", name="PM2.5", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25")),
+    (SensorEntityDescription(key="PM100", name="PM10", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100")),
+
+    (SensorEntityDescription(key="PM25AQI", name="PM2.5 AQI", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=PREC2, icon="mdi:airballoon-outline"), div10("PM25AQI")),
+    (SensorEntityDescription(key="PM100AQI", name="PM10 AQI", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=PREC2, icon="mdi:airballoon-outline"), div10("PM100AQI")),
+
+    # renamed + value mapped to text
+    (SensorEntityDescription(key="AVG_M", name="AQ Average Mode", entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:chart-timeline-variant"), aq_avgmode_value()),
+
+    (SensorEntityDescription(key="CO2", name="CO2", native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION, suggested_display_precision=0, icon="mdi:molecule-co2"), raw_int("CO2")),
+    (SensorEntityDescription(key="TID", name="Device Type", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:information-outline"), raw_int("TID")),
+)
+
+
+# derived by the coordinator (meteo.py), with the payload keys they need
+SENSORS_4PRO_DERIVED = (
+    (SensorEntityDescription(key="dew_point", name="Dew Point", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer-water"), ("Tout", "Hout")),
+    (SensorEntityDescription(key="heat_index", name="Heat Index", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer-high"), ("Tout", "Hout")),
+    (SensorEntityDescription(key="wind_chill", name="Wind Chill", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:snowflake-thermometer"), ("Tout", "Wsp")),
+    (SensorEntityDescription(key="feels_like", name="Feels Like", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), ("Tout",)),
+    (SensorEntityDescription(key="wind_speed_avg_10m", name="Wind Speed 10 min Average", device_class=SensorDeviceClass.WIND_SPEED, native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND, suggested_display_precision=PREC2, icon="mdi:weather-windy"), ("Wsp",)),
+    (SensorEntityDescription(key="wind_gust_max_10m", name="Wind Gust 10 min Max", device_class=SensorDeviceClass.WIND_SPEED, native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND, suggested_display_precision=PREC2, icon="mdi:weather-windy-variant"), ("Wgs",)),
+    (SensorEntityDescription(key="pressure_tendency_3h", name="Pressure Tendency 3h", native_unit_of_measurement=UnitOfPressure.HPA, suggested_display_precision=PREC2, icon="mdi:trending-up"), ("P",)),
+
+    # rain ledger (rain.py); rolling windows go down again, only the season total only grows
+    (SensorEntityDescription(key="rain_hour", name="Rain This Hour", device_class=SensorDeviceClass.PRECIPITATION, state_class=SensorStateClass.MEASUREMENT, native_unit_of_measurement=UnitOfLength.MILLIMETERS, suggested_display_precision=PREC2, icon="mdi:cup-water"), ("Rtd",)),
+    (SensorEntityDescription(key="rain_24h", name="Rain Last 24h", device_class=SensorDeviceClass.PRECIPITATION, state_class=SensorStateClass.MEASUREMENT, native_unit_of_measurement=UnitOfLength.MILLIMETERS, suggested_display_precision=PREC2, icon="mdi:cup-water"), ("Rtd",)),
+    (SensorEntityDescription(key="rain_7d", name="Rain Last 7 Days", device_class=SensorDeviceClass.PRECIPITATION, state_class=SensorStateClass.MEASUREMENT, native_unit_of_measurement=UnitOfLength.MILLIMETERS, suggested_display_precision=PREC2, icon="mdi:cup-water"), ("Rtd",)),
+    (SensorEntityDescription(key="rain_season", name="Rain Season", device_class=SensorDeviceClass.PRECIPITATION, state_class=SensorStateClass.TOTAL_INCREASING, native_unit_of_measurement=UnitOfLength.MILLIMETERS, suggested_display_precision=PREC2, icon="mdi:weather-pouring"), ("Rtd",)),
+)
+
+
+def _aqi_sensors(pm25: str, pm10: str) -> tuple[tuple[SensorEntityDescription, tuple[str, ...]], ...]:
+    """Indices computed from the raw PM readings (aqi.py), with the keys they need."""
+    return (
+        (SensorEntityDescription(key="pm25_nowcast", name="PM2.5 NowCast", device_class=SensorDeviceClass.PM25, native_unit_of_measurement="µg/m³", suggested_display_precision=1, icon="mdi:air-filter"), (pm25,)),
+        (SensorEntityDescription(key="pm10_nowcast", name="PM10 NowCast", device_class=SensorDeviceClass.PM10, native_unit_of_measurement="µg/m³", suggested_display_precision=0, icon="mdi:air-filter"), (pm10,)),
+        (SensorEntityDescription(key="aqi_us", name="US AQI (NowCast)", device_class=SensorDeviceClass.AQI, suggested_display_precision=0, icon="mdi:airballoon-outline"), (pm25, pm10)),
+        (SensorEntityDescription(key="caqi", name="EU CAQI", device_class=SensorDeviceClass.AQI, suggested_display_precision=0, icon="mdi:airballoon-outline"), (pm25, pm10)),
+    )
+
+
+# PM2.5 / PM10 keys the indices are computed from, per device type
+AQI_INPUTS: dict[str, tuple[str, str]] = {
+    "aqm2": ("PM25", "PM100"),
+    "aqm3": ("PM25_last", "PM100_last"),
+}
+
+# sensors the coordinator derives from the payload, per device type
+DERIVED_BY_TYPE: dict[str, tuple[tuple[SensorEntityDescription, tuple[str, ...]], ...]] = {
+    "4pro": SENSORS_4PRO_DERIVED,
+    **{dtype: _aqi_sensors(*keys) for dtype, keys in AQI_INPUTS.items()},
+}
+
+# values provided by the coordinator itself, for every device type
+SENSORS_STATION = (
+    SensorEntityDescription(key="poll_lag", name="Poll Lag", device_class=SensorDeviceClass.DURATION, native_unit_of_measurement=UnitOfTime.SECONDS, entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=1, icon="mdi:timer-sand"),
+    SensorEntityDescription(key="payload_unchanged_ratio", name="Unchanged Payloads", native_unit_of_measurement=PERCENTAGE, entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:content-duplicate"),
+)
+
+# request telemetry; these stay available while the station is failing
+SENSORS_TELEMETRY = (
+    SensorEntityDescription(key="fetch_latency", name="Fetch Latency", device_class=SensorDeviceClass.DURATION, native_unit_of_measurement=UnitOfTime.MILLISECONDS, entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:timer-outline"),
+    SensorEntityDescription(key="decode_time", name="Decode Time", device_class=SensorDeviceClass.DURATION, native_unit_of_measurement=UnitOfTime.MILLISECONDS, entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=2, entity_registry_enabled_default=False, icon="mdi:code-json"),
+    SensorEntityDescription(key="payload_bytes", name="Payload Size", device_class=SensorDeviceClass.DATA_SIZE, native_unit_of_measurement=UnitOfInformation.BYTES, entity_category=EntityCategory.DIAGNOSTIC, entity_registry_enabled_default=False, icon="mdi:file-code-outline"),
+    SensorEntityDescription(key="consecutive_failures", name="Consecutive Failures", entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:lan-disconnect"),
+    SensorEntityDescription(key="last_success", name="Last Successful Poll", device_class=SensorDeviceClass.TIMESTAMP, entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:clock-check-outline"),
+    SensorEntityDescription(key="breaker_state", name="Circuit Breaker", device_class=SensorDeviceClass.ENUM, options=list(BREAKER_STATES), entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:electric-switch"),
+)
+
+TELEMETRY_KEYS = frozenset(desc.key for desc in SENSORS_TELEMETRY)
+
+# station sensors that only mean something for a polled station, not in push mode
+POLLING_KEYS = frozenset(
+    {"poll_lag", "payload_unchanged_ratio", "fetch_latency", "consecutive_failures", "breaker_state"}
+)
+
+
+SENSORS_BY_TYPE: dict[str, SensorDefs] = {
+    "4pro": SENSORS_4PRO,
+    "weatherdisplay": SENSORS_WEATHERDISPLAY,
+    "aqm2": SENSORS_AQM2,
+    "aqm3": SENSORS_AQM3,
+}
+
+# values that only feed entity attributes, not entities of their own
+EXTRA_VALUES: dict[str, tuple[WDValue, ...]] = {
+    "aqm2": (aq_avgmode_code(),),
+}
+
+DECODE_PLANS: dict[str, DecodePlan] = {
+    dtype: DecodePlan(
+        [wd for _, wd in defs] + list(EXTRA_VALUES.get(dtype, ()))
+    )
+    for dtype, defs in SENSORS_BY_TYPE.items()
+}
+
+
+# measurement values that get a sample history and windowed statistics
+STATISTICS_KEYS: dict[str, tuple[str, ...]] = {
+    dtype: tuple(
+        desc.key
+        for desc, _ in defs
+        if desc.entity_category is None and desc.key not in ("Wdir",)
+    )
+    for dtype, defs in SENSORS_BY_TYPE.items()
+}
+
+_STAT_NAMES = {"min": "Min", "max": "Max", "mean": "Mean", "stddev": "Std Dev"}
+
+
+def statistics_descriptions(
+    defs: SensorDefs, keys: set[str], windows: tuple[int, ...]
+) -> list[SensorEntityDescription]:
+    """Windowed statistic sensors for the measurement ``keys`` of a table.
+
+    They are disabled by default, users enable the ones they need.
+    """
+    out: list[SensorEntityDescription] = []
+    for desc, _ in defs:
+        if desc.key not in keys:
+            continue
+        for window in windows:
+            for stat in STATISTICS:
+                out.append(
+                    replace(
+                        desc,
+                        key=statistic_key(desc.key, stat, window),
+                        name=f"{desc.name} {window} min {_STAT_NAMES[stat]}",
+                        # a spread is not a temperature reading etc.
+                        device_class=None if stat == "stddev" else desc.device_class,
+                        icon="mdi:chart-bell-curve" if stat == "stddev" else desc.icon,
+                        entity_registry_enabled_default=False,
+                    )
+                )
+    return out
+
+
+def _deadband_group(desc: SensorEntityDescription) -> str | None:
+    if desc.device_class == SensorDeviceClass.TEMPERATURE:
+        return "temperature"
+    if desc.device_class == SensorDeviceClass.HUMIDITY:
+        return "humidity"
+    if desc.device_class == SensorDeviceClass.PRESSURE:
+        return "pressure"
+    if desc.native_unit_of_measurement == "µg/m³":
+        return "particulate"
+    return None
+
+
+# value key -> deadband group, for keys that support a deadband
+DEADBAND_GROUPS: dict[str, str] = {
+    desc.key: group
+    for defs in (*SENSORS_BY_TYPE.values(), *DERIVED_BY_TYPE.values())
+    for desc, _ in defs
+    if (group := _deadband_group(desc)) is not None
+}
+
+
+def resolve_device_type(device_type: str, data: Collection[str]) -> str:
+    """Map ``unknown`` detections onto a sensor table by looking at the keys."""
+    if device_type in SENSORS_BY_TYPE:
+        return device_type
+    if "Tin" in data or "Wsp" in data:
+        return "4pro"
+    if "PM25_last" in data and "PM25_24H" in data:
+        return "aqm3"
+    if "PM25AQI" in data and "AVG_M" in data:
+        return "aqm2"
+    if "T" in data and "H" in data:
+        return "weatherdisplay"
+    return "unknown"
@@ -0,0 +1,56 @@
+"""Diagnostics download for WeatherDuino entries."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_PUSH_ID, DOMAIN
+from .coordinator import WeatherDuinoCoordinator
+
+# the push ID is the only thing guarding the unauthenticated push endpoint
+TO_REDACT = {CONF_HOST, CONF_PUSH_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    coordinator: WeatherDuinoCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "device": {
+            "device_type": coordinator.device_type,
+            "forced_device_type": coordinator.forced_device_type,
+            "device_id": coordinator.device_id,
+            "path": coordinator.path,
+            "extra_paths": [extra.as_dict() for extra in coordinator.extra_paths],
+        },
+        "polling": {
+            "scan_interval": coordinator.scan_interval,
+            "adaptive": coordinator.adaptive,
+            "poll_lag": coordinator.poll_lag,
+            "missed_polls": coordinator.scheduler.missed_polls(coordinator),
+            "last_update_success": coordinator.last_update_success,
+            "payload_unchanged": coordinator.payload_unchanged,
+            "payload_changed": coordinator.payload_changed,
+        },
+        "telemetry": coordinator.telemetry.as_dict(),
+        "connection": coordinator.connection.as_dict() if coordinator.connection is not None else None,
+        "breaker": {
+            "state": coordinator.breaker.state,
+            "failures": coordinator.breaker.failures,
+            "trips": coordinator.breaker.trips,
+            "backoff": round(coordinator.breaker.backoff, 1),
+        },
+        "long_term_statistics": (
+            coordinator.long_term.as_dict() if coordinator.long_term is not None else None
+        ),
+        "capture": coordinator.capture.as_dict() if coordinator.capture is not None else None,
+        "payload": coordinator.data,
+    }
@@ -0,0 +1,104 @@
+"""Subnet discovery of WeatherDuino devices for the config flow.
+
+Every address of the network gets one GET of the JSON path, at most
+``DISCOVERY_CONCURRENCY`` of them in flight and each with short timeouts,
+so a /24 takes a few seconds even though most addresses never answer.
+Responders whose body decodes to a payload of a known device type are
+returned, with that type.
+"""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import ipaddress
+import logging
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+
+from .const import (
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_CONNECT_TIMEOUT,
+    DISCOVERY_MAX_HOSTS,
+    DISCOVERY_TIMEOUT,
+    MAX_RESPONSE_BYTES,
+)
+from .decode import detect_device_type
+from .payload import PayloadError, parse_payload
+
+_LOGGER = logging.getLogger(__name__)
+
+_TIMEOUT = ClientTimeout(total=DISCOVERY_TIMEOUT, sock_connect=DISCOVERY_CONNECT_TIMEOUT)
+
+
+@dataclass(frozen=True)
+class DiscoveredDevice:
+    host: str
+    device_type: str
+    device_id: str | None = None
+
+
+def subnet_hosts(subnet: str) -> list[str]:
+    """Addresses to probe for ``subnet`` (``192.168.1.0/24`` or one address).
+
+    Raises ``ValueError`` for anything but an IPv4 network of at most
+    ``DISCOVERY_MAX_HOSTS`` addresses.
+    """
+    network = ipaddress.ip_network(subnet.strip(), strict=False)
+    if network.version != 4:
+        raise ValueError("only IPv4 networks can be scanned")
+    if network.num_addresses > DISCOVERY_MAX_HOSTS:
+        raise ValueError(f"{network} has more than {DISCOVERY_MAX_HOSTS} addresses")
+    if network.num_addresses <= 2:
+        # /31 and /32 have no network / broadcast address to leave out
+        return [str(address) for address in network]
+    return [str(address) for address in network.hosts()]
+
+
+async def _async_probe(
+    session: ClientSession, host: str, port: int, path: str
+) -> DiscoveredDevice | None:
+    base = f"http://{host}" if port == 80 else f"http://{host}:{port}"
+    try:
+        async with session.get(f"{base}{path}", allow_redirects=False) as resp:
+            if resp.status != 200:
+                return None
+            body = await resp.content.read(MAX_RESPONSE_BYTES + 1)
+    except (ClientError, OSError, TimeoutError):
+        return None
+    if len(body) > MAX_RESPONSE_BYTES:
+        return None
+    try:
+        data, _ = parse_payload(body)
+    except PayloadError:
+        return None
+    device_type = detect_device_type(data)
+    if device_type == "unknown":
+        return None
+    device_id = data.get("ID")
+    return DiscoveredDevice(host, device_type, str(device_id) if device_id is not None else None)
+
+
+async def async_scan(hosts: list[str], port: int, path: str) -> list[DiscoveredDevice]:
+    """Probe ``hosts`` concurrently; returns the WeatherDuino devices found."""
+    # the semaphore (not only the connector limit) bounds the probes, so the
+    # timeout of a probe starts when it is sent, not while it is queued
+    gate = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+    connector = TCPConnector(limit=DISCOVERY_CONCURRENCY, force_close=True)
+
+    async with ClientSession(connector=connector, timeout=_TIMEOUT) as session:
+
+        async def probe(host: str) -> DiscoveredDevice | None:
+            async with gate:
+                return await _async_probe(session, host, port, path)
+
+        started = asyncio.get_running_loop().time()
+        results = await asyncio.gather(*(probe(host) for host in hosts))
+
+    found = [device for device in results if device is not None]
+    _LOGGER.debug(
+        "Probed %d addresses in %.1f s, found %d WeatherDuino devices",
+        len(hosts),
+        asyncio.get_running_loop().time() - started,
+        len(found),
+    )
+    return found
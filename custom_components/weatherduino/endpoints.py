@@ -0,0 +1,88 @@
+"""Additional JSON paths fetched next to the main path of an entry.
+
+Configured as ``/path`` or ``/path=seconds``, comma separated. A path
+without an interval is fetched with every poll, otherwise at most once per
+interval; its last good payload is merged into every update in between, so
+slow-changing pages cost one request every few minutes. Keys of the main
+path win over keys of an additional path.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+# more paths than this per poll would only keep the device busy
+MAX_EXTRA_PATHS = 8
+
+
+@dataclass
+class ExtraPath:
+    path: str
+    # seconds between fetches; 0 = every poll
+    interval: int = 0
+    # loop time of the next fetch
+    due: float = 0.0
+    body: bytes | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    failures: int = 0
+
+    def is_due(self, now: float) -> bool:
+        return now >= self.due
+
+    def fetched(self, now: float, body: bytes | None, data: dict[str, Any] | None) -> bool:
+        """Book a fetch (``data`` None when it failed); True if the payload changed."""
+        self.due = now + self.interval
+        if data is None:
+            self.failures += 1
+            return False
+        self.failures = 0
+        if body == self.body:
+            return False
+        self.body = body
+        self.data = data
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "interval": self.interval,
+            "keys": len(self.data),
+            "failures": self.failures,
+        }
+
+
+def parse_extra_paths(text: str) -> tuple[tuple[str, int], ...]:
+    """Parse ``"/weather=300, /status"``; raises ``ValueError`` when invalid."""
+    paths: list[tuple[str, int]] = []
+    for part in str(text).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        path, sep, seconds = part.partition("=")
+        path = path.strip()
+        if not path or any(char.isspace() for char in path):
+            raise ValueError(f"invalid path: {part!r}")
+        if not path.startswith("/"):
+            path = "/" + path
+        interval = int(seconds) if sep else 0
+        if interval < 0:
+            raise ValueError(f"negative interval: {part!r}")
+        if path in (existing for existing, _ in paths):
+            raise ValueError(f"duplicate path: {path}")
+        paths.append((path, interval))
+    if len(paths) > MAX_EXTRA_PATHS:
+        raise ValueError(f"at most {MAX_EXTRA_PATHS} additional paths")
+    return tuple(paths)
+
+
+def merge_payloads(main: dict[str, Any], extras: list[ExtraPath]) -> dict[str, Any]:
+    """The main payload with the keys of the additional paths it does not have."""
+    if not extras:
+        return main
+    merged: dict[str, Any] = {}
+    for extra in extras:
+        merged.update(extra.data)
+    merged.update(main)
+    return merged
@@ -0,0 +1,378 @@
+"""Fixed-memory sample history per station.
+
+``SampleRing`` keeps the last ``capacity`` decoded samples as float64
+columns (one per field, plus one for the sample time) in a single
+``bytearray``. Samples are stored by time: with a ``spacing`` every slot
+holds the newest sample of its ``spacing`` seconds, so polls faster than
+planned (adaptive polling, wind sampling) do not shrink the time the ring
+covers. Missing values are stored as NaN.
+
+A ring opened with ``open_ring`` is backed by a memory-mapped file, so the
+history survives restarts without going through the recorder. Appends only
+touch the in-memory buffer; the changed slots are copied to the file in
+batches (``pending`` on the event loop, ``sync`` in the executor).
+
+Windowed statistics are kept as running aggregates (``RunningWindow``):
+every append adds one value and drops the ones that left the window, so
+reading them does not rescan the window.
+
+Buffer layout::
+
+    header (32 bytes) | times[capacity] | field 0[capacity] | field 1[capacity] ...
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+import math
+import mmap
+import os
+import struct
+from typing import Iterator, Mapping, Sequence
+import zlib
+
+_MAGIC = b"WDRING1\0"
+# magic, capacity, field count, fields checksum, head, count
+_HEADER = struct.Struct("<8sIIIII")
+_HEADER_SIZE = 32
+
+STATISTICS = ("min", "max", "mean", "stddev")
+
+
+def statistic_key(key: str, stat: str, window: int) -> str:
+    """Value key of a windowed statistic, e.g. ``Tout_mean_60m``."""
+    return f"{key}_{stat}_{window}m"
+
+
+def parse_windows(raw: str) -> tuple[int, ...]:
+    """Parse a comma separated list of window lengths in minutes."""
+    windows = sorted({int(part) for part in str(raw).replace(";", ",").split(",") if part.strip()})
+    if any(window <= 0 for window in windows):
+        raise ValueError("window lengths must be positive")
+    return tuple(windows)
+
+
+def _buffer_size(fields: int, capacity: int) -> int:
+    return _HEADER_SIZE + 8 * capacity * (fields + 1)
+
+
+def _fields_checksum(fields: Sequence[str]) -> int:
+    return zlib.crc32(",".join(fields).encode())
+
+
+@dataclass(frozen=True)
+class WindowStats:
+    count: int
+    min: float
+    max: float
+    mean: float
+    stddev: float
+
+
+class RunningWindow:
+    """Min, max, mean and standard deviation of one field over a time span.
+
+    The aggregates cover every sample in the window except the newest one,
+    which may still be replaced (see ``SampleRing.spacing``) and is read
+    from the ring. Sums are kept relative to a shift (the first value) so
+    removing values does not cancel out precision; min and max use
+    monotonic deques.
+    """
+
+    def __init__(self, ring: SampleRing, column: int, span: float) -> None:
+        self._ring = ring
+        self._column = column
+        self.span = span
+        # sequence number of the oldest sample still in the window
+        self._tail = ring.seq - ring.count
+        self._n = 0
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._low: deque[tuple[int, float]] = deque()
+        self._high: deque[tuple[int, float]] = deque()
+        for seq in range(self._tail, ring.seq - 1):
+            self._add(seq, ring.value(column, seq))
+
+    def _add(self, seq: int, value: float) -> None:
+        if value != value:  # NaN
+            return
+        if not self._n:
+            self._shift = value
+        self._n += 1
+        delta = value - self._shift
+        self._sum += delta
+        self._sumsq += delta * delta
+        while self._low and self._low[-1][1] >= value:
+            self._low.pop()
+        self._low.append((seq, value))
+        while self._high and self._high[-1][1] <= value:
+            self._high.pop()
+        self._high.append((seq, value))
+
+    def _commit(self, seq: int) -> None:
+        """``seq`` is no longer the newest sample: add it to the aggregates."""
+        if seq >= self._tail:
+            self._add(seq, self._ring.value(self._column, seq))
+
+    def _drop_oldest(self) -> None:
+        seq = self._tail
+        self._tail += 1
+        if seq == self._ring.seq - 1:
+            # the newest sample is not part of the aggregates
+            return
+        value = self._ring.value(self._column, seq)
+        if value != value:
+            return
+        self._n -= 1
+        if not self._n:
+            self._sum = self._sumsq = 0.0
+        else:
+            delta = value - self._shift
+            self._sum -= delta
+            self._sumsq -= delta * delta
+        for extremes in (self._low, self._high):
+            if extremes and extremes[0][0] == seq:
+                extremes.popleft()
+
+    def stats(self, now: float) -> WindowStats | None:
+        """Statistics of the samples taken since ``now - span``."""
+        since = now - self.span
+        ring = self._ring
+        while self._tail < ring.seq and ring.time(self._tail) < since:
+            self._drop_oldest()
+        count, total, squares = self._n, self._sum, self._sumsq
+        low = self._low[0][1] if self._low else math.inf
+        high = self._high[0][1] if self._high else -math.inf
+        newest = ring.value(self._column, ring.seq - 1) if self._tail < ring.seq else math.nan
+        if newest == newest:
+            shift = self._shift if count else newest
+            count += 1
+            delta = newest - shift
+            total += delta
+            squares += delta * delta
+            low = min(low, newest)
+            high = max(high, newest)
+        else:
+            shift = self._shift
+        if not count:
+            return None
+        mean = total / count
+        variance = max(0.0, squares / count - mean * mean)
+        return WindowStats(count, low, high, shift + mean, math.sqrt(variance))
+
+
+class SampleRing:
+    """Ring buffer of timestamped samples with typed float64 columns."""
+
+    def __init__(
+        self,
+        fields: Sequence[str],
+        capacity: int,
+        spacing: float = 0.0,
+        buffer: bytearray | None = None,
+        file: mmap.mmap | None = None,
+    ) -> None:
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self.spacing = spacing
+        size = _buffer_size(len(self.fields), capacity)
+        self._buffer = buffer if buffer is not None else bytearray(size)
+        self._file = file
+        self._index = {field: i for i, field in enumerate(self.fields)}
+        self._windows: dict[tuple[str, float], RunningWindow] = {}
+        # slots changed since the last ``pending``
+        self._dirty: set[int] = set()
+
+        view = memoryview(self._buffer)
+        self._view = view
+        self._times = view[_HEADER_SIZE:_HEADER_SIZE + 8 * capacity].cast("d")
+        self._columns = [
+            view[start:start + 8 * capacity].cast("d")
+            for start in (
+                _HEADER_SIZE + 8 * capacity * (i + 1) for i in range(len(self.fields))
+            )
+        ]
+
+        magic, cap, nfields, checksum, head, count = _HEADER.unpack_from(self._buffer)
+        if (
+            magic == _MAGIC
+            and cap == capacity
+            and nfields == len(self.fields)
+            and checksum == _fields_checksum(self.fields)
+            and head < capacity
+            and count <= capacity
+        ):
+            self.head = head
+            self.count = count
+        else:
+            self.head = 0
+            self.count = 0
+            self._write_header()
+        # running number of the next sample; the oldest stored one is seq - count
+        self.seq = self.count
+
+    @property
+    def persistent(self) -> bool:
+        return self._file is not None
+
+    def _write_header(self) -> None:
+        _HEADER.pack_into(
+            self._buffer,
+            0,
+            _MAGIC,
+            self.capacity,
+            len(self.fields),
+            _fields_checksum(self.fields),
+            self.head,
+            self.count,
+        )
+
+    def _position(self, seq: int) -> int:
+        return (self.head - (self.seq - seq)) % self.capacity
+
+    def time(self, seq: int) -> float:
+        return self._times[self._position(seq)]
+
+    def value(self, column: int, seq: int) -> float:
+        return self._columns[column][self._position(seq)]
+
+    def append(self, when: float, values: Mapping[str, object]) -> None:
+        """Store one sample; non-numeric or missing values become NaN.
+
+        A sample in the same ``spacing`` slot as the newest one replaces it.
+        """
+        row = [
+            float(value) if isinstance(value, (int, float)) else math.nan
+            for value in map(values.get, self.fields)
+        ]
+        if (
+            self.count
+            and self.spacing > 0
+            and when // self.spacing == self.time(self.seq - 1) // self.spacing
+        ):
+            # the running windows never hold the newest sample: nothing to undo
+            pos = self._position(self.seq - 1)
+        else:
+            for window in self._windows.values():
+                if self.count == self.capacity and window._tail == self.seq - self.capacity:
+                    # the oldest sample is overwritten: it leaves the window
+                    window._drop_oldest()
+                if self.count:
+                    window._commit(self.seq - 1)
+            pos = self.head
+            self.seq += 1
+            self.head = (pos + 1) % self.capacity
+            if self.count < self.capacity:
+                self.count += 1
+            self._write_header()
+        self._times[pos] = when
+        for column, value in zip(self._columns, row):
+            column[pos] = value
+        self._dirty.add(pos)
+
+    def _positions(self, since: float) -> Iterator[int]:
+        """Buffer positions from newest to oldest with sample time >= since."""
+        times = self._times
+        pos = self.head
+        for _ in range(self.count):
+            pos = pos - 1 if pos else self.capacity - 1
+            if times[pos] < since:
+                return
+            yield pos
+
+    def stats(self, field: str, since: float) -> WindowStats | None:
+        """Min, max, mean and standard deviation of ``field`` since ``since``.
+
+        Scans the samples; ``window`` keeps the same numbers up to date.
+        """
+        column = self._columns[self._index[field]]
+        count = 0
+        mean = m2 = 0.0
+        low = math.inf
+        high = -math.inf
+        for pos in self._positions(since):
+            value = column[pos]
+            if value != value:  # NaN
+                continue
+            # Welford's single pass mean / variance
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+        if not count:
+            return None
+        return WindowStats(count, low, high, mean, math.sqrt(m2 / count))
+
+    def window(self, field: str, span: float) -> RunningWindow:
+        """Running statistics of ``field`` over the last ``span`` seconds."""
+        key = (field, span)
+        if (window := self._windows.get(key)) is None:
+            window = self._windows[key] = RunningWindow(self, self._index[field], span)
+        return window
+
+    def pending(self) -> list[tuple[int, bytes]]:
+        """Changed parts of the buffer as (offset, bytes), for ``sync``."""
+        if not self._dirty:
+            return []
+        chunks = [(0, bytes(self._buffer[:_HEADER_SIZE]))]
+        positions = sorted(self._dirty)
+        self._dirty.clear()
+        # one chunk per run of consecutive slots and column
+        runs: list[tuple[int, int]] = []
+        for pos in positions:
+            if runs and runs[-1][1] == pos:
+                runs[-1] = (runs[-1][0], pos + 1)
+            else:
+                runs.append((pos, pos + 1))
+        for column in range(len(self.fields) + 1):
+            base = _HEADER_SIZE + 8 * self.capacity * column
+            for start, end in runs:
+                offset = base + 8 * start
+                chunks.append((offset, bytes(self._buffer[offset:base + 8 * end])))
+        return chunks
+
+    def sync(self, chunks: list[tuple[int, bytes]]) -> None:
+        """Write chunks from ``pending`` to the file. Does blocking I/O."""
+        if self._file is None or self._file.closed:
+            return
+        for offset, data in chunks:
+            self._file[offset:offset + len(data)] = data
+
+    def close(self) -> None:
+        """Release the buffer; writes what changed and flushes the file. Does blocking I/O."""
+        self.sync(self.pending())
+        self._windows.clear()
+        self._times.release()
+        for column in self._columns:
+            column.release()
+        self._view.release()
+        if self._file is not None:
+            self._file.flush()
+            self._file.close()
+            self._file = None
+
+
+def open_ring(path: str, fields: Sequence[str], capacity: int, spacing: float = 0.0) -> SampleRing:
+    """Open (or create) a ring backed by a memory-mapped file. Does blocking I/O."""
+    size = _buffer_size(len(fields), capacity)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if os.fstat(fd).st_size != size:
+            # layout changed (other fields or capacity): start over
+            os.ftruncate(fd, 0)
+            os.ftruncate(fd, size)
+        file = mmap.mmap(fd, size)
+    finally:
+        os.close(fd)
+    ring = SampleRing(fields, capacity, spacing, bytearray(file), file)
+    # a reset header must reach the file as well
+    ring.sync([(0, bytes(ring._buffer[:_HEADER_SIZE]))])
+    return ring
@@ -0,0 +1,104 @@
+"""Hourly aggregates of decoded values, for long-term statistics.
+
+Every sample is folded into running count / sum / min / max per key for the
+current UTC hour; a counter key (rain today) instead sums its increments,
+treating a drop as a reset of the counter. When the first sample of a new
+hour arrives the finished hour is handed out, O(1) per sample and key.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+from typing import Any, Collection, Mapping
+
+
+@dataclass
+class _Measurement:
+    count: int = 0
+    total: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+
+@dataclass
+class HourSummary:
+    # epoch seconds of the start of the hour (UTC)
+    start: int
+    # key -> (mean, min, max)
+    measurements: dict[str, tuple[float, float, float]] = field(default_factory=dict)
+    # key -> (last counter reading, increase within the hour)
+    counters: dict[str, tuple[float, float]] = field(default_factory=dict)
+
+
+def _number(values: Mapping[str, Any], key: str) -> float | None:
+    value = values.get(key)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        return None
+    return float(value)
+
+
+class HourlyAggregator:
+    """Mean / min / max of ``measurements`` and increases of ``counters`` per hour."""
+
+    def __init__(self, measurements: Collection[str], counters: Collection[str] = ()) -> None:
+        self.measurements = tuple(measurements)
+        self.counters = tuple(counters)
+        self.hour: int | None = None
+        self._values: dict[str, _Measurement] = {}
+        self._increase: dict[str, float] = {}
+        # last reading of each counter, kept across hours
+        self._reading: dict[str, float] = {}
+
+    def add(self, when: float, values: Mapping[str, Any]) -> HourSummary | None:
+        """Fold in one sample; returns the previous hour once a new one starts."""
+        hour = int(when // 3600) * 3600
+        finished = None
+        if self.hour is None:
+            self.hour = hour
+        elif hour > self.hour:
+            finished = self._finish()
+            self.hour = hour
+        # an earlier hour (clock went backwards) keeps adding to the current one
+
+        for key in self.measurements:
+            value = _number(values, key)
+            if value is not None:
+                stats = self._values.get(key)
+                if stats is None:
+                    stats = self._values[key] = _Measurement()
+                stats.add(value)
+        for key in self.counters:
+            value = _number(values, key)
+            if value is None:
+                continue
+            last = self._reading.get(key)
+            if last is not None:
+                # a lower reading means the counter was reset (e.g. at midnight)
+                step = value - last if value >= last else value
+                self._increase[key] = self._increase.get(key, 0.0) + step
+            else:
+                self._increase.setdefault(key, 0.0)
+            self._reading[key] = value
+        return finished
+
+    def _finish(self) -> HourSummary:
+        assert self.hour is not None
+        summary = HourSummary(self.hour)
+        for key, stats in self._values.items():
+            if stats.count:
+                summary.measurements[key] = (stats.total / stats.count, stats.min, stats.max)
+        for key, increase in self._increase.items():
+            summary.counters[key] = (self._reading[key], increase)
+        self._values = {}
+        self._increase = {}
+        return summary
@@ -0,0 +1,148 @@
+"""Hourly long-term statistics imported straight from the decoded samples.
+
+The measurement sensors have no state class, so the recorder compiles no
+statistics for them from their states. With the import enabled, every
+sample goes into an ``HourlyAggregator`` and each finished hour is imported
+as external statistics (``weatherduino:<host>_<key>``): mean / min / max for
+measurements, a running sum for the rain counter. The statistics keep the
+full poll resolution; only their import waits for the hour to end, entity
+states are written as usual.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import logging
+from typing import TYPE_CHECKING, Any, Mapping
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.components.sensor import SensorEntityDescription
+from homeassistant.components.sensor.const import UNIT_CONVERTERS
+from homeassistant.core import HomeAssistant
+from homeassistant.util import slugify
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.4: has_mean only
+    StatisticMeanType = None  # type: ignore[assignment,misc]
+
+from .const import DOMAIN
+from .descriptions import SENSORS_BY_TYPE, STATISTICS_KEYS
+from .hourly import HourlyAggregator, HourSummary
+
+if TYPE_CHECKING:
+    from .coordinator import WeatherDuinoCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# counters imported as sums instead of mean / min / max
+COUNTER_KEYS = frozenset({"Rtd"})
+
+# newer Home Assistant versions also keep the unit class of a statistic
+_HAS_UNIT_CLASS = "unit_class" in StatisticMetaData.__annotations__
+
+
+class LongTermStatistics:
+    """Aggregates one station's samples per hour and imports them."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: WeatherDuinoCoordinator) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self._prefix = slugify(coordinator.host)
+        self._aggregator: HourlyAggregator | None = None
+        self._descriptions: dict[str, SensorEntityDescription] = {}
+        # statistic id -> running sum, read from the recorder on first use
+        self._sums: dict[str, float] = {}
+        self.imported_hours = 0
+        self.last_import: int | None = None
+
+    def statistic_id(self, key: str) -> str:
+        return f"{DOMAIN}:{self._prefix}_{slugify(key)}"
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return tuple(self._descriptions)
+
+    async def async_add(self, dtype: str, values: Mapping[str, Any], now: float) -> None:
+        """Fold a sample in; imports the previous hour when a new one starts."""
+        if self._aggregator is None:
+            if dtype not in STATISTICS_KEYS:
+                return
+            keys = set(STATISTICS_KEYS[dtype])
+            self._descriptions = {
+                desc.key: desc for desc, _ in SENSORS_BY_TYPE[dtype] if desc.key in keys
+            }
+            self._aggregator = HourlyAggregator(
+                [key for key in self._descriptions if key not in COUNTER_KEYS],
+                [key for key in self._descriptions if key in COUNTER_KEYS],
+            )
+        summary = self._aggregator.add(now, values)
+        if summary is not None and "recorder" in self.hass.config.components:
+            await self._async_import(summary)
+
+    def _metadata(self, key: str, has_sum: bool) -> StatisticMetaData:
+        desc = self._descriptions[key]
+        metadata = StatisticMetaData(
+            has_sum=has_sum,
+            name=f"{self.coordinator.device_id or self.coordinator.host} {desc.name}",
+            source=DOMAIN,
+            statistic_id=self.statistic_id(key),
+            unit_of_measurement=desc.native_unit_of_measurement,
+        )
+        if StatisticMeanType is None:
+            metadata["has_mean"] = not has_sum
+        else:
+            metadata["mean_type"] = StatisticMeanType.NONE if has_sum else StatisticMeanType.ARITHMETIC
+        if _HAS_UNIT_CLASS:
+            converter = UNIT_CONVERTERS.get(desc.device_class) if desc.device_class else None
+            metadata["unit_class"] = (
+                converter.UNIT_CLASS
+                if converter is not None and desc.native_unit_of_measurement in converter.VALID_UNITS
+                else None
+            )
+        return metadata
+
+    async def _async_last_sum(self, statistic_id: str) -> float:
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, statistic_id, True, {"sum"}
+        )
+        rows = last.get(statistic_id)
+        return float(rows[0].get("sum") or 0.0) if rows else 0.0
+
+    async def _async_import(self, summary: HourSummary) -> None:
+        start = datetime.fromtimestamp(summary.start, timezone.utc)
+        for key, (mean, low, high) in summary.measurements.items():
+            async_add_external_statistics(
+                self.hass,
+                self._metadata(key, has_sum=False),
+                [StatisticData(start=start, mean=mean, min=low, max=high)],
+            )
+        for key, (state, increase) in summary.counters.items():
+            statistic_id = self.statistic_id(key)
+            if statistic_id not in self._sums:
+                self._sums[statistic_id] = await self._async_last_sum(statistic_id)
+            self._sums[statistic_id] += increase
+            async_add_external_statistics(
+                self.hass,
+                self._metadata(key, has_sum=True),
+                [StatisticData(start=start, state=state, sum=self._sums[statistic_id])],
+            )
+        self.imported_hours += 1
+        self.last_import = summary.start
+        _LOGGER.debug(
+            "Imported statistics of %s for %d keys, hour starting %s",
+            self.coordinator.host,
+            len(summary.measurements) + len(summary.counters),
+            start,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "keys": len(self._descriptions),
+            "imported_hours": self.imported_hours,
+            "last_import": self.last_import,
+        }
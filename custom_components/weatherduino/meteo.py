@@ -0,0 +1,167 @@
+"""Derived meteorological values for 4Pro stations.
+
+Computed once per new payload from the decoded values (°C, %, m/s, hPa):
+dew point, heat index, wind chill, feels-like temperature, 10 minute mean
+wind and max gust, and the 3 hour pressure tendency. The sliding windows
+are incremental (running sum, monotonic deque), so every update is O(1)
+amortized no matter how fast the station is polled.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Any, Mapping
+
+WIND_WINDOW = 10 * 60
+PRESSURE_WINDOW = 3 * 3600
+
+
+def dew_point(temp: float, humidity: float) -> float | None:
+    """Dew point in °C (Magnus formula)."""
+    if humidity <= 0:
+        return None
+    a, b = 17.62, 243.12
+    gamma = math.log(humidity / 100) + a * temp / (b + temp)
+    return b * gamma / (a - gamma)
+
+
+def heat_index(temp: float, humidity: float) -> float:
+    """Heat index in °C (NWS); the air temperature below 80 °F."""
+    t = temp * 9 / 5 + 32
+    if t < 80:
+        return temp
+    hi = 0.5 * (t + 61.0 + (t - 68.0) * 1.2 + humidity * 0.094)
+    if (hi + t) / 2 >= 80:
+        # Rothfusz regression with the NWS adjustments
+        hi = (
+            -42.379
+            + 2.04901523 * t
+            + 10.14333127 * humidity
+            - 0.22475541 * t * humidity
+            - 0.00683783 * t * t
+            - 0.05481717 * humidity * humidity
+            + 0.00122874 * t * t * humidity
+            + 0.00085282 * t * humidity * humidity
+            - 0.00000199 * t * t * humidity * humidity
+        )
+        if humidity < 13 and t <= 112:
+            hi -= (13 - humidity) / 4 * math.sqrt((17 - abs(t - 95)) / 17)
+        elif humidity > 85 and t <= 87:
+            hi += (humidity - 85) / 10 * (87 - t) / 5
+    return (hi - 32) * 5 / 9
+
+
+def wind_chill(temp: float, wind_speed: float) -> float:
+    """Wind chill in °C (JAG/TI); the air temperature outside its range."""
+    kmh = wind_speed * 3.6
+    if temp > 10 or kmh <= 4.8:
+        return temp
+    v = kmh ** 0.16
+    return 13.12 + 0.6215 * temp - 11.37 * v + 0.3965 * temp * v
+
+
+def feels_like(temp: float, humidity: float | None, wind_speed: float | None) -> float:
+    """Wind chill when cold and windy, heat index when hot, else the temperature."""
+    if wind_speed is not None and temp <= 10:
+        return wind_chill(temp, wind_speed)
+    if humidity is not None:
+        return heat_index(temp, humidity)
+    return temp
+
+
+class SlidingMean:
+    """Mean over a time window, kept as a running sum."""
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._samples: deque[tuple[float, float]] = deque()
+        self._sum = 0.0
+
+    def add(self, when: float, value: float) -> float:
+        self._samples.append((when, value))
+        self._sum += value
+        cutoff = when - self.window
+        while self._samples[0][0] < cutoff:
+            self._sum -= self._samples.popleft()[1]
+        return self._sum / len(self._samples)
+
+
+class SlidingMax:
+    """Maximum over a time window (monotonic deque)."""
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._samples: deque[tuple[float, float]] = deque()
+
+    def add(self, when: float, value: float) -> float:
+        samples = self._samples
+        while samples and samples[-1][1] <= value:
+            samples.pop()
+        samples.append((when, value))
+        cutoff = when - self.window
+        while samples[0][0] < cutoff:
+            samples.popleft()
+        return samples[0][1]
+
+
+class Tendency:
+    """Change of a value over a time window, e.g. the 3 hour pressure tendency.
+
+    Only the samples inside the window plus the newest one before it are
+    kept; that one is the reference. ``None`` until the window is covered.
+    """
+
+    def __init__(self, window: float) -> None:
+        self.window = window
+        self._samples: deque[tuple[float, float]] = deque()
+
+    def add(self, when: float, value: float) -> float | None:
+        samples = self._samples
+        samples.append((when, value))
+        cutoff = when - self.window
+        while len(samples) > 1 and samples[1][0] <= cutoff:
+            samples.popleft()
+        if samples[0][0] > cutoff:
+            return None
+        return value - samples[0][1]
+
+
+def _number(values: Mapping[str, Any], key: str) -> float | None:
+    value = values.get(key)
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+class DerivedMeteo:
+    """Per-station derived values, updated with every new payload."""
+
+    def __init__(self) -> None:
+        self._wind = SlidingMean(WIND_WINDOW)
+        self._gust = SlidingMax(WIND_WINDOW)
+        self._pressure = Tendency(PRESSURE_WINDOW)
+
+    def update(self, when: float, values: Mapping[str, Any]) -> dict[str, float]:
+        """Derived values for one decoded 4Pro payload taken at ``when``."""
+        out: dict[str, float | None] = {}
+        temp = _number(values, "Tout")
+        humidity = _number(values, "Hout")
+        wind = _number(values, "Wsp")
+        gust = _number(values, "Wgs")
+        pressure = _number(values, "P")
+
+        if temp is not None and humidity is not None:
+            out["dew_point"] = dew_point(temp, humidity)
+            out["heat_index"] = heat_index(temp, humidity)
+        if temp is not None and wind is not None:
+            out["wind_chill"] = wind_chill(temp, wind)
+        if temp is not None:
+            out["feels_like"] = feels_like(temp, humidity, wind)
+        if wind is not None:
+            out["wind_speed_avg_10m"] = self._wind.add(when, wind)
+        if gust is not None:
+            out["wind_gust_max_10m"] = self._gust.add(when, gust)
+        if pressure is not None:
+            out["pressure_tendency_3h"] = self._pressure.add(when, pressure)
+
+        return {key: round(value, 2) for key, value in out.items() if value is not None}
@@ -0,0 +1,97 @@
+"""Tolerant JSON decoding for WeatherDuino payloads.
+
+Valid payloads go through the fastest JSON backend available (``orjson``,
+which Home Assistant ships, otherwise the standard library). Only when that
+fails are the known firmware quirks repaired:
+
+- ``nan`` / ``inf`` / ``ovf`` printed as bare values (Arduino ``dtostrf``)
+- empty values (``"T":,``) and trailing commas
+- bare numbers with a decimal comma (``"T":21,5``)
+- numbers out of the float range (``1e400``), read as ``null``
+
+If the repaired text still is not valid JSON, every ``"key": value`` pair
+that parses on its own is salvaged, so one broken field does not drop the
+whole update. A truncated body keeps its last complete pair; a
+non-finite number is dropped.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any
+
+try:
+    from orjson import loads as _fast_loads
+except ImportError:  # pragma: no cover - orjson is part of Home Assistant
+    _fast_loads = json.loads
+
+
+class PayloadError(ValueError):
+    """Raised when nothing usable could be decoded from a payload."""
+
+
+_BARE_SPECIAL = re.compile(r"(:\s*)[-+]?(?:nan|inf(?:inity)?|ovf)(?=\s*[,}\]])", re.IGNORECASE)
+_EMPTY_VALUE = re.compile(r"(:\s*)(?=[,}])")
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+_DECIMAL_COMMA = re.compile(r"(:\s*-?\d+),(\d+)(?=\s*[,}])")
+_PAIR = re.compile(
+    r'"((?:[^"\\]|\\.)*)"\s*:\s*'
+    r'("(?:[^"\\]|\\.)*"|-?\d+(?:[.,]\d+)?(?:[eE][-+]?\d+)?|true|false|null)'
+    # followed by the next pair or the end of the object, or of a truncated body
+    r"(?=\s*(?:[,}\]]|\Z))"
+)
+
+
+def _repair(text: str) -> str:
+    text = _BARE_SPECIAL.sub(r"\1null", text)
+    text = _EMPTY_VALUE.sub(r"\1null", text)
+    text = _TRAILING_COMMA.sub(r"\1", text)
+    return _DECIMAL_COMMA.sub(r"\1.\2", text)
+
+
+def _finite(raw: str) -> float | None:
+    value = float(raw)
+    return value if math.isfinite(value) else None
+
+
+def _salvage(text: str) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for match in _PAIR.finditer(text):
+        key, raw = match.groups()
+        if not raw.startswith('"'):
+            # decimal comma of a bare number; commas inside strings stay
+            raw = raw.replace(",", ".")
+        try:
+            value = json.loads(raw, parse_float=_finite)
+        except ValueError:
+            continue
+        if value is None and raw != "null":
+            continue
+        data[json.loads(f'"{key}"')] = value
+    return data
+
+
+def parse_payload(body: bytes) -> tuple[dict[str, Any], bool]:
+    """Decode a payload; returns the data and whether it had to be repaired."""
+    try:
+        data = _fast_loads(body)
+    except ValueError as err:
+        # keep only the message: holding the exception would tie its
+        # traceback (and this frame) into a reference cycle
+        error = str(err)
+    else:
+        if isinstance(data, dict):
+            return data, False
+        raise PayloadError("payload is not a JSON object")
+
+    text = _repair(body.decode("utf-8", errors="replace"))
+    try:
+        data = json.loads(text, parse_float=_finite)
+    except ValueError:
+        data = _salvage(text)
+    if not isinstance(data, dict) or not data:
+        raise PayloadError(f"invalid JSON: {error}")
+    return data, True
@@ -0,0 +1,94 @@
+"""Stage timings of a station's next update cycles (``weatherduino.profile``).
+
+The coordinator calls ``begin`` when a cycle (poll or push) starts, ``lap``
+after each stage with the stage's name, and ``end`` when the cycle is over.
+A lap books the time since the previous lap, so the stages add up to the
+cycle. Outside a profiling run the coordinator has no profiler and the
+calls cost one ``is None`` check.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+
+class CycleProfiler:
+    """Collects per-stage times over ``cycles`` update cycles."""
+
+    def __init__(
+        self,
+        name: str,
+        cycles: int,
+        on_cycle: Callable[[bool], None] | None = None,
+        on_done: Callable[[CycleProfiler], None] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.name = name
+        self.cycles = cycles
+        self.done = 0
+        # stage -> seconds of every lap, in the order stages first appeared
+        self.stages: dict[str, list[float]] = {}
+        self.totals: list[float] = []
+        self.entity_updates = 0
+        self._on_cycle = on_cycle
+        self._on_done = on_done
+        self._clock = clock
+        self._started: float | None = None
+        self._mark = 0.0
+
+    @property
+    def finished(self) -> bool:
+        return self.done >= self.cycles
+
+    def begin(self) -> None:
+        if self._started is not None or self.finished:
+            return
+        self._started = self._mark = self._clock()
+        if self._on_cycle is not None:
+            self._on_cycle(True)
+
+    def lap(self, stage: str) -> None:
+        if self._started is None:
+            return
+        now = self._clock()
+        self.stages.setdefault(stage, []).append(now - self._mark)
+        self._mark = now
+
+    def count_entity_updates(self, count: int) -> None:
+        if self._started is not None:
+            self.entity_updates += count
+
+    def end(self) -> None:
+        if self._started is None:
+            return
+        self.totals.append(self._clock() - self._started)
+        self._started = None
+        self.done += 1
+        if self._on_cycle is not None:
+            self._on_cycle(False)
+        if self.finished and self._on_done is not None:
+            self._on_done(self)
+
+    def summary(self) -> str:
+        """Markdown table of the stages: laps, mean, max and share of the total."""
+        total = sum(self.totals)
+        lines = [
+            f"**{self.name}**: {self.done} cycles, mean {_ms(total / self.done if self.done else 0)}, "
+            f"max {_ms(max(self.totals, default=0))}, {self.entity_updates} entity updates",
+            "",
+            "| stage | laps | mean | max | share |",
+            "|---|---:|---:|---:|---:|",
+        ]
+        for stage, laps in self.stages.items():
+            spent = sum(laps)
+            share = 100 * spent / total if total else 0
+            lines.append(
+                f"| {stage} | {len(laps)} | {_ms(spent / len(laps))} | {_ms(max(laps))} | {share:.0f} % |"
+            )
+        return "\n".join(lines)
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f} ms"
@@ -0,0 +1,97 @@
+"""Push mode: stations upload their readings instead of being polled.
+
+One HTTP view serves all entries at ``/api/weatherduino/push/<push id>``.
+It accepts WU style ``GET`` uploads and Ecowitt style ``POST`` form uploads,
+maps them with ``upload.map_upload`` and hands the payload to the entry's
+coordinator. Stations cannot send a Home Assistant token, so the view is
+unauthenticated; the push ID in the URL selects (and guards) the entry.
+"""
+from __future__ import annotations
+
+from http import HTTPStatus
+import logging
+from typing import TYPE_CHECKING, Mapping
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_PUSH, DOMAIN
+from .upload import map_upload
+
+if TYPE_CHECKING:
+    from .coordinator import WeatherDuinoCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+PUSH_URL = "/api/weatherduino/push/{push_id}"
+
+
+@callback
+def async_get_push_registry(hass: HomeAssistant) -> PushRegistry:
+    """Return the push registry, registering the view on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(DATA_PUSH)
+    if registry is None:
+        registry = domain_data[DATA_PUSH] = PushRegistry()
+        # views cannot be removed again; without entries it answers 404
+        hass.http.register_view(WeatherDuinoPushView(registry))
+    return registry
+
+
+class PushRegistry:
+    """Push ID -> coordinator of the entry receiving those uploads."""
+
+    def __init__(self) -> None:
+        self._stations: dict[str, WeatherDuinoCoordinator] = {}
+
+    @callback
+    def async_register(self, coordinator: WeatherDuinoCoordinator) -> CALLBACK_TYPE:
+        push_id = coordinator.push_id
+        if push_id in self._stations:
+            _LOGGER.warning("Push ID %s is used by more than one entry", push_id)
+        self._stations[push_id] = coordinator
+
+        @callback
+        def unregister() -> None:
+            if self._stations.get(push_id) is coordinator:
+                del self._stations[push_id]
+
+        return unregister
+
+    def get(self, push_id: str) -> WeatherDuinoCoordinator | None:
+        return self._stations.get(push_id)
+
+
+class WeatherDuinoPushView(HomeAssistantView):
+    """Receives station uploads for all push mode entries."""
+
+    url = PUSH_URL
+    name = "api:weatherduino:push"
+    requires_auth = False
+
+    def __init__(self, registry: PushRegistry) -> None:
+        self._registry = registry
+
+    async def get(self, request: web.Request, push_id: str) -> web.Response:
+        return await self._async_handle(push_id, request.query, len(request.query_string))
+
+    async def post(self, request: web.Request, push_id: str) -> web.Response:
+        form = await request.post()
+        params = {**request.query, **{k: v for k, v in form.items() if isinstance(v, str)}}
+        return await self._async_handle(push_id, params, request.content_length or 0)
+
+    async def _async_handle(
+        self, push_id: str, params: Mapping[str, str], size: int
+    ) -> web.Response:
+        coordinator = self._registry.get(push_id)
+        if coordinator is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        payload = map_upload(params)
+        if not payload:
+            _LOGGER.debug("Upload for %s had no known fields: %s", push_id, list(params))
+            return web.Response(status=HTTPStatus.BAD_REQUEST, text="no known fields")
+        await coordinator.async_push(payload, size)
+        # WU uploaders look for this body
+        return web.Response(text="success\n")
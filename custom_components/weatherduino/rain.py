@@ -0,0 +1,125 @@
+"""Incremental rain accumulation from the 4Pro ``Rtd`` (rain today) counter.
+
+``Rtd`` resets at the device's midnight and after a reboot. The ledger turns
+successive readings into increments (a drop means the counter restarted, so
+the new reading is all new rain) and books them into 168 hourly buckets
+with running sums. Current hour, rolling 24 h, rolling 7 days and the
+season (calendar year) total are then O(1) per update, without looking at
+recorder history. Buckets follow the local wall clock like the day
+rollover, so hours start at the local full hour in every timezone
+(including half hour offsets); a DST hour that repeats is booked into one
+bucket. ``as_dict()`` / ``RainLedger(state)`` round-trip the
+ledger through Home Assistant storage.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+HOURS = 168
+# counter drops smaller than this are treated as rounding noise
+_RESET_TOLERANCE = 0.05
+
+
+def _local_hour(when: datetime) -> int:
+    """Running number of the local wall clock hour of ``when``."""
+    return when.toordinal() * 24 + when.hour
+
+
+class RainLedger:
+    """Hourly rain buckets fed from a daily resetting counter."""
+
+    def __init__(self, state: dict[str, Any] | None = None) -> None:
+        state = state or {}
+        buckets = state.get("buckets")
+        self.buckets: list[float] = (
+            [float(v) for v in buckets] if isinstance(buckets, list) and len(buckets) == HOURS
+            else [0.0] * HOURS
+        )
+        self.hour: int | None = state.get("hour")
+        self.last_counter: float | None = state.get("last_counter")
+        self.last_seen: float | None = state.get("last_seen")
+        self.last_date: str | None = state.get("last_date")
+        self.season: int | None = state.get("season")
+        self.season_total: float = float(state.get("season_total", 0.0))
+        self._sum_24h = 0.0
+        self._sum_7d = 0.0
+        self._resum()
+
+    def _resum(self) -> None:
+        if self.hour is None:
+            return
+        self._sum_7d = sum(self.buckets)
+        self._sum_24h = sum(self.buckets[(self.hour - i) % HOURS] for i in range(24))
+
+    def _advance(self, hour: int) -> None:
+        if self.hour is not None and hour <= self.hour:
+            # same hour, or the clock stepped back: keep booking into the newest bucket
+            return
+        if self.hour is None or hour - self.hour >= HOURS:
+            self.buckets = [0.0] * HOURS
+            self.hour = hour
+            self._resum()
+            return
+        while self.hour < hour:
+            self.hour += 1
+            self._sum_24h -= self.buckets[(self.hour - 24) % HOURS]
+            slot = self.hour % HOURS
+            self._sum_7d -= self.buckets[slot]
+            self.buckets[slot] = 0.0
+
+    def update(self, when: datetime, counter: float) -> float:
+        """Book a ``Rtd`` reading taken at local time ``when``; returns the increment."""
+        stamp = when.timestamp()
+        self._advance(_local_hour(when))
+        date = when.date().isoformat()
+
+        if self.season != when.year:
+            self.season = when.year
+            self.season_total = 0.0
+
+        last = self.last_counter
+        if last is None:
+            increment = 0.0
+        elif counter < last - _RESET_TOLERANCE:
+            # daily reset or reboot: the counter started again from zero
+            increment = counter
+        elif date != self.last_date and self.last_seen is not None and stamp - self.last_seen > 3600:
+            # we were away over midnight, the counter has reset since
+            increment = counter
+        else:
+            increment = max(counter - last, 0.0)
+
+        if increment:
+            self.buckets[self.hour % HOURS] += increment
+            self._sum_24h += increment
+            self._sum_7d += increment
+            self.season_total += increment
+
+        self.last_counter = counter
+        self.last_seen = stamp
+        self.last_date = date
+        return increment
+
+    def totals(self) -> dict[str, float]:
+        if self.hour is None:
+            return {}
+        return {
+            "rain_hour": round(self.buckets[self.hour % HOURS], 2),
+            "rain_24h": round(max(self._sum_24h, 0.0), 2),
+            "rain_7d": round(max(self._sum_7d, 0.0), 2),
+            "rain_season": round(self.season_total, 2),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "buckets": self.buckets,
+            "hour": self.hour,
+            "last_counter": self.last_counter,
+            "last_seen": self.last_seen,
+            "last_date": self.last_date,
+            "season": self.season,
+            "season_total": self.season_total,
+        }
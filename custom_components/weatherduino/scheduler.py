@@ -0,0 +1,153 @@
+"""Domain wide poll scheduler for all WeatherDuino entries.
+
+Every coordinator is registered here instead of running its own
+``update_interval`` timer. The scheduler spreads the stations over their
+interval (so a restart does not make all of them fire in the same second),
+caps how many requests are in flight at once and keeps track of how late
+each poll started compared to its slot.
+
+Entries on the same host never poll at the same time: the ESP web servers
+serve one client at a time, so a second request would only queue on the
+device (or make it drop the first). The global cap is fixed on purpose: it
+only bounds how much the event loop does in one go, each device is limited
+by its host slot anyway, and a config-entry integration has no domain wide
+option to hold it.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import logging
+from typing import TYPE_CHECKING, AsyncIterator
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, DEFAULT_MAX_CONCURRENT, DOMAIN
+from .timing import catch_up, stagger
+
+if TYPE_CHECKING:
+    from .coordinator import WeatherDuinoCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> WeatherDuinoScheduler:
+    """Return the shared scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = domain_data[DATA_SCHEDULER] = WeatherDuinoScheduler(hass)
+    return scheduler
+
+
+@dataclass
+class _Station:
+    coordinator: WeatherDuinoCoordinator
+    due: float
+    handle: asyncio.TimerHandle | None = None
+    task: asyncio.Task | None = None
+    missed: int = field(default=0)
+
+
+class WeatherDuinoScheduler:
+    """Schedules the polls of all WeatherDuino coordinators."""
+
+    def __init__(self, hass: HomeAssistant, max_concurrent: int = DEFAULT_MAX_CONCURRENT) -> None:
+        self.hass = hass
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # one request at a time per host, whatever the entries on it
+        self._hosts: dict[str, asyncio.Lock] = {}
+        self._stations: dict[str, _Station] = {}
+        self._slots = 0
+
+    @callback
+    def async_register(self, coordinator: WeatherDuinoCoordinator) -> CALLBACK_TYPE:
+        """Start polling ``coordinator``; returns a callback to stop again."""
+        key = coordinator.entry.entry_id
+        self._async_cancel(key)
+
+        phase = stagger(self._slots)
+        self._slots += 1
+        due = self.hass.loop.time() + phase * coordinator.next_poll_delay()
+
+        station = _Station(coordinator, due)
+        self._stations[key] = station
+        self._async_schedule(station)
+
+        @callback
+        def unregister() -> None:
+            self._async_cancel(key)
+
+        return unregister
+
+    @asynccontextmanager
+    async def slot(self, coordinator: WeatherDuinoCoordinator) -> AsyncIterator[None]:
+        """Hold the host and one of the global request slots for the duration of a fetch."""
+        host = self._hosts.setdefault(coordinator.host, asyncio.Lock())
+        # the host first: a station waiting for another entry on its host
+        # does not keep a global slot from the others
+        async with host, self._semaphore:
+            if coordinator.poll_due is not None:
+                coordinator.poll_lag = max(0.0, self.hass.loop.time() - coordinator.poll_due)
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    def missed_polls(self, coordinator: WeatherDuinoCoordinator) -> int:
+        """Number of slots skipped because the previous poll was still late."""
+        station = self._stations.get(coordinator.entry.entry_id)
+        return station.missed if station is not None else 0
+
+    @callback
+    def _async_schedule(self, station: _Station) -> None:
+        station.handle = self.hass.loop.call_at(station.due, self._async_fire, station)
+
+    @callback
+    def _async_fire(self, station: _Station) -> None:
+        station.handle = None
+        station.task = self.hass.async_create_background_task(
+            self._async_poll(station),
+            f"{station.coordinator.name} scheduled poll",
+        )
+
+    async def _async_poll(self, station: _Station) -> None:
+        coordinator = station.coordinator
+        coordinator.poll_due = station.due
+        try:
+            await coordinator.async_refresh()
+        finally:
+            coordinator.poll_due = None
+            station.task = None
+
+        if self._stations.get(coordinator.entry.entry_id) is not station:
+            return
+
+        # fixed intervals keep their phase: the next slot is relative to the
+        # planned start, slots that already passed are skipped instead of run
+        # back to back
+        now = self.hass.loop.time()
+        station.due, skipped = catch_up(
+            coordinator.next_poll_time(station.due, now), now, coordinator.next_poll_delay()
+        )
+        if skipped:
+            station.missed += skipped
+            _LOGGER.debug(
+                "%s is behind schedule, skipped %s poll(s)", coordinator.name, skipped
+            )
+        self._async_schedule(station)
+
+    @callback
+    def _async_cancel(self, key: str) -> None:
+        station = self._stations.pop(key, None)
+        if station is None:
+            return
+        if station.handle is not None:
+            station.handle.cancel()
+        if station.task is not None:
+            station.task.cancel()
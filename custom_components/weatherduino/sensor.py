@@ -1,87 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, timezone
 from ipaddress import ip_address, IPv4Address, IPv6Address
-from typing import Any, Callable
+from typing import Any
 
 from homeassistant.components.sensor import (
-    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
 )
-from homeassistant.const import (
-    PERCENTAGE,
-    UnitOfLength,
-    UnitOfPressure,
-    UnitOfSpeed,
-    UnitOfTemperature,
-    UnitOfVolumetricFlux,
-    CONCENTRATION_PARTS_PER_MILLION,
-)
-from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.util import slugify
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_NEW_KEYS
 from .coordinator import WeatherDuinoCoordinator
+from .descriptions import (
+    DERIVED_BY_TYPE,
+    POLLING_KEYS,
+    SENSORS_BY_TYPE,
+    SENSORS_STATION,
+    SENSORS_TELEMETRY,
+    STATISTICS_KEYS,
+    TELEMETRY_KEYS,
+    resolve_device_type,
+    statistics_descriptions,
+)
 
 
 # ---------- helpers ----------
 
-def _to_number(v: Any) -> float | None:
-    if v is None:
-        return None
-    if isinstance(v, (int, float)):
-        return float(v)
-    if isinstance(v, str):
-        s = v.strip().replace(",", ".")
-        try:
-            return float(s)
-        except ValueError:
-            return None
-    return None
-
-
-@dataclass(frozen=True)
-class WDValue:
-    key: str
-    fn: Callable[[dict[str, Any]], Any]
-
-
-def div10(key: str) -> WDValue:
-    return WDValue(
-        key,
-        lambda d: (_to_number(d.get(key)) / 10) if _to_number(d.get(key)) is not None else None,
-    )
-
-
-def num(key: str) -> WDValue:
-    return WDValue(key, lambda d: _to_number(d.get(key)))
-
-
-def epoch(key: str) -> WDValue:
-    return WDValue(
-        key,
-        lambda d: datetime.fromtimestamp(_to_number(d.get(key)), tz=timezone.utc)
-        if _to_number(d.get(key)) is not None else None,
-    )
-
-
-def raw_int(key: str) -> WDValue:
-    """Return numeric if possible and cast to int (e.g. for CO2, Wdir, TID)."""
-    def _fn(d: dict[str, Any]) -> Any:
-        n = _to_number(d.get(key))
-        if n is None:
-            return d.get(key)
-        return int(round(n))
-    return WDValue(key, _fn)
-
-
 def ip_suffix(host: str) -> str:
     try:
         ip = ip_address(host)
@@ -101,181 +51,141 @@ def ip_suffix(host: str) -> str:
     return slugify(host)
 
 
-def aq_avgmode_value() -> WDValue:
-    """
-    AQM2: AVG_M is AQ_AVGMODE:
-      1= 1 Hour Average
-      2= 3 Hours Average
-      3= Nowcast 12H
-      4= 24 Hours Average
-    """
-    mapping = {
-        1: "1 hour",
-        2: "3 hours",
-        3: "nowcast 12h",
-        4: "24 hours",
-    }
-
-    def _fn(d: dict[str, Any]) -> Any:
-        n = _to_number(d.get("AVG_M"))
-        if n is None:
-            return None
-        code = int(round(n))
-        return mapping.get(code, f"unknown ({code})")
-
-    return WDValue("AVG_M", _fn)
-
-
-# ---------- sensor definitions ----------
-
-PREC2 = 2
-
-SENSORS_4PRO = (
-    (SensorEntityDescription(key="Tin", name="Inside Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("Tin")),
-    (SensorEntityDescription(key="Hin", name="Inside Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("Hin")),
-    (SensorEntityDescription(key="Tout", name="Outside Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("Tout")),
-    (SensorEntityDescription(key="Hout", name="Outside Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("Hout")),
-    (SensorEntityDescription(key="P", name="Pressure", device_class=SensorDeviceClass.PRESSURE, native_unit_of_measurement=UnitOfPressure.HPA, suggested_display_precision=PREC2, icon="mdi:gauge"), div10("P")),
-
-    (SensorEntityDescription(key="Wsp", name="Wind Speed", device_class=SensorDeviceClass.WIND_SPEED, native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND, suggested_display_precision=PREC2, icon="mdi:weather-windy"), div10("Wsp")),
-    (SensorEntityDescription(key="Wgs", name="Wind Gust", device_class=SensorDeviceClass.WIND_SPEED, native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND, suggested_display_precision=PREC2, icon="mdi:weather-windy-variant"), div10("Wgs")),
-    (SensorEntityDescription(key="Wdir", name="Wind Direction", native_unit_of_measurement="°", suggested_display_precision=0, icon="mdi:compass-outline"), raw_int("Wdir")),
-
-    (SensorEntityDescription(key="Rtd", name="Rain Today", native_unit_of_measurement=UnitOfLength.MILLIMETERS, suggested_display_precision=PREC2, icon="mdi:cup-water"), div10("Rtd")),
-    (SensorEntityDescription(key="Rfr", name="Rain Rate", native_unit_of_measurement=UnitOfVolumetricFlux.MILLIMETERS_PER_HOUR, suggested_display_precision=PREC2, icon="mdi:weather-pouring"), div10("Rfr")),
-
-    (SensorEntityDescription(key="SR", name="Solar Radiation", device_class=SensorDeviceClass.IRRADIANCE, native_unit_of_measurement="W/m²", suggested_display_precision=0, icon="mdi:white-balance-sunny"), raw_int("SR")),
-    (SensorEntityDescription(key="UV", name="UV Index", suggested_display_precision=0, icon="mdi:sun-wireless"), raw_int("UV")),
-
-    (SensorEntityDescription(key="C02", name="CO2", native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION, suggested_display_precision=0, icon="mdi:molecule-co2"), raw_int("C02")),
-    (SensorEntityDescription(key="PM25", name="PM2.5", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25")),
-    (SensorEntityDescription(key="PM100", name="PM10", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100")),
-    (SensorEntityDescription(key="AQI", name="Air Quality Index", suggested_display_precision=0, icon="mdi:airballoon-outline"), raw_int("AQI")),
-
-    (SensorEntityDescription(key="ES1T", name="Extra Sensor 1 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("ES1T")),
-    (SensorEntityDescription(key="ES1H", name="Extra Sensor 1 Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("ES1H")),
-    (SensorEntityDescription(key="ES2T", name="Extra Sensor 2 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("ES2T")),
-    (SensorEntityDescription(key="ES2H", name="Extra Sensor 2 Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("ES2H")),
-    (SensorEntityDescription(key="ES3T", name="Extra Sensor 3 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("ES3T")),
-    (SensorEntityDescription(key="ES3H", name="Extra Sensor 3 Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("ES3H")),
-    (SensorEntityDescription(key="ES4T", name="Extra Sensor 4 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("ES4T")),
-    (SensorEntityDescription(key="ES4H", name="Extra Sensor 4 Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("ES4H")),
-
-    (SensorEntityDescription(key="So1T", name="Soil 1 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer-lines"), div10("So1T")),
-    (SensorEntityDescription(key="So1M", name="Soil 1 Moisture", native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:sprout"), div10("So1M")),
-    (SensorEntityDescription(key="So2T", name="Soil 2 Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer-lines"), div10("So2T")),
-    (SensorEntityDescription(key="So2M", name="Soil 2 Moisture", native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:sprout"), div10("So2M")),
-
-    (SensorEntityDescription(key="ts", name="Last Update", device_class=SensorDeviceClass.TIMESTAMP, entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:clock-outline"), epoch("ts")),
-    (SensorEntityDescription(key="TID", name="Device Type", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:information-outline"), raw_int("TID")),
-)
-
-SENSORS_WEATHERDISPLAY = (
-    (SensorEntityDescription(key="T", name="Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("T")),
-    (SensorEntityDescription(key="H", name="Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("H")),
-    (SensorEntityDescription(key="TID", name="Device Type", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:information-outline"), raw_int("TID")),
-)
-
-SENSORS_AQM3 = (
-    (SensorEntityDescription(key="T", name="Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("T")),
-    (SensorEntityDescription(key="H", name="Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("H")),
-    (SensorEntityDescription(key="P", name="Pressure", device_class=SensorDeviceClass.PRESSURE, native_unit_of_measurement=UnitOfPressure.HPA, suggested_display_precision=PREC2, icon="mdi:gauge"), div10("P")),
-
-    (SensorEntityDescription(key="PM25_last", name="PM2.5 Last", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_last")),
-    (SensorEntityDescription(key="PM100_last", name="PM10 Last", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_last")),
-    (SensorEntityDescription(key="PM25_1H", name="PM2.5 1h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_1H")),
-    (SensorEntityDescription(key="PM100_1H", name="PM10 1h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_1H")),
-    (SensorEntityDescription(key="PM25_3H", name="PM2.5 3h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_3H")),
-    (SensorEntityDescription(key="PM100_3H", name="PM10 3h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_3H")),
-    (SensorEntityDescription(key="PM25_12H", name="PM2.5 12h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_12H")),
-    (SensorEntityDescription(key="PM100_12H", name="PM10 12h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_12H")),
-    (SensorEntityDescription(key="PM25_24H", name="PM2.5 24h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25_24H")),
-    (SensorEntityDescription(key="PM100_24H", name="PM10 24h", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100_24H")),
-
-    (SensorEntityDescription(key="CO2", name="CO2", native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION, suggested_display_precision=0, icon="mdi:molecule-co2"), raw_int("CO2")),
-
-    (SensorEntityDescription(key="ts", name="Last Update", device_class=SensorDeviceClass.TIMESTAMP, entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:clock-outline"), epoch("ts")),
-    (SensorEntityDescription(key="TID", name="Device Type", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:information-outline"), raw_int("TID")),
-)
-
-SENSORS_AQM2 = (
-    (SensorEntityDescription(key="T", name="Temperature", device_class=SensorDeviceClass.TEMPERATURE, native_unit_of_measurement=UnitOfTemperature.CELSIUS, suggested_display_precision=PREC2, icon="mdi:thermometer"), div10("T")),
-    (SensorEntityDescription(key="H", name="Humidity", device_class=SensorDeviceClass.HUMIDITY, native_unit_of_measurement=PERCENTAGE, suggested_display_precision=PREC2, icon="mdi:water-percent"), div10("H")),
-
-    (SensorEntityDescription(key="PM25", name="PM2.5", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM25")),
-    (SensorEntityDescription(key="PM100", name="PM10", native_unit_of_measurement="µg/m³", suggested_display_precision=PREC2, icon="mdi:air-filter"), div10("PM100")),
-
-    (SensorEntityDescription(key="PM25AQI", name="PM2.5 AQI", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=PREC2, icon="mdi:airballoon-outline"), div10("PM25AQI")),
-    (SensorEntityDescription(key="PM100AQI", name="PM10 AQI", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=PREC2, icon="mdi:airballoon-outline"), div10("PM100AQI")),
-
-    # renamed + value mapped to text
-    (SensorEntityDescription(key="AVG_M", name="AQ Average Mode", entity_category=EntityCategory.DIAGNOSTIC, icon="mdi:chart-timeline-variant"), aq_avgmode_value()),
-
-    (SensorEntityDescription(key="CO2", name="CO2", native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION, suggested_display_precision=0, icon="mdi:molecule-co2"), raw_int("CO2")),
-    (SensorEntityDescription(key="TID", name="Device Type", entity_category=EntityCategory.DIAGNOSTIC, suggested_display_precision=0, icon="mdi:information-outline"), raw_int("TID")),
-)
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     coordinator: WeatherDuinoCoordinator = hass.data[DOMAIN][entry.entry_id]
-    data = coordinator.data or {}
-    dtype = getattr(coordinator, "device_type", "unknown")
+    created: set[str] = set()
+
+    @callback
+    def async_add_new_entities() -> None:
+        entities = [
+            WeatherDuinoSensor(coordinator, desc, requires)
+            for desc, requires in _descriptions(coordinator)
+            if desc.key not in created
+        ]
+        created.update(entity.entity_description.key for entity in entities)
+        if entities:
+            async_add_entities(entities)
+
+    async_add_new_entities()
+    # keys that show up later (extra sensors, modules) get their entities added on the fly
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_NEW_KEYS.format(entry.entry_id), async_add_new_entities
+        )
+    )
+
 
-    if dtype == "4pro":
-        sensor_defs = SENSORS_4PRO
-    elif dtype == "weatherdisplay":
-        sensor_defs = SENSORS_WEATHERDISPLAY
-    elif dtype == "aqm2":
-        sensor_defs = SENSORS_AQM2
-    elif dtype == "aqm3":
-        sensor_defs = SENSORS_AQM3
-    else:
-        if "Tin" in data or "Wsp" in data:
-            sensor_defs = SENSORS_4PRO
-        elif "PM25_last" in data and "PM25_24H" in data:
-            sensor_defs = SENSORS_AQM3
-        elif "PM25AQI" in data and "AVG_M" in data:
-            sensor_defs = SENSORS_AQM2
-        elif "T" in data and "H" in data:
-            sensor_defs = SENSORS_WEATHERDISPLAY
-        else:
-            sensor_defs = tuple()
+def _descriptions(
+    coordinator: WeatherDuinoCoordinator,
+) -> list[tuple[SensorEntityDescription, tuple[str, ...]]]:
+    """Descriptions for the current payload keys, with the keys each one needs."""
+    # keys of the last payload, or of the last run when the device has not answered yet
+    data = coordinator.payload_keys
+    dtype = resolve_device_type(getattr(coordinator, "device_type", "unknown"), data)
+    sensor_defs = SENSORS_BY_TYPE.get(dtype, ())
 
-    entities: list[WeatherDuinoSensor] = []
+    out: list[tuple[SensorEntityDescription, tuple[str, ...]]] = []
     for desc, wd in sensor_defs:
         if wd.key in data:
-            entities.append(WeatherDuinoSensor(coordinator, desc, wd))
+            out.append((desc, (wd.key,)))
+    for desc, inputs in DERIVED_BY_TYPE.get(dtype, ()):
+        if all(key in data for key in inputs):
+            out.append((desc, inputs))
+    for desc in (*SENSORS_STATION, *SENSORS_TELEMETRY):
+        if not (coordinator.push_id and desc.key in POLLING_KEYS):
+            out.append((desc, ()))
+
+    if coordinator.history_hours > 0:
+        for key in STATISTICS_KEYS.get(dtype, ()):
+            if key in data:
+                out.extend(
+                    (desc, (key,))
+                    for desc in statistics_descriptions(sensor_defs, {key}, coordinator.statistics_windows)
+                )
+    return out
 
-    async_add_entities(entities)
+
+def _ms(seconds: float | None) -> int | None:
+    return None if seconds is None else round(seconds * 1000)
 
 
 class WeatherDuinoSensor(CoordinatorEntity[WeatherDuinoCoordinator], SensorEntity):
     _attr_should_poll = False
 
-    def __init__(self, coordinator: WeatherDuinoCoordinator, description: SensorEntityDescription, wd_value: WDValue) -> None:
-        super().__init__(coordinator)
+    def __init__(
+        self,
+        coordinator: WeatherDuinoCoordinator,
+        description: SensorEntityDescription,
+        requires: tuple[str, ...] = (),
+    ) -> None:
+        # the value key doubles as listener context, so the coordinator
+        # only wakes this entity when its value changed
+        super().__init__(coordinator, context=description.key)
         self.entity_description = description
-        self._wd_value = wd_value
+        # payload keys this sensor is computed from; unavailable while one is missing
+        self._requires = requires
 
         suffix = ip_suffix(coordinator.host)
         self._attr_suggested_object_id = f"weatherduino_{slugify(description.name)}_wd{suffix}"
         self._attr_unique_id = f"{coordinator.host}_{description.key}"
 
+    @property
+    def available(self) -> bool:
+        # telemetry is most useful while the station is failing
+        if self.entity_description.key in TELEMETRY_KEYS:
+            return self.entity_description.key in self.coordinator.values
+        if not all(key in self.coordinator.payload_keys for key in self._requires):
+            return False
+        return super().available
+
     @property
     def native_value(self) -> Any:
-        return self._wd_value.fn(self.coordinator.data or {})
+        # values are decoded once per poll by the coordinator
+        return self.coordinator.values.get(self.entity_description.key)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         # add mode_code attribute for AQM2 AVG_M
         if self.entity_description.key == "AVG_M":
-            code = _to_number((self.coordinator.data or {}).get("AVG_M"))
-            if code is not None:
-                return {"mode_code": int(round(code))}
+            code = self.coordinator.values.get("AVG_M_code")
+            if isinstance(code, int):
+                return {"mode_code": code}
+        if self.entity_description.key == "poll_lag":
+            return {"missed_polls": self.coordinator.scheduler.missed_polls(self.coordinator)}
+        if self.entity_description.key == "fetch_latency":
+            telemetry = self.coordinator.telemetry
+            return {
+                "p50": _ms(telemetry.fetch.percentile(50)),
+                "p95": _ms(telemetry.fetch.percentile(95)),
+                "max": _ms(telemetry.fetch.max),
+                "timeout": _ms(telemetry.timeout),
+            }
+        if self.entity_description.key == "consecutive_failures":
+            return {
+                "failures": self.coordinator.telemetry.failures,
+                "last_error": self.coordinator.telemetry.last_error,
+            }
+        if self.entity_description.key == "breaker_state":
+            breaker = self.coordinator.breaker
+            retry_in = (
+                max(0.0, breaker.retry_at - self.hass.loop.time())
+                if breaker.retry_at is not None
+                else None
+            )
+            return {
+                "failures": breaker.failures,
+                "trips": breaker.trips,
+                "retry_in": None if retry_in is None else round(retry_in),
+            }
+        if self.entity_description.key == "payload_unchanged_ratio":
+            return {
+                "unchanged": self.coordinator.payload_unchanged,
+                "changed": self.coordinator.payload_changed,
+            }
         return None
 
     @property
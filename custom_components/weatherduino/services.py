@@ -0,0 +1,182 @@
+"""Services of the WeatherDuino integration.
+
+``weatherduino.profile`` times the stages of the next update cycles of one
+or all entries and reports them as a persistent notification, optionally
+with a cProfile dump in ``<config>/weatherduino/``. cProfile only runs
+while one of the profiled cycles is in progress, but it sees everything the
+event loop does in that time, including other integrations' tasks running
+while a cycle waits for the device.
+"""
+from __future__ import annotations
+
+import cProfile
+import logging
+import os
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DATA_PROFILE,
+    DEFAULT_PROFILE_CYCLES,
+    DOMAIN,
+    MAX_PROFILE_CYCLES,
+    PROFILE_TIMEOUT,
+)
+from .coordinator import WeatherDuinoCoordinator
+from .profiling import CycleProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_CYCLES = "cycles"
+ATTR_CPROFILE = "cprofile"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_CYCLES)
+        ),
+        vol.Optional(ATTR_CPROFILE, default=False): cv.boolean,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def async_profile(call: ServiceCall) -> None:
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        if domain_data.get(DATA_PROFILE) is not None:
+            raise HomeAssistantError("A WeatherDuino profiling run is already in progress")
+        coordinators = [
+            coordinator
+            for coordinator in domain_data.values()
+            if isinstance(coordinator, WeatherDuinoCoordinator)
+        ]
+        entry_id = call.data.get(ATTR_ENTRY_ID)
+        if entry_id:
+            coordinators = [c for c in coordinators if c.entry.entry_id == entry_id]
+        if not coordinators:
+            raise HomeAssistantError(
+                f"No loaded WeatherDuino entry {entry_id}" if entry_id else "No loaded WeatherDuino entries"
+            )
+        session = domain_data[DATA_PROFILE] = ProfileSession(
+            hass, coordinators, call.data[ATTR_CYCLES], call.data[ATTR_CPROFILE]
+        )
+        session.async_start()
+
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA)
+
+
+class ProfileSession:
+    """One ``weatherduino.profile`` call: a profiler on every targeted coordinator."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinators: list[WeatherDuinoCoordinator],
+        cycles: int,
+        cprofile: bool,
+    ) -> None:
+        self.hass = hass
+        self.cycles = cycles
+        self._profile = cProfile.Profile() if cprofile else None
+        # cycles in progress; cProfile runs while there is at least one
+        self._active = 0
+        self._profilers = {
+            coordinator: CycleProfiler(
+                coordinator.entry.title or coordinator.host,
+                cycles,
+                self._cycle,
+                self._station_done,
+            )
+            for coordinator in coordinators
+        }
+        self._cancel_timeout: CALLBACK_TYPE | None = None
+        self._started = time.time()
+
+    @callback
+    def async_start(self) -> None:
+        for coordinator, profiler in self._profilers.items():
+            coordinator.profiler = profiler
+        self._cancel_timeout = async_call_later(self.hass, PROFILE_TIMEOUT, self._async_timeout)
+        _LOGGER.info(
+            "Profiling the next %d update cycles of %d WeatherDuino entries",
+            self.cycles,
+            len(self._profilers),
+        )
+
+    def _cycle(self, started: bool) -> None:
+        if self._profile is None:
+            return
+        if started:
+            self._active += 1
+            if self._active == 1:
+                self._profile.enable()
+        else:
+            self._active -= 1
+            if self._active == 0:
+                self._profile.disable()
+
+    def _station_done(self, profiler: CycleProfiler) -> None:
+        if all(p.finished for p in self._profilers.values()):
+            self._async_finish(timed_out=False)
+
+    @callback
+    def _async_timeout(self, _now: Any) -> None:
+        self._cancel_timeout = None
+        self._async_finish(timed_out=True)
+
+    @callback
+    def _async_finish(self, timed_out: bool) -> None:
+        if self._cancel_timeout is not None:
+            self._cancel_timeout()
+            self._cancel_timeout = None
+        for coordinator, profiler in self._profilers.items():
+            if coordinator.profiler is profiler:
+                coordinator.profiler = None
+        if self._profile is not None and self._active:
+            # a cycle was cut off by the timeout
+            self._profile.disable()
+            self._active = 0
+        self.hass.async_create_task(self._async_report(timed_out), "weatherduino profile report")
+
+    async def _async_report(self, timed_out: bool) -> None:
+        parts = [profiler.summary() for profiler in self._profilers.values()]
+        if timed_out:
+            parts.insert(
+                0,
+                f"Stopped after {PROFILE_TIMEOUT} s, before every entry finished {self.cycles} cycles.",
+            )
+        if self._profile is not None:
+            stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._started))
+            path = self.hass.config.path(DOMAIN, f"profile-{stamp}.prof")
+            try:
+                await self.hass.async_add_executor_job(_dump, self._profile, path)
+            except OSError as err:
+                parts.append(f"Could not write the cProfile dump: {err}")
+            else:
+                parts.append(
+                    f"cProfile dump: `{path}` (open with `python -m pstats` or snakeviz)"
+                )
+        self.hass.data.get(DOMAIN, {}).pop(DATA_PROFILE, None)
+        persistent_notification.async_create(
+            self.hass,
+            "\n\n".join(parts),
+            title="WeatherDuino profile",
+            notification_id=f"{DOMAIN}_profile",
+        )
+
+
+def _dump(profile: cProfile.Profile, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    profile.dump_stats(path)
@@ -0,0 +1,110 @@
+"""Per-station request telemetry.
+
+Fetch latency goes into a fixed-bucket histogram (bounded memory no matter
+how long the station runs), next to the time spent decoding the payload,
+the payload size, and the failure counters. The coordinator publishes a
+few of these as diagnostic sensors; ``as_dict()`` feeds the diagnostics
+download.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# upper bucket bounds in seconds; the request timeout is the last one
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """Counts of latencies per bucket, plus everything above the last one."""
+
+    def __init__(self, bounds: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.total += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct: float) -> float | None:
+        """Upper bound of the bucket holding the ``pct`` percentile."""
+        if not self.total:
+            return None
+        rank = pct / 100 * self.total
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def as_dict(self) -> dict[str, int]:
+        labels = [f"le_{int(bound * 1000)}ms" for bound in self.bounds] + ["inf"]
+        return dict(zip(labels, self.counts))
+
+
+class StationTelemetry:
+    """Request, decode and failure counters of one station."""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.fetch = LatencyHistogram()
+        self.last_fetch: float | None = None
+        self.decode_time: float | None = None
+        self.payload_bytes: int | None = None
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_success: float | None = None
+        self.last_failure: float | None = None
+        self.last_error: str | None = None
+
+    def record_fetch(self, seconds: float) -> None:
+        self.fetch.record(seconds)
+        self.last_fetch = seconds
+
+    def record_payload(self, size: int) -> None:
+        self.payload_bytes = size
+
+    def record_decode(self, seconds: float) -> None:
+        self.decode_time = seconds
+
+    def record_success(self, when: float) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.last_success = when
+
+    def record_failure(self, when: float, error: str | None) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_failure = when
+        self.last_error = error
+
+    def as_dict(self) -> dict[str, Any]:
+        fetch = self.fetch
+        return {
+            "timeout": self.timeout,
+            "fetch_count": fetch.total,
+            "fetch_mean": round(fetch.sum / fetch.total, 4) if fetch.total else None,
+            "fetch_max": round(fetch.max, 4),
+            "fetch_p50": fetch.percentile(50),
+            "fetch_p95": fetch.percentile(95),
+            "fetch_histogram": fetch.as_dict(),
+            "last_fetch": self.last_fetch,
+            "decode_time": self.decode_time,
+            "payload_bytes": self.payload_bytes,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "last_success": self.last_success,
+            "last_failure": self.last_failure,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,26 @@
+"""Poll slot arithmetic of the shared scheduler.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+# golden ratio spacing keeps any number of stations evenly spread
+PHASE_STEP = 0.6180339887498949
+
+
+def stagger(slot: int) -> float:
+    """Phase (fraction of the interval) of the ``slot``-th registered station."""
+    return (slot * PHASE_STEP) % 1.0
+
+
+def catch_up(due: float, now: float, interval: float) -> tuple[float, int]:
+    """Next due time not in the past, and how many slots were skipped to get there.
+
+    Slots that already passed are skipped instead of run back to back, so a
+    fixed interval keeps its phase.
+    """
+    if due >= now:
+        return due, 0
+    interval = max(interval, 1.0)
+    skipped = int((now - due) // interval) + 1
+    return due + skipped * interval, skipped
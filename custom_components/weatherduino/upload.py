@@ -0,0 +1,122 @@
+"""Map Weather Underground / Ecowitt style uploads onto WeatherDuino keys.
+
+Stations in push mode send their readings as query string (WU protocol,
+``GET``) or form fields (Ecowitt custom server, ``POST``), in imperial
+units. ``map_upload`` turns such a field set into a payload that looks like
+the 4Pro JSON (values scaled by 10 where the JSON is), so it goes through
+the same decode plan, derived values and rain ledger as a polled payload.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Mapping
+
+
+def _number(raw: str) -> float | None:
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return None
+    # WU uses -9999 for "no reading"
+    return None if value <= -9999 else value
+
+
+def _f_to_c10(value: float) -> int:
+    return round((value - 32) * 50 / 9)
+
+
+def _inhg_to_hpa10(value: float) -> int:
+    return round(value * 338.639)
+
+
+def _mph_to_ms10(value: float) -> int:
+    return round(value * 4.4704)
+
+
+def _in_to_mm10(value: float) -> int:
+    return round(value * 254)
+
+
+def _times10(value: float) -> int:
+    return round(value * 10)
+
+
+def _whole(value: float) -> int:
+    return round(value)
+
+
+# upload field -> (4Pro key, converter); WU and Ecowitt names side by side
+FIELDS: dict[str, tuple[str, Callable[[float], int]]] = {
+    "tempf": ("Tout", _f_to_c10),
+    "humidity": ("Hout", _times10),
+    "indoortempf": ("Tin", _f_to_c10),
+    "tempinf": ("Tin", _f_to_c10),
+    "indoorhumidity": ("Hin", _times10),
+    "humidityin": ("Hin", _times10),
+    "baromin": ("P", _inhg_to_hpa10),
+    "baromrelin": ("P", _inhg_to_hpa10),
+    "windspeedmph": ("Wsp", _mph_to_ms10),
+    "windgustmph": ("Wgs", _mph_to_ms10),
+    "winddir": ("Wdir", _whole),
+    "dailyrainin": ("Rtd", _in_to_mm10),
+    "rainratein": ("Rfr", _in_to_mm10),
+    # WU only knows the rain of the last hour, the closest thing to a rate
+    "rainin": ("Rfr", _in_to_mm10),
+    "solarradiation": ("SR", _whole),
+    "UV": ("UV", _whole),
+    "uv": ("UV", _whole),
+    "AqPM2.5": ("PM25", _times10),
+    "pm25_ch1": ("PM25", _times10),
+    "AqPM10": ("PM100", _times10),
+    "co2": ("C02", _whole),
+    "soiltempf": ("So1T", _f_to_c10),
+    "soilmoisture": ("So1M", _times10),
+    "soiltemp2f": ("So2T", _f_to_c10),
+    "soilmoisture2": ("So2M", _times10),
+    "tf_ch1": ("So1T", _f_to_c10),
+    "tf_ch2": ("So2T", _f_to_c10),
+    "soilmoisture1": ("So1M", _times10),
+    **{f"temp{ch}f": (f"ES{ch}T", _f_to_c10) for ch in range(1, 5)},
+    **{f"humidity{ch}": (f"ES{ch}H", _times10) for ch in range(1, 5)},
+}
+
+# fields naming the station, in order of preference
+_ID_FIELDS = ("ID", "model", "stationtype")
+
+
+def _timestamp(raw: str | None) -> int | None:
+    """``dateutc`` as epoch seconds; ``now`` and garbage give None."""
+    if not raw or raw == "now":
+        return None
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d+%H:%M:%S"):
+        try:
+            when = datetime.strptime(raw, fmt)
+        except ValueError:
+            continue
+        return int(when.replace(tzinfo=timezone.utc).timestamp())
+    return None
+
+
+def map_upload(params: Mapping[str, str]) -> dict[str, Any]:
+    """4Pro style payload for one upload; unknown fields are ignored."""
+    payload: dict[str, Any] = {}
+    for name, raw in params.items():
+        field = FIELDS.get(name)
+        if field is None:
+            continue
+        value = _number(raw)
+        if value is not None:
+            key, convert = field
+            payload[key] = convert(value)
+
+    if not payload:
+        return payload
+    station = next((params[name] for name in _ID_FIELDS if params.get(name)), None)
+    if station is not None:
+        payload["ID"] = station
+    ts = _timestamp(params.get("dateutc"))
+    if ts is not None:
+        payload["ts"] = ts
+    return payload
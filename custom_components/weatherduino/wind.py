@@ -0,0 +1,71 @@
+"""Aggregation of fast wind samples into one published value per interval.
+
+In high-frequency wind mode the 4Pro is sampled every few seconds, but only
+one value per scan interval is published: the mean wind speed, the highest
+gust seen, and the vector-averaged direction (speed weighted, so calm
+samples do not pull the direction around, and 350° / 10° average to 0°
+instead of 180°). Everything is running sums, O(1) per sample.
+
+Plain Python on purpose (no Home Assistant imports).
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Mapping
+
+
+def _number(values: Mapping[str, Any], key: str) -> float | None:
+    value = values.get(key)
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+class WindAggregator:
+    """Wind samples since the last publish."""
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self.samples = 0
+        self._speed_sum = 0.0
+        self._speed_count = 0
+        self._gust: float | None = None
+        # speed weighted and unit direction vectors
+        self._x = self._y = 0.0
+        self._ux = self._uy = 0.0
+
+    def add(self, values: Mapping[str, Any]) -> None:
+        """Add the ``Wsp`` / ``Wgs`` / ``Wdir`` of one decoded sample."""
+        speed = _number(values, "Wsp")
+        gust = _number(values, "Wgs")
+        direction = _number(values, "Wdir")
+        self.samples += 1
+        if speed is not None:
+            self._speed_sum += speed
+            self._speed_count += 1
+        peak = gust if gust is not None else speed
+        if peak is not None and (self._gust is None or peak > self._gust):
+            self._gust = peak
+        if direction is not None:
+            rad = math.radians(direction)
+            weight = speed or 0.0
+            self._x += weight * math.sin(rad)
+            self._y += weight * math.cos(rad)
+            self._ux += math.sin(rad)
+            self._uy += math.cos(rad)
+
+    def aggregate(self) -> dict[str, Any]:
+        """Aggregated values since the last call; starts a new interval."""
+        out: dict[str, Any] = {}
+        if self._speed_count:
+            out["Wsp"] = round(self._speed_sum / self._speed_count, 2)
+        if self._gust is not None:
+            out["Wgs"] = round(self._gust, 2)
+        x, y = self._x, self._y
+        if abs(x) < 1e-9 and abs(y) < 1e-9:
+            # all calm: fall back to the plain direction average
+            x, y = self._ux, self._uy
+        if abs(x) >= 1e-9 or abs(y) >= 1e-9:
+            out["Wdir"] = round(math.degrees(math.atan2(x, y))) % 360
+        self._reset()
+        return out
@@ -0,0 +1,18 @@
+"""Shared test setup.
+
+The pure modules (no Home Assistant imports) are tested on their own, so
+the suite also runs without Home Assistant: put the integration directory
+on sys.path, like the benchmarks do, next to the repo root for the package
+imports of the Home Assistant tests.
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_DIR = os.path.join(ROOT, "custom_components", "weatherduino")
+
+for path in (ROOT, PACKAGE_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,63 @@
+"""Adaptive poll timing from the device's ``ts``."""
+from __future__ import annotations
+
+import pytest
+
+from adaptive import CadenceTracker
+
+
+def learned(cadence: float = 60, samples: int = 3) -> CadenceTracker:
+    """A tracker that saw ``samples`` samples ``cadence`` apart, each polled 1 s late."""
+    tracker = CadenceTracker(fallback=30)
+    for i in range(samples):
+        assert tracker.observe(1000 + cadence * i, 1001 + cadence * i)
+    return tracker
+
+
+def test_fallback_until_learned() -> None:
+    tracker = CadenceTracker(fallback=30)
+    assert tracker.next_delay(0) == 30
+    tracker.observe(1000, 1001)
+    assert tracker.next_delay(1001) == 30
+
+
+def test_polls_after_expected_sample() -> None:
+    tracker = learned()
+    assert tracker.cadence == 60
+    # last ts 1120 + cadence 60 + offset 1 + guard 1
+    assert tracker.next_delay(1121) == pytest.approx(61)
+    # a poll that is running late aims at the following sample
+    assert tracker.next_delay(1190) == pytest.approx(52)
+
+
+@pytest.mark.parametrize(
+    ("repeats", "delay"),
+    [(1, 5), (2, 60), (3, 120), (4, 240), (5, 480), (6, 600), (40, 600)],
+)
+def test_backs_off_beyond_cadence_while_stale(repeats: int, delay: float) -> None:
+    tracker = learned()
+    for _ in range(repeats):
+        assert not tracker.observe(1120, 1200)
+    assert tracker.next_delay(1200) == delay
+
+
+def test_new_sample_ends_backoff() -> None:
+    tracker = learned()
+    for _ in range(4):
+        tracker.observe(1120, 1200)
+    assert tracker.observe(1180, 1400)
+    assert tracker.repeats == 0
+    assert tracker.next_delay(1400) < 60
+
+
+def test_missed_samples_keep_cadence() -> None:
+    tracker = learned()
+    tracker.observe(1120 + 180, 1301)
+    assert tracker.cadence == pytest.approx(60)
+
+
+def test_clock_going_back_starts_over() -> None:
+    tracker = learned()
+    tracker.observe(500, 1200)
+    assert tracker.cadence is None
+    assert tracker.next_delay(1200) == 30
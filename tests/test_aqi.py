@@ -0,0 +1,76 @@
+"""AQI / CAQI breakpoints and the NowCast engine."""
+from __future__ import annotations
+
+import pytest
+
+from aqi import EU_PM10, EU_PM25, US_PM10, US_PM25, AirQualityIndex, caqi, us_aqi
+
+
+@pytest.mark.parametrize(
+    ("concentration", "index"),
+    [
+        (0.0, 0),
+        (9.0, 50),
+        (9.05, 50),  # truncated to 9.0
+        (9.1, 51),
+        (12.0, 56),
+        (35.4, 100),
+        (35.45, 100),
+        (35.5, 101),
+        (55.5, 151),
+        (325.4, 500),
+        (1000.0, 500),
+    ],
+)
+def test_us_aqi_pm25(concentration: float, index: int) -> None:
+    assert us_aqi(concentration, US_PM25, 1) == index
+
+
+@pytest.mark.parametrize(
+    ("concentration", "index"),
+    [(0, 0), (54, 50), (54.9, 50), (55, 51), (154, 100), (155, 101), (604, 500), (700, 500)],
+)
+def test_us_aqi_pm10(concentration: float, index: int) -> None:
+    assert us_aqi(concentration, US_PM10, 0) == index
+
+
+@pytest.mark.parametrize(
+    ("concentration", "grid", "index"),
+    [
+        (0, EU_PM25, 0),
+        (15, EU_PM25, 25),
+        (42.5, EU_PM25, 62.5),
+        (110, EU_PM25, 100),
+        (165, EU_PM25, 125),  # last segment extended
+        (50, EU_PM10, 50),
+        (180, EU_PM10, 100),
+    ],
+)
+def test_caqi(concentration: float, grid: tuple, index: float) -> None:
+    assert caqi(concentration, grid) == pytest.approx(index)
+
+
+def test_nowcast_needs_two_of_three_hours() -> None:
+    index = AirQualityIndex("PM25", "PM100")
+    first = index.update(3600 * 100, {"PM25": 10.0, "PM100": 20.0})
+    assert "pm25_nowcast" not in first
+    assert first["caqi"] == round(caqi(20.0, EU_PM10))
+
+    second = index.update(3600 * 101, {"PM25": 10.0, "PM100": 20.0})
+    assert second["pm25_nowcast"] == 10.0
+    assert second["pm10_nowcast"] == 20
+    assert second["aqi_us"] == max(us_aqi(10.0, US_PM25, 1), us_aqi(20, US_PM10, 0))
+
+
+def test_nowcast_weights_recent_hours() -> None:
+    index = AirQualityIndex("PM25", "PM100")
+    index.update(3600 * 100, {"PM25": 40.0})
+    out = index.update(3600 * 101, {"PM25": 10.0})
+    # weight max(10 / 40, 0.5) = 0.5: (10 + 0.5 * 40) / 1.5
+    assert out["pm25_nowcast"] == 20.0
+
+
+def test_invalid_samples_are_ignored() -> None:
+    index = AirQualityIndex("PM25", "PM100")
+    assert index.update(0, {"PM25": -1.0, "PM100": float("nan")}) == {}
+    assert index.update(0, {"PM25": True, "PM100": "12"}) == {}
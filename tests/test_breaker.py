@@ -0,0 +1,60 @@
+"""Circuit breaker state machine."""
+from __future__ import annotations
+
+from breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def make(jitter: float = 0.0) -> CircuitBreaker:
+    return CircuitBreaker(base=30, maximum=300, threshold=3, rng=lambda: jitter)
+
+
+def test_opens_after_threshold() -> None:
+    breaker = make()
+    for now in (0, 1):
+        breaker.failure(now)
+        assert breaker.state == CLOSED
+        assert breaker.allow(now)
+    breaker.failure(2)
+    assert breaker.state == OPEN
+    assert breaker.trips == 1
+    # equal jitter: half the backoff at the lowest
+    assert breaker.backoff == 15
+    assert breaker.retry_at == 17
+
+
+def test_half_open_after_backoff() -> None:
+    breaker = make()
+    for now in (0, 1, 2):
+        breaker.failure(now)
+    assert not breaker.allow(16.9)
+    assert breaker.state == OPEN
+    assert breaker.allow(17)
+    assert breaker.state == HALF_OPEN
+
+
+def test_failed_probe_doubles_backoff() -> None:
+    breaker = make(jitter=1.0)
+    backoffs = []
+    now = 0.0
+    for _ in range(3):
+        breaker.failure(now)
+    for _ in range(6):
+        backoffs.append(breaker.backoff)
+        now = breaker.retry_at
+        assert breaker.allow(now)
+        # a single failure in half-open opens again
+        breaker.failure(now)
+    assert backoffs == [30, 60, 120, 240, 300, 300]
+
+
+def test_success_closes() -> None:
+    breaker = make()
+    for now in (0, 1, 2):
+        breaker.failure(now)
+    breaker.allow(100)
+    breaker.success()
+    assert breaker.state == CLOSED
+    assert (breaker.failures, breaker.trips, breaker.retry_at) == (0, 0, None)
+    # counting starts over
+    breaker.failure(101)
+    assert breaker.state == CLOSED
@@ -0,0 +1,102 @@
+"""Payload capture: encoding, rotation and the round trip a replay relies on."""
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from capture import CaptureRecord, PayloadCapture, capture_files, decode_record, encode_record, read_capture
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        CaptureRecord(1.5, "/json", b'{"T":215}'),
+        # not UTF-8: kept byte for byte
+        CaptureRecord(2.0, "/json", b'{"ID":"\xff\xfe"}'),
+        CaptureRecord(3.0, "/json", same=True),
+        CaptureRecord(4.0, error="Cannot connect to host"),
+        CaptureRecord(5.0, body=b'{"Tout":21.5}', push=True),
+    ],
+)
+def test_encode_round_trip(record: CaptureRecord) -> None:
+    line = encode_record(record)
+    assert line.endswith("\n") and line.count("\n") == 1
+    assert decode_record(line) == record
+
+
+def polls() -> list[CaptureRecord]:
+    """A day of polls: new and repeated bodies, failures, an extra path and uploads."""
+    records = []
+    for i in range(300):
+        when = 1_770_000_000 + i * 30.0
+        if i % 50 == 7:
+            records.append(CaptureRecord(when, error="timeout"))
+        elif i % 40 == 3:
+            records.append(CaptureRecord(when, body=b'{"tempf":"70.1"}', push=True))
+        else:
+            if i % 10 == 0:
+                records.append(CaptureRecord(when, "/extra", b'{"X":%d}' % (i // 100)))
+            # the station changes every third poll
+            records.append(CaptureRecord(when, "/json", b'{"T":%d,"B":"\xe9"}' % (i // 3)))
+    return records
+
+
+def replayed(records) -> list[CaptureRecord]:
+    """Resolve ``same`` lines to the body they stand for, like the replay does."""
+    bodies: dict[str | None, bytes] = {}
+    out = []
+    for record in records:
+        if record.same:
+            record = CaptureRecord(record.time, record.path, bodies[record.path])
+        elif record.body is not None and not record.push:
+            bodies[record.path] = record.body
+        out.append(record)
+    return out
+
+
+def test_capture_replay_round_trip(tmp_path) -> None:
+    path = str(tmp_path / "capture" / "station.jsonl")
+    capture = PayloadCapture(path, max_bytes=4096, backups=50, flush_lines=7, flush_interval=1e9)
+    records = polls()
+    for record in records:
+        if capture.add(record):
+            capture.write(capture.take())
+    capture.write(capture.take())
+
+    files = capture_files(path)
+    # rotated, oldest backup first, the plain file last
+    assert capture.rotations == len(files) - 1 > 1
+    assert files[0].endswith(f".{capture.rotations}.gz") and files[-1] == path
+    captured = list(read_capture(files))
+    # repeated bodies were written as short markers
+    assert sum(record.same for record in captured) > 100
+    assert replayed(captured) == [
+        CaptureRecord(round(r.time, 3), r.path, r.body, push=r.push, error=r.error) for r in records
+    ]
+
+
+def test_rotation_keeps_the_newest_backups(tmp_path) -> None:
+    path = str(tmp_path / "station.jsonl")
+    capture = PayloadCapture(path, max_bytes=200, backups=2, flush_lines=1, flush_interval=0)
+    for i in range(20):
+        capture.add(CaptureRecord(float(i), "/json", b'{"T":%d}' % i))
+        capture.write(capture.take())
+    files = capture_files(path)
+    assert len(files) == 3
+    with gzip.open(files[0], "rt") as file:
+        oldest = decode_record(file.readline())
+    # older backups were dropped
+    assert oldest.time > 0
+    assert [r.time for r in read_capture(files)] == sorted(r.time for r in read_capture(files))
+
+
+def test_flush_triggers() -> None:
+    clock = [0.0]
+    capture = PayloadCapture("unused.jsonl", 1024, 1, flush_lines=3, flush_interval=60, clock=lambda: clock[0])
+    assert not capture.add(CaptureRecord(0.0, error="x"))
+    assert not capture.add(CaptureRecord(1.0, error="x"))
+    assert capture.add(CaptureRecord(2.0, error="x"))
+    assert len(capture.take()) == 3
+    clock[0] = 61.0
+    assert capture.add(CaptureRecord(61.0, error="x"))
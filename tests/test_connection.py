@@ -0,0 +1,139 @@
+"""Per-device connections (needs Home Assistant and pytest-asyncio)."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_asyncio")
+
+from aiohttp import ServerDisconnectedError, web  # noqa: E402
+from aiohttp.hdrs import CONNECTION  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from custom_components.weatherduino.connection import (  # noqa: E402
+    ConnectionPool,
+    DeviceConnection,
+    DeviceResponse,
+    ResponseTooLarge,
+)
+from custom_components.weatherduino.const import KEEPALIVE_MAX_STALE, MAX_RESPONSE_BYTES  # noqa: E402
+
+
+@pytest.fixture
+async def device():
+    async def json(request: web.Request) -> web.Response:
+        return web.Response(body=b'{"T":215}', headers={"ETag": '"1"'})
+
+    async def huge(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        await response.prepare(request)
+        # chunked, so only the read loop can stop it
+        for _ in range(MAX_RESPONSE_BYTES // 4096 + 2):
+            await response.write(b"x" * 4096)
+        return response
+
+    app = web.Application()
+    app.router.add_get("/json", json)
+    app.router.add_get("/huge", huge)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+async def test_get(device: TestServer) -> None:
+    connection = DeviceConnection("127.0.0.1", device.port)
+    try:
+        response = await connection.async_get("/json")
+        assert (response.status, response.body, response.etag) == (200, b'{"T":215}', '"1"')
+        await connection.async_probe()
+    finally:
+        await connection.async_close()
+
+
+async def test_response_cap(device: TestServer) -> None:
+    connection = DeviceConnection("127.0.0.1", device.port)
+    try:
+        with pytest.raises(ResponseTooLarge):
+            await connection.async_get("/huge")
+    finally:
+        await connection.async_close()
+
+
+async def test_pool_shares_and_releases() -> None:
+    pool = ConnectionPool()
+    first = pool.acquire("192.0.2.10", 80)
+    assert pool.acquire("192.0.2.10", 80) is first
+    assert pool.acquire("192.0.2.10", 8080) is not first
+    assert first.base_url == "http://192.0.2.10"
+    await pool.async_release(first)
+    assert pool.acquire("192.0.2.10", 80) is first
+    await pool.async_release(first)
+    await pool.async_release(first)
+    # the last user closed it: a new one is created
+    assert pool.acquire("192.0.2.10", 80) is not first
+    await pool.async_close_all()
+
+
+class FlakyDevice:
+    """Stands in for ``_async_request``: drops kept-alive connections on demand."""
+
+    def __init__(self, connection: DeviceConnection) -> None:
+        self.connection = connection
+        # a kept-alive connection is open, and how many of them to drop
+        self.open = False
+        self.drop_next = 0
+        self.sent: list[dict[str, str]] = []
+
+    async def __call__(self, path: str, headers: dict[str, str]) -> DeviceResponse:
+        self.sent.append(dict(headers))
+        if self.open and self.drop_next:
+            self.open = False
+            self.drop_next -= 1
+            raise ServerDisconnectedError()
+        self.open = self.connection._idle = CONNECTION not in headers
+        return DeviceResponse(200, b"{}")
+
+
+@pytest.fixture
+def flaky():
+    connection = DeviceConnection("192.0.2.10", 80)
+    device = FlakyDevice(connection)
+    with patch.object(connection, "_async_request", device):
+        yield device
+
+
+async def test_stale_connection_is_retried(flaky: FlakyDevice) -> None:
+    connection = flaky.connection
+    await connection.async_get("/json")
+    flaky.drop_next = 1
+    assert (await connection.async_get("/json")).status == 200
+    # one retry on a fresh connection, keep-alive stays on
+    assert len(flaky.sent) == 3
+    assert connection.stats.reconnects == 1
+    assert connection.stats.keepalive
+    await connection.async_get("/json")
+    # a reused connection that answered resets the count
+    assert (connection.stats.reused, connection.stats.stale) == (1, 0)
+
+
+async def test_keepalive_off_after_repeated_drops(flaky: FlakyDevice) -> None:
+    connection = flaky.connection
+    await connection.async_get("/json")
+    for _ in range(KEEPALIVE_MAX_STALE):
+        flaky.drop_next = 1
+        await connection.async_get("/json")
+    assert not connection.stats.keepalive
+    assert flaky.sent[-1][CONNECTION] == "close"
+    await connection.async_get("/json")
+    assert flaky.sent[-1][CONNECTION] == "close"
+
+
+async def test_fresh_connection_is_not_retried(flaky: FlakyDevice) -> None:
+    connection = flaky.connection
+    with patch.object(connection, "_async_request", side_effect=ServerDisconnectedError()):
+        with pytest.raises(ServerDisconnectedError):
+            await connection.async_get("/json")
+    assert connection.stats.reconnects == 0
@@ -0,0 +1,123 @@
+"""Coordinator failure accounting (needs pytest-homeassistant-custom-component)."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from aiohttp import ClientError  # noqa: E402
+from pytest_homeassistant_custom_component.common import MockConfigEntry  # noqa: E402
+
+from homeassistant.const import CONF_HOST, CONF_PORT  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.weatherduino.connection import DeviceResponse  # noqa: E402
+from custom_components.weatherduino.capture import capture_files, read_capture  # noqa: E402
+from custom_components.weatherduino.const import CONF_CAPTURE, CONF_EXTRA_PATHS, CONF_PATH, DOMAIN  # noqa: E402
+from custom_components.weatherduino.coordinator import WeatherDuinoCoordinator  # noqa: E402
+
+PAYLOAD = b'{"ID":"WD-Test","T":215,"H":40}'
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant):
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_HOST: "192.0.2.10", CONF_PORT: 80, CONF_PATH: "/json"}
+    )
+    entry.add_to_hass(hass)
+    coordinator = WeatherDuinoCoordinator(hass, entry)
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+async def test_failures_update_telemetry(coordinator: WeatherDuinoCoordinator) -> None:
+    seen: list[int | None] = []
+    coordinator.async_add_listener(
+        lambda: seen.append(coordinator.values.get("consecutive_failures")), "consecutive_failures"
+    )
+    with patch.object(coordinator.connection, "async_get", side_effect=ClientError("unreachable")) as get:
+        for _ in range(5):
+            await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    telemetry = coordinator.telemetry
+    assert telemetry.consecutive_failures == 5
+    assert telemetry.failures == 5
+    assert coordinator.values["consecutive_failures"] == 5
+    # the breaker opened after three failed requests, the rest failed fast
+    assert get.call_count == 3
+    assert coordinator.values["breaker_state"] == "open"
+    assert "not answering" in telemetry.last_error
+    # the telemetry sensors were woken with the current count every time
+    # (the base class also wakes everyone on the first failure, before the count)
+    assert [count for count in seen if count is not None] == [1, 2, 3, 4, 5]
+
+
+async def test_success_resets_failures(coordinator: WeatherDuinoCoordinator) -> None:
+    with patch.object(coordinator.connection, "async_get", side_effect=ClientError("unreachable")):
+        await coordinator.async_refresh()
+    assert coordinator.telemetry.consecutive_failures == 1
+    assert coordinator.telemetry.last_error == "Error fetching WeatherDuino JSON: unreachable"
+
+    with patch.object(coordinator.connection, "async_get", return_value=DeviceResponse(200, PAYLOAD)):
+        await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert coordinator.telemetry.consecutive_failures == 0
+    assert coordinator.values["consecutive_failures"] == 0
+    assert coordinator.device_type == "weatherdisplay"
+
+
+async def test_failed_main_path_cancels_additional_paths(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "192.0.2.11", CONF_PORT: 80, CONF_PATH: "/json"},
+        options={CONF_EXTRA_PATHS: "/extra, /status=60"},
+    )
+    entry.add_to_hass(hass)
+    coordinator = WeatherDuinoCoordinator(hass, entry)
+    requested: list[str] = []
+
+    async def get(path: str, headers=None) -> DeviceResponse:
+        requested.append(path)
+        if path == "/json":
+            raise ClientError("unreachable")
+        return DeviceResponse(200, b"{}")
+
+    try:
+        with patch.object(coordinator.connection, "async_get", side_effect=get):
+            await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        # the additional paths never reached the device, and stay due
+        assert requested == ["/json"]
+        assert all(extra.is_due(hass.loop.time()) for extra in coordinator.extra_paths)
+    finally:
+        await coordinator.async_shutdown()
+
+
+async def test_capture_is_written_in_order_and_flushed_on_shutdown(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "192.0.2.12", CONF_PORT: 80, CONF_PATH: "/json"},
+        options={CONF_CAPTURE: True},
+    )
+    entry.add_to_hass(hass)
+    coordinator = WeatherDuinoCoordinator(hass, entry)
+    bodies = [b'{"ID":"WD-Test","T":%d,"H":40}' % (i // 2) for i in range(45)]
+    with patch.object(
+        coordinator.connection,
+        "async_get",
+        side_effect=[DeviceResponse(200, body) for body in bodies],
+    ):
+        for _ in bodies:
+            await coordinator.async_refresh()
+    # two batches went out while polling, the rest is written on shutdown
+    await coordinator.async_shutdown()
+
+    records = await hass.async_add_executor_job(
+        lambda: list(read_capture(capture_files(coordinator.capture.path)))
+    )
+    assert len(records) == len(bodies)
+    assert [record.time for record in records] == sorted(record.time for record in records)
+    assert [record.same for record in records] == [i % 2 == 1 for i in range(len(bodies))]
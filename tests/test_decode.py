@@ -0,0 +1,52 @@
+"""Decoding: device detection, publishing changed keys and deadbands."""
+from __future__ import annotations
+
+import pytest
+
+from decode import detect_device_type, diff_values
+
+
+@pytest.mark.parametrize(
+    ("published", "decoded", "deadbands", "values", "changed"),
+    [
+        ({}, {"T": 21.5}, {}, {"T": 21.5}, {"T"}),
+        ({"T": 21.5}, {"T": 21.5}, {}, {"T": 21.5}, set()),
+        ({"T": 21.5}, {"T": 21.6}, {}, {"T": 21.6}, {"T"}),
+        # inside the deadband the published value stays
+        ({"T": 21.5}, {"T": 21.6}, {"T": 0.2}, {"T": 21.5}, set()),
+        ({"T": 21.5}, {"T": 21.3}, {"T": 0.2}, {"T": 21.3}, {"T"}),
+        # deadbands only apply to floats, and only to their own key
+        ({"H": 40}, {"H": 41}, {"H": 5.0}, {"H": 41}, {"H"}),
+        ({"T": 21.5, "H": 40.0}, {"T": 21.6, "H": 40.1}, {"T": 0.2}, {"T": 21.5, "H": 40.1}, {"H"}),
+        # a value turning None or a key going away is a change
+        ({"T": 21.5}, {"T": None}, {"T": 0.2}, {"T": None}, {"T"}),
+        ({"T": 21.5, "H": 40.0}, {"T": 21.5}, {}, {"T": 21.5}, {"H"}),
+    ],
+)
+def test_diff_values(published: dict, decoded: dict, deadbands: dict, values: dict, changed: set) -> None:
+    assert diff_values(published, decoded, deadbands) == (values, changed)
+
+
+def test_deadband_does_not_drift() -> None:
+    published, _ = diff_values({}, {"T": 20.0}, {})
+    for value in (20.05, 20.1, 20.15):
+        published, changed = diff_values(published, {"T": value}, {"T": 0.2})
+        assert published["T"] == 20.0
+        assert not changed
+    published, changed = diff_values(published, {"T": 20.2}, {"T": 0.2})
+    assert published["T"] == 20.2
+    assert changed == {"T"}
+
+
+@pytest.mark.parametrize(
+    ("payload", "device_type"),
+    [
+        ({"ID": "WD-4Pro", "TID": 160, "Tout": 215, "Wsp": 12, "Rtd": 0}, "4pro"),
+        ({"ID": "AQM3in", "TID": 11, "ts": 1770066996, "T": 215, "H": 377, "PM25_last": 308}, "aqm3"),
+        ({"ID": "AQM2out", "TID": 10, "T": -36, "H": 510, "PM25AQI": 630, "AVG_M": 2}, "aqm2"),
+        ({"ID": "WD-WeatherDisplay-4Pro", "TID": 7, "T": 143, "H": 775}, "weatherdisplay"),
+        ({"ID": "something else"}, "unknown"),
+    ],
+)
+def test_detect_device_type(payload: dict, device_type: str) -> None:
+    assert detect_device_type(payload) == device_type
@@ -0,0 +1,69 @@
+"""Additional JSON paths: parsing, per-path intervals and merging."""
+from __future__ import annotations
+
+import pytest
+
+from endpoints import MAX_EXTRA_PATHS, ExtraPath, merge_payloads, parse_extra_paths
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", ()),
+        ("/extra", (("/extra", 0),)),
+        ("/extra=300, status", (("/extra", 300), ("/status", 0))),
+        ("/a,, /b=0", (("/a", 0), ("/b", 0))),
+    ],
+)
+def test_parse(text: str, expected: tuple) -> None:
+    assert parse_extra_paths(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["/a=-5", "/a=soon", "/a, /a=60", "/a b", "=60"],
+)
+def test_parse_rejects(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_extra_paths(text)
+
+
+def test_path_limit() -> None:
+    paths = ", ".join(f"/p{i}" for i in range(MAX_EXTRA_PATHS))
+    assert len(parse_extra_paths(paths)) == MAX_EXTRA_PATHS
+    with pytest.raises(ValueError, match="at most"):
+        parse_extra_paths(f"{paths}, /one_more")
+
+
+def test_interval() -> None:
+    extra = ExtraPath("/extra", 300)
+    assert extra.is_due(0.0)
+    assert extra.fetched(0.0, b'{"a":1}', {"a": 1})
+    assert not extra.is_due(299.0)
+    assert extra.is_due(300.0)
+    # same body: not a change
+    assert not extra.fetched(300.0, b'{"a":1}', {"a": 1})
+    # without an interval it is due with every poll
+    every = ExtraPath("/status")
+    every.fetched(10.0, b"{}", {})
+    assert every.is_due(10.0)
+
+
+def test_failure_keeps_the_last_payload() -> None:
+    extra = ExtraPath("/extra", 60)
+    extra.fetched(0.0, b'{"a":1}', {"a": 1})
+    assert not extra.fetched(60.0, None, None)
+    assert extra.failures == 1
+    assert extra.data == {"a": 1}
+    # and is only tried again after its interval
+    assert not extra.is_due(100.0)
+
+
+def test_merge_precedence() -> None:
+    first = ExtraPath("/first", data={"T": 1, "A": 1})
+    second = ExtraPath("/second", data={"T": 2, "A": 2, "B": 2})
+    merged = merge_payloads({"T": 0, "ID": "main"}, [first, second])
+    # the main path wins, then the later additional path
+    assert merged == {"T": 0, "ID": "main", "A": 2, "B": 2}
+    main = {"T": 0}
+    assert merge_payloads(main, []) is main
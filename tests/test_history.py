@@ -0,0 +1,108 @@
+"""Sample ring: wraparound, time slots, persistence and window statistics."""
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from history import SampleRing, open_ring, parse_windows
+
+FIELDS = ("T", "H")
+
+
+def times(ring: SampleRing) -> list[float]:
+    return [ring.time(seq) for seq in range(ring.seq - ring.count, ring.seq)]
+
+
+def test_wraparound_keeps_the_newest() -> None:
+    ring = SampleRing(FIELDS, 4)
+    for i in range(10):
+        ring.append(float(i), {"T": i, "H": "n/a"})
+    assert ring.count == 4
+    assert times(ring) == [6.0, 7.0, 8.0, 9.0]
+    stats = ring.stats("T", 0.0)
+    assert (stats.count, stats.min, stats.max) == (4, 6.0, 9.0)
+    # non-numeric values are stored as NaN and skipped
+    assert ring.stats("H", 0.0) is None
+
+
+def test_spacing_replaces_the_newest_slot() -> None:
+    ring = SampleRing(FIELDS, 4, spacing=30.0)
+    # polls every 5 s: one slot per 30 s, holding the newest sample
+    for second in range(0, 240, 5):
+        ring.append(float(second), {"T": second})
+    assert times(ring) == [115.0, 145.0, 175.0, 205.0, 235.0][1:]
+    assert ring.stats("T", 0.0).count == 4
+
+
+def test_persistence_round_trip(tmp_path) -> None:
+    path = str(tmp_path / "weatherduino" / "entry.ring")
+    ring = open_ring(path, FIELDS, 8, 10.0)
+    for i in range(12):
+        ring.append(i * 10.0, {"T": i, "H": 50 + i})
+    ring.sync(ring.pending())
+    ring.append(120.0, {"T": 12, "H": 62})
+    # close writes what changed since the last sync
+    ring.close()
+
+    ring = open_ring(path, FIELDS, 8, 10.0)
+    assert ring.count == 8
+    assert times(ring) == [i * 10.0 for i in range(5, 13)]
+    assert ring.stats("H", 0.0).max == 62.0
+    ring.close()
+
+    # other fields: the file starts over
+    ring = open_ring(path, ("T", "P"), 8, 10.0)
+    assert ring.count == 0
+    ring.close()
+
+
+def test_pending_only_holds_changes() -> None:
+    ring = SampleRing(FIELDS, 8)
+    assert ring.pending() == []
+    ring.append(1.0, {"T": 1})
+    ring.append(2.0, {"T": 2})
+    chunks = ring.pending()
+    # header, then one run of two slots per column (times, T, H)
+    assert [len(data) for _, data in chunks] == [32, 16, 16, 16]
+    assert ring.pending() == []
+
+
+def test_window_stats() -> None:
+    ring = SampleRing(FIELDS, 16)
+    for second, value in enumerate([10, 12, 14, 16, 18]):
+        ring.append(second * 60.0, {"T": value})
+    stats = ring.window("T", 180).stats(240.0)
+    # samples at 60..240 s
+    assert (stats.count, stats.min, stats.max) == (4, 12.0, 18.0)
+    assert stats.mean == pytest.approx(15.0)
+    assert stats.stddev == pytest.approx(math.sqrt(5.0))
+    assert ring.window("T", 180).stats(10_000.0) is None
+
+
+def test_running_windows_match_a_rescan() -> None:
+    rng = random.Random(7)
+    ring = SampleRing(FIELDS, 50, spacing=10.0)
+    windows = {span: ring.window("T", span) for span in (60.0, 300.0, 1000.0)}
+    now = 0.0
+    for _ in range(400):
+        now += rng.choice((3.0, 10.0, 30.0))
+        value = rng.choice((None, rng.uniform(-20.0, 35.0)))
+        ring.append(now, {"T": value})
+        for span, window in windows.items():
+            expected = ring.stats("T", now - span)
+            actual = window.stats(now)
+            if expected is None:
+                assert actual is None
+                continue
+            assert actual.count == expected.count
+            assert (actual.min, actual.max) == (expected.min, expected.max)
+            assert actual.mean == pytest.approx(expected.mean)
+            assert actual.stddev == pytest.approx(expected.stddev, abs=1e-6)
+
+
+def test_parse_windows() -> None:
+    assert parse_windows("60, 10;10") == (10, 60)
+    with pytest.raises(ValueError):
+        parse_windows("0")
@@ -0,0 +1,67 @@
+"""Hourly aggregates for the long-term statistics import."""
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from hourly import HourlyAggregator
+
+HOUR = 3600.0
+START = 1_750_000_000 // 3600 * 3600
+
+
+def test_hour_summary() -> None:
+    hourly = HourlyAggregator(["T", "H"])
+    for offset, temp in ((0, 20.0), (600, 22.0), (3599, 21.0)):
+        assert hourly.add(START + offset, {"T": temp, "H": 50}) is None
+    summary = hourly.add(START + HOUR, {"T": 25.0})
+    assert summary.start == START
+    assert summary.measurements["T"] == (pytest.approx(21.0), 20.0, 22.0)
+    assert summary.measurements["H"] == (50.0, 50.0, 50.0)
+    # the new hour only has its own sample
+    summary = hourly.add(START + 2 * HOUR, {})
+    assert summary.measurements == {"T": (25.0, 25.0, 25.0)}
+
+
+@pytest.mark.parametrize("value", [None, "n/a", True, math.nan, math.inf])
+def test_ignores_non_numbers(value: object) -> None:
+    hourly = HourlyAggregator(["T"])
+    hourly.add(START, {"T": 20.0})
+    hourly.add(START + 1, {"T": value})
+    assert hourly.add(START + HOUR, {}).measurements["T"] == (20.0, 20.0, 20.0)
+
+
+@pytest.mark.parametrize(
+    ("readings", "state", "increase"),
+    [
+        ([1.0, 1.5, 3.0], 3.0, 2.0),
+        # reset at midnight: the new reading is all new rain
+        ([7.0, 7.5, 0.2, 0.6], 0.6, 1.1),
+        ([0.0], 0.0, 0.0),
+    ],
+)
+def test_counter_increase(readings: list[float], state: float, increase: float) -> None:
+    hourly = HourlyAggregator([], ["Rtd"])
+    for i, reading in enumerate(readings):
+        hourly.add(START + i * 60, {"Rtd": reading})
+    summary = hourly.add(START + HOUR, {})
+    assert summary.counters["Rtd"] == (state, pytest.approx(increase))
+
+
+def test_counter_continues_across_hours() -> None:
+    hourly = HourlyAggregator([], ["Rtd"])
+    hourly.add(START, {"Rtd": 1.0})
+    hourly.add(START + HOUR, {"Rtd": 2.0})
+    summary = hourly.add(START + 2 * HOUR, {"Rtd": 2.5})
+    # the first reading of an hour counts against the last one before it
+    assert summary.counters["Rtd"] == (2.0, 1.0)
+
+
+def test_clock_going_back_stays_in_the_hour() -> None:
+    hourly = HourlyAggregator(["T"])
+    hourly.add(START + HOUR, {"T": 10.0})
+    assert hourly.add(START + 100, {"T": 30.0}) is None
+    summary = hourly.add(START + 2 * HOUR, {})
+    assert summary.start == START + HOUR
+    assert summary.measurements["T"] == (20.0, 10.0, 30.0)
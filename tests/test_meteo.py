@@ -0,0 +1,100 @@
+"""Derived meteorology: reference values and sliding windows."""
+from __future__ import annotations
+
+import pytest
+
+from meteo import DerivedMeteo, SlidingMax, SlidingMean, Tendency, dew_point, feels_like, heat_index, wind_chill
+
+
+def fahrenheit(celsius: float) -> float:
+    return celsius * 9 / 5 + 32
+
+
+def celsius(fahrenheit: float) -> float:
+    return (fahrenheit - 32) * 5 / 9
+
+
+@pytest.mark.parametrize(
+    ("temp", "humidity", "expected"),
+    [
+        (20.0, 50.0, 9.3),
+        (30.0, 70.0, 23.9),
+        (0.0, 100.0, 0.0),
+        (-5.0, 80.0, -7.9),
+    ],
+)
+def test_dew_point(temp: float, humidity: float, expected: float) -> None:
+    assert dew_point(temp, humidity) == pytest.approx(expected, abs=0.05)
+
+
+def test_dew_point_needs_humidity() -> None:
+    assert dew_point(20.0, 0.0) is None
+
+
+# NWS heat index table (°F)
+@pytest.mark.parametrize(
+    ("temp_f", "humidity", "expected_f"),
+    [
+        (80, 40, 80),
+        (84, 90, 98),
+        (90, 70, 106),
+        (96, 65, 121),
+        (100, 40, 109),
+        # below 80 °F the heat index is the air temperature
+        (70, 50, 70),
+    ],
+)
+def test_heat_index(temp_f: float, humidity: float, expected_f: float) -> None:
+    assert fahrenheit(heat_index(celsius(temp_f), humidity)) == pytest.approx(expected_f, abs=1.0)
+
+
+# Environment Canada wind chill table (°C, km/h)
+@pytest.mark.parametrize(
+    ("temp", "kmh", "expected"),
+    [
+        (0, 10, -3),
+        (5, 40, -1),
+        (-10, 20, -18),
+        (-20, 30, -33),
+        (-30, 60, -50),
+        # outside the formula's range: the air temperature
+        (15, 30, 15),
+        (-5, 3, -5),
+    ],
+)
+def test_wind_chill(temp: float, kmh: float, expected: float) -> None:
+    assert wind_chill(temp, kmh / 3.6) == pytest.approx(expected, abs=0.6)
+
+
+def test_feels_like_picks_the_model() -> None:
+    assert feels_like(-10.0, 50.0, 20 / 3.6) == wind_chill(-10.0, 20 / 3.6)
+    assert feels_like(32.0, 70.0, 2.0) == heat_index(32.0, 70.0)
+    assert feels_like(18.0, None, None) == 18.0
+
+
+def test_sliding_windows() -> None:
+    mean = SlidingMean(600)
+    peak = SlidingMax(600)
+    assert mean.add(0, 2.0) == 2.0
+    assert peak.add(0, 9.0) == 9.0
+    assert mean.add(300, 4.0) == 3.0
+    assert peak.add(300, 5.0) == 9.0
+    # the first sample has left the window
+    assert mean.add(601, 6.0) == 5.0
+    assert peak.add(601, 4.0) == 5.0
+
+
+def test_pressure_tendency_needs_a_full_window() -> None:
+    tendency = Tendency(3 * 3600)
+    assert tendency.add(0, 1013.0) is None
+    assert tendency.add(3600, 1012.0) is None
+    assert tendency.add(3 * 3600, 1010.5) == pytest.approx(-2.5)
+    assert tendency.add(4 * 3600, 1011.0) == pytest.approx(-1.0)
+
+
+def test_derived_meteo() -> None:
+    meteo = DerivedMeteo()
+    out = meteo.update(0.0, {"Tout": -10.0, "Hout": 80.0, "Wsp": 20 / 3.6, "Wgs": 8.0, "P": None})
+    assert out["feels_like"] == out["wind_chill"] == pytest.approx(-17.86, abs=0.01)
+    assert out["wind_gust_max_10m"] == 8.0
+    assert "pressure_tendency_3h" not in out
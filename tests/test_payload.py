@@ -0,0 +1,37 @@
+"""Tolerant payload decoding: repairs and salvage."""
+from __future__ import annotations
+
+import pytest
+
+from payload import PayloadError, parse_payload
+
+
+@pytest.mark.parametrize(
+    ("body", "expected", "repaired"),
+    [
+        (b'{"T":215,"H":40}', {"T": 215, "H": 40}, False),
+        # firmware quirks repaired before parsing
+        (b'{"T":nan,"H":40}', {"T": None, "H": 40}, True),
+        (b'{"T":-inf,"P":ovf}', {"T": None, "P": None}, True),
+        (b'{"T":,"H":40,}', {"T": None, "H": 40}, True),
+        (b'{"T":21,5,"H":40}', {"T": 21.5, "H": 40}, True),
+        # salvaged pair by pair
+        (b'{"T":"a,b","H":21,5,}', {"T": "a,b", "H": 21.5}, True),
+        (b'{"T":"21,5","H":40', {"T": "21,5", "H": 40}, True),
+        (b'{"T":1e400,"H":ovf, "X":x}', {"H": None}, True),
+        (b'{"ID":"WD \\"4Pro\\"","T":215 "H":40}', {"ID": 'WD "4Pro"', "H": 40}, True),
+    ],
+)
+def test_parse_payload(body: bytes, expected: dict, repaired: bool) -> None:
+    assert parse_payload(body) == (expected, repaired)
+
+
+def test_out_of_range_number_is_null() -> None:
+    data, _ = parse_payload(b'{"T":1e400,"H":2,}')
+    assert data == {"T": None, "H": 2}
+
+
+@pytest.mark.parametrize("body", [b"", b"garbage", b"[1, 2]", b"{broken"])
+def test_nothing_usable(body: bytes) -> None:
+    with pytest.raises(PayloadError):
+        parse_payload(body)
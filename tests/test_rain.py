@@ -0,0 +1,86 @@
+"""Rain ledger: increments, counter rollover, rolling sums."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from rain import RainLedger
+
+DAY = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+def at(hours: float) -> datetime:
+    return DAY + timedelta(hours=hours)
+
+
+@pytest.mark.parametrize(
+    ("readings", "increments"),
+    [
+        # first reading only sets the baseline
+        ([(20, 5.0), (21, 7.0), (22, 7.0)], [0.0, 2.0, 0.0]),
+        # midnight reset: the new reading is all new rain
+        ([(23, 7.0), (24.1, 0.2), (24.5, 0.6)], [0.0, 0.2, pytest.approx(0.4)]),
+        # reboot during the day
+        ([(10, 3.0), (11, 1.0)], [0.0, 1.0]),
+        # rounding noise below the tolerance is not a reset
+        ([(10, 3.0), (10.5, 2.97)], [0.0, 0.0]),
+        # away over midnight, the counter grew again since its reset
+        ([(23, 7.0), (25.5, 7.5)], [0.0, 7.5]),
+    ],
+)
+def test_increments(readings: list, increments: list) -> None:
+    ledger = RainLedger()
+    assert [ledger.update(at(hour), counter) for hour, counter in readings] == increments
+
+
+def test_rolling_totals() -> None:
+    ledger = RainLedger()
+    ledger.update(at(0), 0.0)
+    ledger.update(at(0.5), 1.0)
+    ledger.update(at(1.5), 3.0)
+    assert ledger.totals() == {"rain_hour": 2.0, "rain_24h": 3.0, "rain_7d": 3.0, "rain_season": 3.0}
+
+    # a day later (the counter has reset) the first hours have left the
+    # 24 h window, not the week
+    ledger.update(at(25.5), 0.0)
+    assert ledger.totals()["rain_24h"] == 0.0
+    assert ledger.totals()["rain_7d"] == 3.0
+    assert ledger.totals()["rain_hour"] == 0.0
+
+    # and after a week everything has
+    ledger.update(at(200), 0.0)
+    assert ledger.totals()["rain_7d"] == 0.0
+    assert ledger.totals()["rain_season"] == 3.0
+
+
+def test_new_season() -> None:
+    ledger = RainLedger()
+    ledger.update(datetime(2024, 12, 31, 22, tzinfo=timezone.utc), 1.0)
+    ledger.update(datetime(2024, 12, 31, 23, tzinfo=timezone.utc), 4.0)
+    assert ledger.totals()["rain_season"] == 3.0
+    ledger.update(datetime(2025, 1, 1, 0, 30, tzinfo=timezone.utc), 0.5)
+    assert ledger.totals()["rain_season"] == 0.5
+
+
+def test_round_trip() -> None:
+    ledger = RainLedger()
+    ledger.update(at(0), 0.0)
+    ledger.update(at(1), 2.5)
+    restored = RainLedger(ledger.as_dict())
+    assert restored.totals() == ledger.totals()
+    assert restored.update(at(1.5), 3.0) == 0.5
+
+
+def test_hours_follow_the_local_clock() -> None:
+    # UTC+05:30: local full hours are half past in UTC
+    india = timezone(timedelta(hours=5, minutes=30))
+    ledger = RainLedger()
+    ledger.update(datetime(2025, 6, 1, 9, 50, tzinfo=india), 0.0)
+    ledger.update(datetime(2025, 6, 1, 10, 10, tzinfo=india), 1.0)
+    # 10:50 local is 05:20 UTC, past the UTC hour but in the same local hour
+    ledger.update(datetime(2025, 6, 1, 10, 50, tzinfo=india), 1.5)
+    assert ledger.totals()["rain_hour"] == 1.5
+    ledger.update(datetime(2025, 6, 1, 11, 5, tzinfo=india), 1.7)
+    assert ledger.totals()["rain_hour"] == 0.2
+    assert ledger.totals()["rain_24h"] == 1.7
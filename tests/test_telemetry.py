@@ -0,0 +1,49 @@
+"""Station telemetry: latency histogram and counters."""
+from __future__ import annotations
+
+import pytest
+
+from telemetry import LatencyHistogram, StationTelemetry
+
+
+@pytest.mark.parametrize(
+    ("latencies", "p50", "p95"),
+    [
+        ([], None, None),
+        ([0.01] * 10, 0.05, 0.05),
+        ([0.01] * 9 + [3.0], 0.05, 5.0),
+        ([0.2, 0.3, 0.4, 0.6], 0.5, 1.0),
+        # above the last bucket: the maximum seen
+        ([12.0, 20.0], 20.0, 20.0),
+    ],
+)
+def test_percentiles(latencies: list[float], p50: float | None, p95: float | None) -> None:
+    histogram = LatencyHistogram()
+    for seconds in latencies:
+        histogram.record(seconds)
+    assert histogram.percentile(50) == p50
+    assert histogram.percentile(95) == p95
+
+
+def test_histogram_labels() -> None:
+    histogram = LatencyHistogram()
+    histogram.record(0.05)
+    histogram.record(11.0)
+    counts = histogram.as_dict()
+    assert counts["le_50ms"] == 1
+    assert counts["inf"] == 1
+    assert sum(counts.values()) == histogram.total == 2
+
+
+def test_failure_counters() -> None:
+    telemetry = StationTelemetry(10.0)
+    telemetry.record_failure(1.0, "timeout")
+    telemetry.record_failure(2.0, "timeout")
+    assert telemetry.consecutive_failures == 2
+    telemetry.record_success(3.0)
+    telemetry.record_fetch(0.12)
+    info = telemetry.as_dict()
+    assert info["consecutive_failures"] == 0
+    assert (info["successes"], info["failures"]) == (1, 2)
+    assert info["last_error"] == "timeout"
+    assert info["fetch_mean"] == 0.12
@@ -0,0 +1,34 @@
+"""Scheduler slot arithmetic: stagger and missed polls."""
+from __future__ import annotations
+
+import pytest
+
+from timing import catch_up, stagger
+
+
+@pytest.mark.parametrize("stations", [2, 3, 5, 8, 13, 20])
+def test_stagger_spreads_stations(stations: int) -> None:
+    phases = sorted(stagger(slot) for slot in range(stations))
+    gaps = [b - a for a, b in zip(phases, phases[1:])] + [1.0 - phases[-1] + phases[0]]
+    assert phases[0] == 0.0
+    assert all(0.0 <= phase < 1.0 for phase in phases)
+    # golden ratio spacing: no gap is less than a third of the even spacing
+    assert min(gaps) > 1.0 / stations / 3
+
+
+@pytest.mark.parametrize(
+    ("due", "now", "interval", "expected"),
+    [
+        # on time or early: nothing skipped
+        (100.0, 90.0, 30.0, (100.0, 0)),
+        (100.0, 100.0, 30.0, (100.0, 0)),
+        # late: the next slot in phase, not a burst of missed polls
+        (100.0, 101.0, 30.0, (130.0, 1)),
+        (100.0, 175.0, 30.0, (190.0, 3)),
+        (100.0, 190.0, 30.0, (220.0, 4)),
+        # intervals below a second are treated as one second
+        (10.0, 12.5, 0.0, (13.0, 3)),
+    ],
+)
+def test_catch_up(due: float, now: float, interval: float, expected: tuple[float, int]) -> None:
+    assert catch_up(due, now, interval) == expected
@@ -0,0 +1,50 @@
+"""Mapping WU / Ecowitt uploads onto 4Pro keys."""
+from __future__ import annotations
+
+import pytest
+
+from upload import map_upload
+
+
+@pytest.mark.parametrize(
+    ("params", "payload"),
+    [
+        ({"tempf": "32"}, {"Tout": 0}),
+        ({"tempf": "50"}, {"Tout": 100}),
+        ({"tempf": "-40"}, {"Tout": -400}),
+        ({"humidity": "55"}, {"Hout": 550}),
+        ({"baromin": "29.92"}, {"P": 10132}),
+        ({"baromrelin": "30"}, {"P": 10159}),
+        ({"windspeedmph": "10", "windgustmph": "22.4"}, {"Wsp": 45, "Wgs": 100}),
+        ({"winddir": "225.4"}, {"Wdir": 225}),
+        ({"dailyrainin": "0.5", "rainratein": "0.04"}, {"Rtd": 127, "Rfr": 10}),
+        ({"solarradiation": "512.6", "uv": "3"}, {"SR": 513, "UV": 3}),
+        ({"AqPM2.5": "12.3", "AqPM10": "20"}, {"PM25": 123, "PM100": 200}),
+        ({"tempinf": "68", "humidityin": "40"}, {"Tin": 200, "Hin": 400}),
+        ({"temp2f": "41", "humidity2": "80"}, {"ES2T": 50, "ES2H": 800}),
+    ],
+)
+def test_fields(params: dict, payload: dict) -> None:
+    assert map_upload(params) == payload
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"PASSKEY": "abc", "stationtype": "GW1000"},
+        {"tempf": "-9999"},
+        {"tempf": "", "humidity": "n/a"},
+    ],
+)
+def test_nothing_known(params: dict) -> None:
+    assert map_upload(params) == {}
+
+
+def test_station_and_time() -> None:
+    payload = map_upload(
+        {"ID": "garden", "PASSWORD": "x", "dateutc": "2025-06-01 12:00:00", "tempf": "50"}
+    )
+    assert payload == {"Tout": 100, "ID": "garden", "ts": 1748779200}
+    # Ecowitt names the model instead; "now" carries no time
+    assert map_upload({"model": "WS2900", "dateutc": "now", "tempf": "50"}) == {"Tout": 100, "ID": "WS2900"}
@@ -0,0 +1,46 @@
+"""High-frequency wind aggregation."""
+from __future__ import annotations
+
+import pytest
+
+from wind import WindAggregator
+
+
+@pytest.mark.parametrize(
+    ("samples", "direction"),
+    [
+        # across north: 0°, not 180°
+        ([(5.0, 350), (5.0, 10)], 0),
+        ([(3.0, 340), (3.0, 30)], 5),
+        # speed weighted: the strong sample wins
+        ([(10.0, 90), (1.0, 270)], 90),
+        # all calm: plain average of the directions
+        ([(0.0, 80), (0.0, 100)], 90),
+        ([(2.0, 180), (2.0, 180), (2.0, 180)], 180),
+    ],
+)
+def test_vector_direction(samples: list[tuple[float, int]], direction: int) -> None:
+    wind = WindAggregator()
+    for speed, wdir in samples:
+        wind.add({"Wsp": speed, "Wdir": wdir})
+    assert wind.aggregate()["Wdir"] == direction
+
+
+def test_speed_and_gust() -> None:
+    wind = WindAggregator()
+    wind.add({"Wsp": 2.0, "Wgs": 4.0, "Wdir": 0})
+    wind.add({"Wsp": 4.0, "Wgs": 9.5, "Wdir": 0})
+    # no gust reading: the speed counts as one
+    wind.add({"Wsp": 6.0, "Wdir": 0})
+    assert wind.samples == 3
+    out = wind.aggregate()
+    assert out["Wsp"] == 4.0
+    assert out["Wgs"] == 9.5
+
+
+def test_aggregate_starts_a_new_interval() -> None:
+    wind = WindAggregator()
+    wind.add({"Wsp": 3.0, "Wgs": 5.0, "Wdir": 45})
+    wind.aggregate()
+    assert wind.samples == 0
+    assert wind.aggregate() == {}